@@ -0,0 +1,132 @@
+import asyncio
+import argparse
+import discord
+from Components.AuditCache import AuditCache
+
+# Run from the bot directory with:
+#   python -m Benchmarks.audit_cache_benchmark
+#   python -m Benchmarks.audit_cache_benchmark --events 100 --gap 0.05 --latency 200
+
+
+class SimulatedEntry:
+    """
+    Class that mimics the parts of discord.AuditLogEntry the cache looks at.
+
+    Attributes
+    ----------
+    target : discord.Object
+        the target of the entry
+    created_at : datetime.datetime
+        when the entry was created
+    """
+
+    def __init__(self, target: int):
+        self.target = discord.Object(target)
+        self.created_at = discord.utils.utcnow()
+
+
+class SimulatedGuild:
+    """
+    Class that mimics a discord.Guild whose audit log takes a fixed amount of time to fetch and counts the fetches.
+
+    Attributes
+    ----------
+    id : int
+        ID of the fake server
+    latency : float
+        seconds each audit log fetch takes
+    calls : int
+        amount of audit log fetches done
+    log : list
+        list of SimulatedEntry newest first
+    """
+
+    def __init__(self, latency: float):
+        self.id = 1
+        self.latency = latency
+        self.calls = 0
+        self.log = []
+
+    async def audit_logs(self, action: discord.AuditLogAction, limit: int):
+        self.calls += 1
+        # snapshot when the request is made, entries written while it's in flight aren't part of the response
+        ret = self.log[:limit]
+        await asyncio.sleep(self.latency)
+        for i in ret:
+            yield i
+
+
+async def sequential(guild: SimulatedGuild, events: int, gap: float, action: discord.AuditLogAction, hit: bool):
+    """
+    Async function that looks up one event every gap seconds, like leaves checked for kicks trickling in.
+
+    Parameters
+    ----------
+    guild : SimulatedGuild
+        the fake server
+    events : int
+        amount of lookups
+    gap : float
+        seconds between each lookup
+    action : discord.AuditLogAction
+        the audit log action looked up
+    hit : bool
+        whether or not each event writes its entry before the lookup, like a ban does
+
+    Returns
+    -------
+    int
+        amount of lookups that found their entry
+    """
+    cache = AuditCache()
+    found = 0
+    for i in range(events):
+        if hit:
+            guild.log.insert(0, SimulatedEntry(i))
+        if await cache.find(guild, action, i, expect=hit):
+            found += 1
+        await asyncio.sleep(gap)
+    return found
+
+
+async def burst(guild: SimulatedGuild, events: int, action: discord.AuditLogAction):
+    """
+    Async function that writes all the entries then looks them all up at once, like a mass ban.
+
+    Returns
+    -------
+    int
+        amount of lookups that found their entry
+    """
+    cache = AuditCache()
+    for i in range(events):
+        guild.log.insert(0, SimulatedEntry(i))
+    ret = await asyncio.gather(*(cache.find(guild, action, i, expect=True) for i in range(events)))
+    return sum(1 for i in ret if i)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit log fetches done by AuditCache for streams of lookups")
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--gap", type=float, default=0.1, help="seconds between sequential lookups")
+    parser.add_argument("--latency", type=float, default=100, help="simulated audit log fetch in milliseconds")
+    parser.add_argument("--slack", type=float, default=AuditCache.slack)
+    args = parser.parse_args()
+    AuditCache.slack = args.slack
+
+    print(f"{args.events} lookups, {args.gap} s apart when sequential, {args.latency} ms per fetch, "
+          f"{args.slack} s slack")
+    print(f"{'scenario':<22}{'found':>8}{'fetches':>10}{'uncached':>10}")
+    scenarios = (
+        ("sequential misses", lambda g: sequential(g, args.events, args.gap, discord.AuditLogAction.kick, False)),
+        ("sequential hits", lambda g: sequential(g, args.events, args.gap, discord.AuditLogAction.ban, True)),
+        ("burst hits", lambda g: burst(g, args.events, discord.AuditLogAction.ban)),
+    )
+    for label, scenario in scenarios:
+        guild = SimulatedGuild(args.latency / 1000)
+        found = asyncio.run(scenario(guild))
+        print(f"{label:<22}{found:>8}{guild.calls:>10}{args.events:>10}")
+
+
+if __name__ == "__main__":
+    main()
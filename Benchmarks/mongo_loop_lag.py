@@ -0,0 +1,136 @@
+import time
+import asyncio
+import argparse
+import statistics
+from pymongo import MongoClient
+from concurrent.futures import ThreadPoolExecutor
+from Components.AsyncMongo import AsyncCollection
+
+# Run from the bot directory with:
+#   python -m Benchmarks.mongo_loop_lag
+#   python -m Benchmarks.mongo_loop_lag --address mongodb://localhost:27017/
+
+
+class SimulatedCollection:
+    """
+    Class that mimics a pymongo Collection where every call blocks for a fixed amount of time, used when no MongoDB
+    server is given.
+
+    Attributes
+    ----------
+    name : str
+        name of the fake collection
+    latency : float
+        seconds each call blocks for
+    """
+
+    def __init__(self, latency: float):
+        self.name = "simulated"
+        self.latency = latency
+
+    def update_one(self, *args, **kwargs):
+        time.sleep(self.latency)
+
+
+async def heartbeat(samples: list, stop: asyncio.Event, interval: float = 0.005):
+    """
+    Async function that keeps sleeping for interval seconds and records how late each wake-up was.
+
+    Parameters
+    ----------
+    samples : list
+        list to append the measured lag in milliseconds to
+    stop : asyncio.Event
+        event that ends the heartbeat
+    interval : float
+        seconds to sleep between each sample
+    """
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append((loop.time() - start - interval) * 1000)
+
+
+async def storm(collection, writes: int, concurrency: int, blocking: bool):
+    """
+    Async function that fires the write storm against the passed in collection.
+
+    Parameters
+    ----------
+    collection
+        either the blocking collection or the AsyncCollection wrapping it
+    writes : int
+        total amount of writes
+    concurrency : int
+        amount of "listeners" writing at the same time
+    blocking : bool
+        whether or not to call the collection directly from the coroutine like the Cogs used to
+    """
+    async def worker(amount: int):
+        for i in range(amount):
+            if blocking:
+                collection.update_one({"_id": i}, {"$inc": {"count": 1}}, upsert=True)
+                await asyncio.sleep(0)
+            else:
+                await collection.update_one({"_id": i}, {"$inc": {"count": 1}}, upsert=True)
+
+    await asyncio.gather(*(worker(writes // concurrency) for _ in range(concurrency)))
+
+
+async def measure(collection, writes: int, concurrency: int, blocking: bool):
+    """
+    Async function that runs a write storm while measuring event loop lag.
+
+    Returns
+    -------
+    float, float, float
+        total seconds, p50 lag and max lag in milliseconds
+    """
+    samples = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(samples, stop))
+    start = time.perf_counter()
+    await storm(collection, writes, concurrency, blocking)
+    total = time.perf_counter() - start
+    stop.set()
+    await beat
+    if not samples:
+        samples = [total * 1000]
+    return total, statistics.median(samples), max(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event loop lag under a simulated MongoDB write storm")
+    parser.add_argument("--address", help="MongoDB address, simulated collection is used if not given")
+    parser.add_argument("--cluster", default="mango-pi-benchmark")
+    parser.add_argument("--latency", type=float, default=2.0, help="simulated round-trip in milliseconds")
+    parser.add_argument("--writes", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.address:
+        database = MongoClient(args.address)[args.cluster]
+        raw = database["loop_lag"]
+    else:
+        database = None
+        raw = SimulatedCollection(args.latency / 1000)
+
+    executor = ThreadPoolExecutor(max_workers=args.workers)
+    wrapped = AsyncCollection(raw, executor)
+
+    print(f"{args.writes} writes, {args.concurrency} concurrent writers, "
+          f"{'MongoDB ' + args.address if args.address else f'simulated {args.latency} ms round-trip'}")
+    print(f"{'mode':<10}{'total s':>10}{'p50 lag ms':>14}{'max lag ms':>14}")
+    for label, target, blocking in (("blocking", raw, True), ("async", wrapped, False)):
+        total, p50, worst = asyncio.run(measure(target, args.writes, args.concurrency, blocking))
+        print(f"{label:<10}{total:>10.3f}{p50:>14.2f}{worst:>14.2f}")
+
+    executor.shutdown()
+    if database is not None:
+        database.drop_collection("loop_lag")
+
+
+if __name__ == "__main__":
+    main()
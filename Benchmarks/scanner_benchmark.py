@@ -0,0 +1,199 @@
+import time
+import random
+import string
+import asyncio
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from Components.Detector import Detector
+from Components.ScanIndex import ScanIndex
+
+# Run from the bot directory with:
+#   python -m Benchmarks.scanner_benchmark
+#   python -m Benchmarks.scanner_benchmark --words 100 1000 5000 --scanners 1 10 --messages 2000
+#   python -m Benchmarks.scanner_benchmark --processes 2 --threshold 1000
+
+# cyrillic and greek look-alikes plus leetspeak, none of them survive NFKD so only the folding table recovers them
+homoglyphs = {"a": "аα4@", "b": "в8", "c": "с", "e": "еε3", "i": "іι1", "k": "κ", "o": "оο0", "p": "рρ", "s": "ѕ5$",
+              "t": "т7", "v": "ν", "x": "хχ", "y": "у"}
+
+
+class FakeAuthor:
+    """
+    Class that stands in for discord.User, Detector only needs the ID of the author.
+
+    Attributes
+    ----------
+    id : int
+        fake user ID
+    """
+
+    def __init__(self, user_id: int):
+        self.id = user_id
+
+
+def make_word(rng: random.Random):
+    """
+    Function that generates a random lowercase word.
+
+    Parameters
+    ----------
+    rng : random.Random
+        the random generator to use
+
+    Returns
+    -------
+    str
+        the generated word
+    """
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+
+
+def make_packages(rng: random.Random, scanners: int, words: int, folding: bool = False):
+    """
+    Function that generates Mongo shaped scanner documents like the ones stored within the "scanner" collection.
+
+    Parameters
+    ----------
+    rng : random.Random
+        the random generator to use
+    scanners : int
+        amount of scanners to generate
+    words : int
+        amount of banned words for each scanner
+    folding : bool
+        whether or not the scanners have look-alike folding on
+
+    Returns
+    -------
+    list
+        list of scanner documents
+    """
+    ret = []
+    for i in range(scanners):
+        ret.append({"guild": 0, "name": f"scanner {i}", "words": list({make_word(rng) for _ in range(words)}),
+                    "delete": True, "warn": True, "active": True, "fold": folding, "channels": [], "users": [],
+                    "roles": []})
+    return ret
+
+
+def make_corpora(rng: random.Random, banned: list, amount: int):
+    """
+    Function that generates the message corpora to replay through the scan path. Around 1 in 20 messages contains a
+    banned word, the spam raid corpus repeats the same few messages over and over.
+
+    Parameters
+    ----------
+    rng : random.Random
+        the random generator to use
+    banned : list
+        list of banned words to sprinkle into the messages
+    amount : int
+        amount of messages for each corpus
+
+    Returns
+    -------
+    dict
+        dictionary of {corpus name: list of messages}
+    """
+    def sentence(length: int):
+        ret = [make_word(rng) for _ in range(length)]
+        if rng.random() < 0.05:
+            ret[rng.randrange(length)] = rng.choice(banned)
+        return ret
+
+    def disguise(word: str):
+        return "".join(rng.choice(homoglyphs[i]) if i in homoglyphs and rng.random() < 0.5 else i for i in word)
+
+    spam = [" ".join(sentence(rng.randint(8, 40))) for _ in range(5)]
+
+    return {
+        "short chat": [" ".join(sentence(rng.randint(2, 12))) for _ in range(amount)],
+        "long paste": [" ".join(sentence(rng.randint(300, 400))) for _ in range(amount // 10)],
+        "homoglyph": [" ".join(disguise(i) for i in sentence(rng.randint(4, 16))) for _ in range(amount)],
+        "spoiler": ["||" + "|| ||".join(sentence(rng.randint(4, 16))) + "||" for _ in range(amount)],
+        "spam raid": [rng.choice(spam) for _ in range(amount)],
+    }
+
+
+async def replay(scan, messages: list, author: FakeAuthor):
+    """
+    Async function that replays the messages through the passed in async scan function.
+
+    Parameters
+    ----------
+    scan
+        async function taking (content, author) to time
+    messages : list
+        list of the messages to replay
+    author : FakeAuthor
+        the author of every message
+
+    Returns
+    -------
+    float, float
+        messages per second and p99 latency in microseconds
+    """
+    latency = []
+    start = time.perf_counter()
+    for i in messages:
+        before = time.perf_counter()
+        await scan(i, author)
+        latency.append(time.perf_counter() - before)
+    total = time.perf_counter() - start
+    latency.sort()
+    return len(messages) / total, latency[min(len(latency) - 1, int(len(latency) * 0.99))] * 1_000_000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Throughput of the Scanner scan path over synthetic corpora")
+    parser.add_argument("--words", type=int, nargs="+", default=[100, 1000, 5000], help="word list sizes")
+    parser.add_argument("--scanners", type=int, nargs="+", default=[1, 10], help="scanner counts")
+    parser.add_argument("--messages", type=int, default=2000, help="messages for each corpus")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="size of the process pool for long messages, same as the bot's scan-processes")
+    parser.add_argument("--threshold", type=int, default=1000,
+                        help="message length above which the pool is used, same as the bot's scan-threshold")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # same pool setup as the Scanner Cog
+    pool = ProcessPoolExecutor(max_workers=args.processes, mp_context=multiprocessing.get_context("spawn")) \
+        if args.processes > 0 else None
+
+    author = FakeAuthor(1)
+    print(f"{'path':<14}{'corpus':<14}{'scanners':>9}{'words':>7}{'msg/s':>12}{'p99 us':>10}")
+    for scanners in args.scanners:
+        for words in args.words:
+            paths = []
+            for folding in (False, True):
+                rng = random.Random(args.seed)
+                detectors = {i["name"]: Detector(i) for i in make_packages(rng, scanners, words, folding)}
+                index = ScanIndex(detectors)
+
+                async def per_detector(content: str, user: FakeAuthor, group: dict = detectors):
+                    return {k: v.scan(content, user) for k, v in group.items()}
+
+                # the exact call the Scanner Cog makes
+                async def production(content: str, user: FakeAuthor, target: ScanIndex = index):
+                    return await target.scan(content, user, pool, args.threshold)
+
+                suffix = " fold" if folding else ""
+                paths += [("detector" + suffix, per_detector), ("index" + suffix, production)]
+
+            # same seed so both sets of scanners and the corpora line up
+            rng = random.Random(args.seed)
+            banned = [k for i in make_packages(rng, scanners, words) for k in i["words"]]
+            corpora = make_corpora(rng, banned, args.messages)
+
+            for corpus, messages in corpora.items():
+                for label, scan in paths:
+                    rate, p99 = await replay(scan, messages, author)
+                    print(f"{label:<14}{corpus:<14}{scanners:>9}{words:>7}{rate:>12.0f}{p99:>10.1f}")
+
+    if pool:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -74,7 +74,7 @@ class BotConfig(commands.Cog):
         """
         self.bot.data.rsa[mode] = not self.bot.data.rsa[mode]
         await message.add_reaction(emoji="🟢" if self.bot.data.rsa[mode] else "🔴")
-        self.bot.data.settings_db_update("rsa")
+        await self.bot.data.settings_db_update("rsa")
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -129,7 +129,7 @@ class BotConfig(commands.Cog):
             new = ctx.author if not ctx.guild else ctx.channel
 
         if not self.bot.data.is_in_console(new):
-            self.bot.data.modify_console(new, [False, False, False])
+            await self.bot.data.modify_console(new, [False, False, False])
         else:
             return await ctx.reply(f"{new.mention} is already within the log report list")
 
@@ -176,7 +176,7 @@ class BotConfig(commands.Cog):
         else:
             if reaction.emoji == '❌':
                 try:
-                    self.bot.data.remove_console(exist)
+                    await self.bot.data.remove_console(exist)
                     await msg.edit(content="Deleted!", embed=None)
                 except ValueError:
                     await msg.edit(content=f"{exist.mention} not found within the log report list", embed=None)
@@ -194,7 +194,7 @@ class BotConfig(commands.Cog):
                     await msg.edit(content="Unknown reaction applied, operation terminated.", embed=None)
                 else:
                     data[update+1] = not data[update+1]
-                    self.bot.data.modify_console(exist, [data[1], data[2], data[3]])
+                    await self.bot.data.modify_console(exist, [data[1], data[2], data[3]])
                     temp = f"🤖 |=> {'🟢' if data[1] else '🔴'} |=> Normal Bot Status Reports\n" \
                            f"💬 |=> {'🟢' if data[2] else '🔴'} |=> Chat Messages\n" \
                            f"⚠ |=> {'🟢' if data[3] else '🔴'} |=> Errors"
@@ -254,7 +254,7 @@ class BotConfig(commands.Cog):
                                    "sensitive")
 
         self.bot.data.status[0] = result
-        self.bot.data.settings_db_update("status")
+        await self.bot.data.settings_db_update("status")
         await self.bot.data.change_to_default_activity()
         await ctx.message.add_reaction(emoji="✅")
 
@@ -270,7 +270,7 @@ class BotConfig(commands.Cog):
             return await ctx.reply("Unknown input, please check activity type and try again")
 
         self.bot.data.status[1] = new
-        self.bot.data.settings_db_update("status")
+        await self.bot.data.settings_db_update("status")
         await self.bot.data.change_to_default_activity()
         await ctx.message.add_reaction(emoji="✅")
 
@@ -281,7 +281,7 @@ class BotConfig(commands.Cog):
         string given, bot activity will be set to none.
         """
         self.bot.data.status[2] = new
-        self.bot.data.settings_db_update("status")
+        await self.bot.data.settings_db_update("status")
         await self.bot.data.change_to_default_activity()
         await ctx.message.add_reaction(emoji="✅")
 
@@ -315,7 +315,7 @@ class BotConfig(commands.Cog):
         Sub-command of rsa command, switches on or off the RSA system base on it's current status.
         """
         self.bot.data.rsa[0] = not self.bot.data.rsa[0]
-        self.bot.data.settings_db_update("rsa")
+        await self.bot.data.settings_db_update("rsa")
         if self.bot.data.rsa[0]:
             self.bot.data.rsa_process.start()
             await ctx.reply("Random Status and Activity now **On**")
@@ -347,7 +347,7 @@ class BotConfig(commands.Cog):
         if self.bot.data.rsa[4] == seconds:
             return await ctx.reply("No changes has been made")
         self.bot.data.rsa[4] = seconds
-        self.bot.data.settings_db_update("rsa")
+        await self.bot.data.settings_db_update("rsa")
         await ctx.message.add_reaction(emoji="✅")
 
     @random_status_activity.command(aliases=["+"])
@@ -355,7 +355,7 @@ class BotConfig(commands.Cog):
         """Sub-command of rsa command, adds new activity into the RSA system."""
         if new in self.bot.data.activities:
             return await ctx.reply("That activity already exist within the RSA system")
-        self.bot.data.add_activity(new)
+        await self.bot.data.add_activity(new)
         await ctx.message.add_reaction(emoji="✅")
 
     @random_status_activity.command(aliases=["-"])
@@ -363,7 +363,7 @@ class BotConfig(commands.Cog):
         """Sub-command of rsa command, remove existing activity from the RSA system."""
         if exist not in self.bot.data.activities:
             return await ctx.reply("That activity can not be found within the RSA system")
-        self.bot.data.remove_activity(exist)
+        await self.bot.data.remove_activity(exist)
         await ctx.message.add_reaction(emoji="✅")
 
     @random_status_activity.command(aliases=["l"])
@@ -67,21 +67,25 @@ class ChatSystem(commands.Cog):
             takes in MangoPi reference
         """
         self.bot = bot
-        self.db = bot.mongo["chats"]
+        self.db = bot.db["chats"]
         self.data = []
-        for i in list(self.db.find({})):
-            self.data.append(i['_id'])
-
-        self.bl_db = bot.mongo["chat_blacklist"]
+        self.bl_db = bot.db["chat_blacklist"]
         self.bl_data = []
-        for i in list(self.bl_db.find()):
-            self.bl_data.append(i['_id'])
-
         self.tasks = {}
         self.cache = {}
         self.cache2 = {}
         self.tasks2 = {}
 
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        for i in await self.db.find({}):
+            self.data.append(i['_id'])
+
+        for i in await self.bl_db.find():
+            self.bl_data.append(i['_id'])
+
     async def cache_message(self, sent: discord.Message, message: discord.Message):
         """
         Async method that caches the bot reference message and the original message into the 2 caches and remove it
@@ -259,7 +263,7 @@ class ChatSystem(commands.Cog):
 
         if data.id not in self.data:
             self.data.append(data.id)
-            self.db.insert_one({"_id": data.id})
+            await self.db.insert_one({"_id": data.id})
             await ctx.message.add_reaction(emoji="👌")
         else:
             await ctx.reply("ID already exist within the chat system")
@@ -273,7 +277,7 @@ class ChatSystem(commands.Cog):
 
         if data in self.data:
             self.data.remove(data)
-            self.db.delete_one({"_id": data})
+            await self.db.delete_one({"_id": data})
             await ctx.message.add_reaction(emoji="👌")
         else:
             await ctx.reply("Can not find the specified ID within the chat system")
@@ -327,11 +331,11 @@ class ChatSystem(commands.Cog):
             target = target.id
 
         if target in self.bl_data:
-            self.bl_db.delete_one({"_id": target})
+            await self.bl_db.delete_one({"_id": target})
             self.bl_data.remove(target)
             await ctx.message.add_reaction(emoji='➖')
         else:
-            self.bl_db.insert_one({"_id": target})
+            await self.bl_db.insert_one({"_id": target})
             self.bl_data.append(target)
             await ctx.message.add_reaction(emoji='➕')
 
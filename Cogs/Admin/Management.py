@@ -69,6 +69,14 @@ class Management(commands.Cog):
                         value="\n".join(loaded) if len(loaded) > 0 else "None", inline=False)
         embed.add_field(name=f"Inactive Cogs [{len(self.bot.unloaded_cogs)}]",
                         value="\n".join(unloaded) if len(unloaded) > 0 else "None", inline=False)
+        if len(self.bot.deferred_cogs) > 0:
+            embed.add_field(name=f"Deferred Cogs [{len(self.bot.deferred_cogs)}]", inline=False,
+                            value="\n".join(f"~ *{i}*" for i in self.bot.deferred_cogs.keys()))
+        if len(self.bot.index_report) > 0:
+            embed.add_field(name="Database Indexes", inline=False, value="\n".join(
+                f"**{k}**: {', '.join(v) if v is not None else '❌ failed to ensure'}"
+                for k, v in self.bot.index_report.items()))
+        embed.add_field(name="Log Batcher", value=self.bot.log_batcher.report(), inline=False)
         await ctx.reply(embed=embed)
 
     @commands.command()
@@ -99,8 +107,9 @@ class Management(commands.Cog):
     @commands.check(is_admin)
     async def load(self, ctx: commands.Context, cog: str):
         """ Bot administrators only command that reloads a specified Cog."""
+        source = self.bot.unloaded_cogs if cog in self.bot.unloaded_cogs else self.bot.deferred_cogs
         try:
-            target = self.bot.unloaded_cogs[cog]
+            target = source[cog]
         except KeyError:
             return await ctx.reply(f"No unloaded Cog with the name: {cog}")
 
@@ -110,7 +119,7 @@ class Management(commands.Cog):
                 title="COG Loaded ↪", colour=0x12CBC4, timestamp=ctx.message.created_at,
                 description=f"[**{cog}**] module has been loaded!")
             await ctx.reply(embed=embed)
-            self.bot.loaded_cogs.update({cog: self.bot.unloaded_cogs.pop(cog)})
+            self.bot.loaded_cogs.update({cog: source.pop(cog)})
         except Exception as ex:
             print(f"Failed to load {cog}:")
             await ctx.reply(f"```py\n{traceback.format_exc()}\n```")
@@ -168,7 +177,7 @@ class Management(commands.Cog):
                 return await ctx.reply("Can not find that user.")
 
         try:
-            ret = self.bot.data.add_staff(target.id)
+            ret = await self.bot.data.add_staff(target.id)
         except RuntimeError:
             return await ctx.reply("Current busy, please try again later.")
 
@@ -183,7 +192,7 @@ class Management(commands.Cog):
         if not isinstance(target, int):
             target = target.id
         try:
-            ret = self.bot.data.remove_staff(target)
+            ret = await self.bot.data.remove_staff(target)
         except RuntimeError:
             return await ctx.reply("Current busy, please try again later.")
         if ret:
@@ -1,8 +1,11 @@
 import discord
 import asyncio
+import functools
 from discord.ext import commands
+from Components.Hydrator import Hydrator
 from Components.DelayedTask import time_converter
-from Components.RemindTimer import RemindTimer, dm_remind
+from Components.RemindTimer import RemindTimer, remind_embed
+from Components.ActionPipeline import catch_up
 from Components.MangoPi import MangoPi
 
 
@@ -44,8 +47,20 @@ class Reminder(commands.Cog):
     db : MongoClient
         mongoDB client pointing to "reminders" collection
     memory : dict
-        dictionary storing all the reminder event
+        dictionary storing the reminder events due within the bot's timer horizon
+    hydrator : Hydrator
+        pages in the reminders from the database as they get close
+    catching_up : set
+        tasks processing the documents that were already overdue upon loading
+    limit : int
+        max amount of reminders a user can have
+    page_size : int
+        amount of reminders listed on each page
     """
+
+    limit = 10
+    page_size = 10
+
     def __init__(self, bot: MangoPi):
         """
         Constructor for Reminder class.
@@ -56,17 +71,52 @@ class Reminder(commands.Cog):
             pass in bot reference for self.bot
         """
         self.bot = bot
-        self.db = bot.mongo["reminders"]
+        self.db = bot.db["reminders"]
         self.memory = {}
-        self.update()
+        self.hydrator = Hydrator(self.db, bot.timer_horizon, self.hydrate)
+        self.catching_up = set()
 
-    def update(self):
+    async def cog_load(self):
         """
-        Method that populates memory from "reminders" collection of mongoDB
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
         """
-        late_reminders = []
+        await self.update()
+
+    async def cog_unload(self):
+        """
+        Async method called by discord.py when the Cog is being removed, stops paging in reminders and cancels the
+        loaded ones so a reload doesn't leave them behind within the scheduler.
+        """
+        self.hydrator.stop()
+        for i in self.catching_up:
+            i.cancel()
+        for i in self.memory.values():
+            for k in i.values():
+                k.cancel()
+
+    async def update(self):
+        """
+        Method that populates memory from "reminders" collection of mongoDB with the reminders due within the bot's
+        timer horizon, the hydrator pages in the rest later on.
+        """
+        for i in self.memory.values():
+            for k in i.values():
+                k.cancel()
         self.memory.clear()
-        data = self.db.find({})
+        await self.hydrator.start()
+
+    async def hydrate(self, data: list):
+        """
+        Async method that turns reminders documents into RemindTimer, the ones already in memory are skipped. Late ones
+        get sent in bulk by late_remind.
+
+        Parameters
+        ----------
+        data : list
+            list of reminders documents
+        """
+        late_reminders = []
+        gone = set()
         for i in data:
             user = self.bot.get_user(i['user_id'])
             if user:
@@ -74,17 +124,49 @@ class Reminder(commands.Cog):
                     self.memory[user.id]
                 except KeyError:
                     self.memory.update({user.id: {}})
+                if i['_id'] in self.memory[user.id]:
+                    continue
                 try:
                     insert = RemindTimer(bot=self.bot, pack=i)
                 except ValueError:
                     late_reminders.append(i)
-                    self.db.delete_one({"_id": i['_id']})
                 else:
                     self.memory[i['user_id']].update({i['_id']: insert})
             else:
-                self.db.delete_many(i['user_id'])
-        for i in late_reminders:
-            asyncio.get_event_loop().create_task(dm_remind(self.bot, i['user_id'], i['details'], True))
+                gone.add(i['user_id'])
+        if gone:
+            await self.db.delete_many({"user_id": {"$in": list(gone)}})
+        if late_reminders:
+            task = asyncio.create_task(catch_up(self.db, late_reminders, "user_id", self.late_remind))
+            self.catching_up.add(task)
+            task.add_done_callback(self.catching_up.discard)
+
+    async def late_remind(self, user: int, data: list):
+        """
+        Async method that sends the overdue reminders of a user together through the bot's action pipeline. The
+        documents are deleted afterwards by catch_up, except for the ones whose message failed to send.
+
+        Parameters
+        ----------
+        user : int
+            ID of the user
+        data : list
+            list of overdue reminders documents of the user
+
+        Returns
+        -------
+        list
+            list of the documents whose message failed to send
+        """
+        target = self.bot.get_user(user)
+        if not target:
+            return []
+        embeds = [remind_embed(i['details'], True) for i in data]
+        # a message holds at most 10 embeds
+        results = await self.bot.actions.run_all(((functools.partial(target.send, embeds=embeds[i:i + 10]),)
+                                                  for i in range(0, len(embeds), 10)), "late reminder")
+        return [k for i, r in enumerate(results) if isinstance(r, Exception) and not isinstance(r, discord.NotFound)
+                for k in data[i * 10:i * 10 + 10]]
 
     async def cog_check(self, ctx: commands.Context):
         """
@@ -115,46 +197,112 @@ class Reminder(commands.Cog):
         except ValueError as e:
             return await ctx.reply(str(e.args[0]))
 
-        try:
-            self.memory[ctx.author.id]
-        except KeyError:
-            self.memory.update({ctx.author.id: {}})
-        data = self.memory[ctx.author.id]
-        if len(data) >= 10:
-            return await ctx.reply("Max 10 reminder~")
-        insert = RemindTimer(self.bot, ctx.message.id, end, remind, ctx.author.id)
-        data.update({ctx.message.id: insert})
-        self.db.insert_one({"_id": ctx.message.id, "user_id": ctx.author.id, "details": remind, "end": end})
+        if await self.db.count_documents({"user_id": ctx.author.id}, limit=self.limit) >= self.limit:
+            return await ctx.reply(f"Max {self.limit} reminder~")
+        data = {"_id": ctx.message.id, "user_id": ctx.author.id, "details": remind, "end": end}
+        # written first so the hydrator's sweep picks it up if it isn't within the loaded range yet
+        await self.db.insert_one(data)
+        if self.hydrator.covers(end):
+            await self.hydrate([data])
         await ctx.message.add_reaction(emoji='👌')
 
-    @commands.group(aliases=['reminders'])
-    async def reminder(self, ctx: commands.Context):
-        """Group command that will list all the reminders if not additional sub-command are received."""
-        if not ctx.invoked_subcommand:
+    async def page(self, user: int, after: int = None):
+        """
+        Async method that returns a page of the user's reminders ordered by due time. Uses the (user_id, end) index so
+        the cost only depends on the page size.
+
+        Parameters
+        ----------
+        user : int
+            ID of the user
+        after : int
+            ID of the last reminder of the previous page, none for the first page
+
+        Returns
+        -------
+        list, bool
+            the reminders documents of the page and whether or not there is a next page
+
+        Raises
+        ------
+        KeyError
+            if the after reminder can not be found
+        """
+        query = {"user_id": user}
+        if after:
+            last = await self.db.find_one({"_id": after, "user_id": user}, {"end": True})
+            if not last:
+                raise KeyError(after)
+            query["$or"] = [{"end": {"$gt": last["end"]}}, {"end": last["end"], "_id": {"$gt": after}}]
+        data = await self.db.find(query, sort=[("end", 1), ("_id", 1)], limit=self.page_size + 1)
+        return data[:self.page_size], len(data) > self.page_size
+
+    def forget(self, user: int, reminders: list):
+        """
+        Method that cancels the loaded timers of the passed in reminders without touching the database.
+
+        Parameters
+        ----------
+        user : int
+            ID of the user
+        reminders : list
+            list of reminder IDs
+        """
+        try:
+            data = self.memory[user]
+        except KeyError:
+            return
+        for i in reminders:
             try:
-                data = self.memory[ctx.author.id]
+                data.pop(i).cancel()
             except KeyError:
-                return await ctx.reply("No reminder in place!")
-            if len(data) == 0:
-                return await ctx.reply("No reminder in place!")
-            counter = 1
-            embed = discord.Embed(
-                title="Upcoming Reminders",
-                colour=0x8c7ae6,
-                timestamp=ctx.message.created_at
-            )
-            for i in data.keys():
-                embed.add_field(inline=False,
-                                name=f"Reminder {counter} - ID: __{i}__",
-                                value=f"{data[i].end.strftime('%B %#d, %Y | `%I:%M %p` UTC')}\n**{data[i].details}**")
-            await ctx.reply(embed=embed)
+                pass
 
-    @reminder.command(aliases=['-'])
-    async def remove(self, ctx: commands.Context, reminder_id: int):
-        """Sub-command of reminder that removes a reminder base on it's ID."""
+    @commands.group(aliases=['reminders'], invoke_without_command=True)
+    async def reminder(self, ctx: commands.Context, after: int = None):
+        """Group command that lists the reminders, pass in the last ID of a page to see the next one."""
         try:
-            data = self.memory[ctx.author.id][reminder_id]
+            # read from the database as memory only holds the ones due soon
+            data, more = await self.page(ctx.author.id, after)
         except KeyError:
             return await ctx.reply("Can not find the reminder")
-        await data.terminate()
+        if len(data) == 0:
+            return await ctx.reply("No reminder in place!")
+        embed = discord.Embed(
+            title="Upcoming Reminders",
+            colour=0x8c7ae6,
+            timestamp=ctx.message.created_at
+        )
+        for i in data:
+            embed.add_field(inline=False,
+                            name=f"Reminder ID: __{i['_id']}__",
+                            value=f"{i['end'].strftime('%B %#d, %Y | `%I:%M %p` UTC')}\n**{i['details']}**")
+        if more:
+            embed.set_footer(text=f"Next page: {ctx.prefix}reminder {data[-1]['_id']}")
+        await ctx.reply(embed=embed)
+
+    @reminder.command(aliases=['-'])
+    async def remove(self, ctx: commands.Context, reminder_ids: commands.Greedy[int]):
+        """Sub-command of reminder that removes reminders base on their ID."""
+        if len(reminder_ids) < 1:
+            return await ctx.reply("Please input the ID of the reminders to remove.")
+        self.forget(ctx.author.id, reminder_ids)
+        result = await self.db.delete_many({"_id": {"$in": reminder_ids}, "user_id": ctx.author.id})
+        if result.deleted_count < 1:
+            return await ctx.reply("Can not find the reminder")
+        if result.deleted_count < len(reminder_ids):
+            return await ctx.reply(f"Removed {result.deleted_count} of {len(reminder_ids)} reminders, "
+                                   f"the rest could not be found")
         await ctx.message.add_reaction(emoji='👌')
+
+    @reminder.command(aliases=['purge'])
+    async def clear(self, ctx: commands.Context):
+        """Sub-command of reminder that removes all of your reminders."""
+        try:
+            self.forget(ctx.author.id, list(self.memory[ctx.author.id].keys()))
+        except KeyError:
+            pass
+        result = await self.db.delete_many({"user_id": ctx.author.id})
+        if result.deleted_count < 1:
+            return await ctx.reply("No reminder in place!")
+        await ctx.reply(f"Removed {result.deleted_count} reminders")
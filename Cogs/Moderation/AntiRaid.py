@@ -56,10 +56,23 @@ class AntiRaid(commands.Cog):
         """
         self.bot = bot
         self.data = {}
-        self.db = bot.mongo["anti-raid"]
-        self.update()
+        self.db = bot.db["anti-raid"]
 
-    def update(self, guild: int = None):
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        await self.update()
+
+    async def cog_unload(self):
+        """
+        Async method called by discord.py when the Cog is being removed, cancels the holding cell releases and the raid
+        mode timeouts.
+        """
+        for i in self.data.values():
+            i.close()
+
+    async def update(self, guild: int = None):
         """
         Method to update data from MongoDB
 
@@ -75,22 +88,24 @@ class AntiRaid(commands.Cog):
         """
         if guild:
             try:
-                self.data.pop(guild)
+                self.data.pop(guild).close()
             except KeyError:
                 pass
-            data = self.db.find_one({"_id": guild})
+            data = await self.db.find_one({"_id": guild})
             if data:
                 self.data.update({guild: RaidFilter(self.bot, data)})
                 return self.data[guild]
         else:
+            for i in self.data.values():
+                i.close()
             self.data.clear()
-            data = self.db.find({})
+            data = await self.db.find({})
             for i in data:
                 try:
                     r = RaidFilter(self.bot, i)
                     self.data[i['_id']] = r
                 except ValueError:
-                    self.db.delete_one({'_id': i['_id']})
+                    await self.db.delete_one({'_id': i['_id']})
 
     async def verify(self, ctx: commands.Context):
         """
@@ -114,18 +129,48 @@ class AntiRaid(commands.Cog):
             return await ctx.reply(f"This server have not setup an anti-raid yet. Do "
                                    f"`{ctx.prefix}ar create <raider role>` to set it up.")
 
-    def database_update(self, data: RaidFilter):
+    async def database_update(self, data: RaidFilter):
         """
-        Method to update the mongoDB data from RaidFilter class data.
+        Async method to update the mongoDB data from RaidFilter class data.
 
         Parameters
         ----------
         data : RaidFilter
             RaidFilter class date to update MongoDB
         """
-        self.db.update_one({"_id": data.guild_id},
-                           {"$set": {"power": data.switch, "interval": data.interval, "amount": data.count,
-                                     "role_id": data.role_id, "timeout": data.timeout}})
+        await self.db.update_one({"_id": data.guild_id},
+                                 {"$set": {"power": data.switch, "interval": data.interval, "amount": data.count,
+                                           "role_id": data.role_id, "timeout": data.timeout}})
+
+    @staticmethod
+    def progress_report(ctx: commands.Context, action: str):
+        """
+        Static method that creates the progress callback for the RaidFilter bulk actions. The first report is replied
+        to the command, the later ones edit that reply.
+
+        Parameters
+        ----------
+        ctx : commands.Context
+            pass in context for reply
+        action : str
+            what is being done to the raiders, e.g. "Banned"
+
+        Returns
+        -------
+        typing.Callable[[int, int], typing.Awaitable]
+            the progress callback
+        """
+        message = None
+
+        async def report(done: int, total: int):
+            nonlocal message
+            content = f"{action} {done} / {total} raiders"
+            if message:
+                await message.edit(content=content)
+            else:
+                message = await ctx.reply(content)
+
+        return report
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -183,7 +228,7 @@ class AntiRaid(commands.Cog):
         """Turn off raid mode and pass in additional argument to whether or not to release all users from raid cell."""
         data = await self.verify(ctx)
         if isinstance(data, RaidFilter):
-            data.raid = False
+            await data.stop_raid(True)
             if not release:
                 await ctx.message.add_reaction(emoji='✔')
             else:
@@ -206,19 +251,23 @@ class AntiRaid(commands.Cog):
         """Ban all users with server's raider role and turn off raid mode as default (can be specified)."""
         data = await self.verify(ctx)
         if isinstance(data, RaidFilter):
-            result = list(await data.ban_all(ctx, stop))
-            await ctx.message.add_reaction(emoji='✅')
+            result, failed = await data.ban_all(ctx, stop, self.progress_report(ctx, "Banned"))
+            await ctx.message.add_reaction(emoji='❌' if failed else '✅')
             for i in range(len(result)):
                 await ctx.reply(
                     embed=discord.Embed(title=f"All Banned Raiders {i + 1}", description=result[i], colour=0xff4757)
                 )
+            for i in range(len(failed)):
+                await ctx.reply(
+                    embed=discord.Embed(title=f"Raiders Failed to Ban {i + 1}", description=failed[i], colour=0xff4757)
+                )
 
     @anti_raid.command()
     async def kick(self, ctx: commands.Context, stop: bool = True):
         """Kick all users with server's raider role and turn off raid mode as default (can be specified)."""
         data = await self.verify(ctx)
         if isinstance(data, RaidFilter):
-            result = list(await data.kick_all(stop))
+            result = list(await data.kick_all(stop, self.progress_report(ctx, "Kicked")))
             await ctx.message.add_reaction(emoji='✅')
             for i in range(len(result)):
                 await ctx.reply(
@@ -228,12 +277,12 @@ class AntiRaid(commands.Cog):
     @anti_raid.command()
     async def create(self, ctx: commands.Context, role: discord.Role):
         """Create an anti-raid system for the server with the specified raider role."""
-        data = self.db.find_one({"_id": ctx.guild.id})
+        data = await self.db.find_one({"_id": ctx.guild.id})
         if data:
             return await ctx.reply("This server already have an anti-raid system, no need to create another one.")
-        self.db.insert_one({"_id": ctx.guild.id, "interval": 5, "amount": 3, "power": True, "role_id": role.id,
-                            "timeout": 60})
-        self.update(ctx.guild.id)
+        await self.db.insert_one({"_id": ctx.guild.id, "interval": 5, "amount": 3, "power": True, "role_id": role.id,
+                                  "timeout": 60})
+        await self.update(ctx.guild.id)
         await ctx.message.add_reaction(emoji='👍')
 
     @anti_raid.command()
@@ -327,6 +376,8 @@ class AntiRaid(commands.Cog):
                     embed=embed.set_footer(text="Menu Paused", icon_url=self.bot.user.avatar.replace(size=64).url))
             elif reaction.emoji == "💡":
                 result = data.toggle()
+                if not result:
+                    await data.stop_raid(True)
                 await msg.edit(embed=None, content="Anti-Raid now enabled" if result else "Anti-Raid now disabled")
             elif reaction.emoji == '📛':
                 await msg.edit(embed=None, content="Enter the role ID of the new raider role.")
@@ -368,4 +419,4 @@ class AntiRaid(commands.Cog):
                         await msg.edit(content=f"member join timer is now set **{m}** seconds")
                 except asyncio.TimeoutError:
                     return await msg.edit(content="Anti-Raid Menu Timed Out.")
-            self.database_update(data)
+            await self.database_update(data)
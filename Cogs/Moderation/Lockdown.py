@@ -56,12 +56,17 @@ class Lockdown(commands.Cog):
             pass in MangoPi reference
         """
         self.bot = bot
-        self.db = bot.mongo["lockdown"]
+        self.db = bot.db["lockdown"]
         self.data = {}
         self.cooldown = []
-        self.update()
 
-    def update(self, specific: int = None):
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        await self.update()
+
+    async def update(self, specific: int = None):
         """
         Method that attempts to update data with roles based on input from MongoDB
 
@@ -70,7 +75,7 @@ class Lockdown(commands.Cog):
         specific: int
             ID of a specific server to update
         """
-        fetch = self.db.find_one({'_id': specific}) if specific else self.db.find({})
+        fetch = await self.db.find({'_id': specific} if specific else {})
         for i in fetch:
             server = self.bot.get_guild(i['_id'])
             if server:
@@ -123,12 +128,12 @@ class Lockdown(commands.Cog):
         if role:
             self.data[ctx.guild.id] = role
             if not data:
-                self.db.insert_one({'_id': ctx.guild.id, 'role': role.id})
+                await self.db.insert_one({'_id': ctx.guild.id, 'role': role.id})
             else:
-                self.db.update_one({'_id': ctx.guild.id},
-                                   {'$set': {'role': role.id}})
+                await self.db.update_one({'_id': ctx.guild.id},
+                                         {'$set': {'role': role.id}})
         else:
-            self.db.delete_one({'_id': ctx.guild.id})
+            await self.db.delete_one({'_id': ctx.guild.id})
             self.data.pop(ctx.guild.id)
         await ctx.message.add_reaction(emoji='👍')
 
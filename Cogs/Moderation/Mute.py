@@ -1,9 +1,13 @@
 import typing
 import discord
 import asyncio
+import datetime
+import functools
 from discord.ext import commands
 from Components.MangoPi import MangoPi
-from Components.MuteTimer import MuteTimer, remove_mute
+from Components.Hydrator import Hydrator
+from Components.MuteTimer import MuteTimer
+from Components.ActionPipeline import catch_up
 from Components.DelayedTask import time_converter, range_calculator
 
 
@@ -42,13 +46,17 @@ class Mute(commands.Cog):
     bot: MangoPi
         bot reference
     timers: dict
-        dictionary containing the MuteTimers for servers
+        dictionary containing the MuteTimers for servers, only the ones due within the bot's timer horizon
     roles: dict
         dictionary containing the mute role for servers
     role_db: MongoClient
         mongo reference to mute_role collection
     mute_db: MongoClient
         mongo reference to mute_time collection
+    hydrator: Hydrator
+        pages in the mute timers from mute_db as they get close
+    catching_up: set
+        tasks processing the documents that were already overdue upon loading
     """
 
     def __init__(self, bot: MangoPi):
@@ -63,11 +71,30 @@ class Mute(commands.Cog):
         self.bot = bot
         self.timers = {}
         self.roles = {}
-        self.role_db = bot.mongo["mute_role"]
-        self.mute_db = bot.mongo["mute_time"]
-        self.update()
+        self.role_db = bot.db["mute_role"]
+        self.mute_db = bot.db["mute_time"]
+        self.hydrator = Hydrator(self.mute_db, bot.timer_horizon, self.hydrate)
+        self.catching_up = set()
 
-    def update_mute_roles(self, guild: int = None):
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        await self.update()
+
+    async def cog_unload(self):
+        """
+        Async method called by discord.py when the Cog is being removed, stops paging in mute timers and cancels the
+        loaded ones so a reload doesn't leave them behind within the scheduler.
+        """
+        self.hydrator.stop()
+        for i in self.catching_up:
+            i.cancel()
+        for i in self.timers.values():
+            for k in i.values():
+                k.cancel()
+
+    async def update_mute_roles(self, guild: int = None):
         """
         Method to update the roles dictionary with data from role_db. This should be executed before update_mute_timers.
 
@@ -81,43 +108,58 @@ class Mute(commands.Cog):
                 self.roles.pop(guild)
             except KeyError:
                 pass
-            data = self.role_db.find({"_id": guild})
+            data = await self.role_db.find({"_id": guild})
         else:
             self.roles.clear()
-            data = self.role_db.find()
+            data = await self.role_db.find()
 
         for i in data:
             server = self.bot.get_guild(i["_id"])
             if not server:
-                self.role_db.delete_one({"_id": i["_id"]})
+                await self.role_db.delete_one({"_id": i["_id"]})
             else:
                 role = server.get_role(i["role_id"])
                 if not role:
-                    self.role_db.delete_one({"_id": i["_id"]})
+                    await self.role_db.delete_one({"_id": i["_id"]})
                 else:
                     self.roles.update({i["_id"]: role})
 
-    def update_mute_timers(self, guild: int = None):
+    async def update_mute_timers(self, guild: int = None):
         """
-        Method to update the timers dictionary with data from mute_db. This should be executed after update_mute_timers.
+        Method to update the timers dictionary with data from mute_db. This should be executed after update_mute_roles.
+        Only the timers due within the bot's timer horizon are loaded, the hydrator pages in the rest later on.
 
         Parameters
         ----------
         guild: int
             the specific server timers to update, if none then update everything
         """
-        late = []
-        fail = []
-
         if guild:
             try:
-                self.timers.pop(guild)
+                for i in self.timers.pop(guild).values():
+                    i.cancel()
             except KeyError:
                 pass
-            data = self.mute_db.find({"guild_id": guild})
+            await self.hydrator.start({"guild_id": guild})
         else:
+            for i in self.timers.values():
+                for k in i.values():
+                    k.cancel()
             self.timers.clear()
-            data = self.mute_db.find()
+            await self.hydrator.start()
+
+    async def hydrate(self, data: list):
+        """
+        Async method that turns mute_db documents into MuteTimer, the ones already in memory are skipped. Late ones get
+        their mute removed in bulk by late_unmute.
+
+        Parameters
+        ----------
+        data: list
+            list of mute_db documents
+        """
+        late = []
+        fail = []
 
         for i in data:
             try:
@@ -130,6 +172,8 @@ class Mute(commands.Cog):
                     self.timers[i["guild_id"]]
                 except KeyError:
                     self.timers.update({i["guild_id"]: {}})
+                if i["user_id"] in self.timers[i["guild_id"]]:
+                    continue
                 try:
                     temp = MuteTimer(self.bot, pack=i)
                 except ValueError:
@@ -138,24 +182,104 @@ class Mute(commands.Cog):
                     self.timers[i["guild_id"]].update({i["user_id"]: temp})
 
         for i in fail:
-            self.bot.mongo["mute_time"].delete_many({"guild_id": i})
-            self.bot.mongo["mute_role"].delete_many({"_id": i})
+            await self.mute_db.delete_many({"guild_id": i})
+            await self.role_db.delete_many({"_id": i})
 
-        for i in late:
-            asyncio.get_event_loop().create_task(remove_mute(self.bot, i["guild_id"], i["user_id"],
-                                                             "Late mute removal due to Cog down time"))
+        if late:
+            task = asyncio.create_task(catch_up(self.mute_db, late, "guild_id", self.late_unmute))
+            self.catching_up.add(task)
+            task.add_done_callback(self.catching_up.discard)
 
-    def update(self, guild: int = None):
+    async def late_unmute(self, guild: int, data: list):
         """
-        Method used to update both timers and roles data. Meant to only be used in the constructor
+        Async method that removes the mute role from the members of the overdue mutes of a server through the bot's
+        action pipeline. The documents are deleted afterwards by catch_up, except for the ones whose removal failed.
+
+        Parameters
+        ----------
+        guild: int
+            ID of the server
+        data: list
+            list of overdue mute_db documents of the server
+
+        Returns
+        -------
+        list
+            list of the documents whose mute role failed to be removed
+        """
+        server = self.bot.get_guild(guild)
+        try:
+            role = self.roles[guild]
+        except KeyError:
+            return []
+        if not server:
+            return []
+
+        calls = []
+        pending = []
+        for i in data:
+            member = server.get_member(i["user_id"])
+            if member and role in member.roles:
+                calls.append((functools.partial(member.remove_roles, role,
+                                                reason="Late mute removal due to Cog down time"),))
+                pending.append(i)
+        results = await self.bot.actions.run_all(calls, "late mute removal")
+        return [i for i, r in zip(pending, results) if isinstance(r, Exception) and not isinstance(r, discord.NotFound)]
+
+    async def update(self, guild: int = None):
+        """
+        Method used to update both timers and roles data. Meant to only be used upon Cog load
 
         Parameters
         ----------
         guild: int
             the specific server data to update, if none then update everything
         """
-        self.update_mute_roles(guild)
-        self.update_mute_timers(guild)
+        await self.update_mute_roles(guild)
+        await self.update_mute_timers(guild)
+
+    async def find_mute(self, guild: int, user: int):
+        """
+        Async method that returns the mute_db document of the user, mutes too far ahead to be in memory included.
+
+        Parameters
+        ----------
+        guild: int
+            ID of the server
+        user: int
+            ID of the user
+
+        Returns
+        -------
+        dict
+            the mute document or None if the user isn't muted
+        """
+        return await self.mute_db.find_one({"guild_id": guild, "user_id": user})
+
+    async def drop_mute(self, guild: int, user: int):
+        """
+        Async method that removes the mute timer of the user whether or not it has been loaded into memory. This does
+        not remove the mute role.
+
+        Parameters
+        ----------
+        guild: int
+            ID of the server
+        user: int
+            ID of the user
+
+        Returns
+        -------
+        bool
+            whether or not the user had a mute timer
+        """
+        try:
+            timer = self.timers[guild][user]
+        except KeyError:
+            result = await self.mute_db.delete_one({"guild_id": guild, "user_id": user})
+            return result.deleted_count > 0
+        await timer.terminate()
+        return True
 
     async def tell(self, ctx: commands.Context, target: discord.Member, reason: str, duration: str,
                    change: bool = False):
@@ -184,8 +308,8 @@ class Mute(commands.Cog):
 
         try:
             destination = self.bot.get_cog("Warn")
-            data = destination.add_warn(ctx.message.created_at, ctx.guild.id, target.id, ctx.author.id, 2, reason,
-                                        duration)
+            data = await destination.add_warn(ctx.message.created_at, ctx.guild.id, target.id, ctx.author.id, 2, reason,
+                                              duration)
         except ValueError:
             data = None
 
@@ -219,13 +343,8 @@ class Mute(commands.Cog):
             except KeyError:
                 return
 
-            try:
-                target = self.timers[after.guild.id][after.id]
-            except KeyError:
-                return
-
-            if role not in after.roles:
-                await target.terminate()
+            if role in before.roles and role not in after.roles:
+                await self.drop_mute(after.guild.id, after.id)
 
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel: typing.Union[discord.TextChannel, discord.VoiceChannel]):
@@ -264,20 +383,20 @@ class Mute(commands.Cog):
             the deleted role
         """
         try:
-            data = self.roles.pop(role.guild.id)
+            data = self.roles[role.guild.id]
         except KeyError:
             return
 
         if data.id == role.id:
             self.roles.pop(role.guild.id)
-            self.role_db.delete_many({"_id": role.guild.id})
-            self.mute_db.delete_manay({"guild_id": role.guild.id})
-            for i in self.timers[role.guild.id]:
-                await i.terminate()
+            await self.role_db.delete_many({"_id": role.guild.id})
+            await self.mute_db.delete_many({"guild_id": role.guild.id})
             try:
-                self.timers.pop(role.guild.id)
+                timers = self.timers.pop(role.guild.id)
             except KeyError:
-                pass
+                return
+            for i in timers.values():
+                await i.terminate()
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User):
@@ -291,12 +410,7 @@ class Mute(commands.Cog):
         user: discord.User
             the user being banned from the server
         """
-        try:
-            result = self.timers[guild.id][user.id]
-        except KeyError:
-            return
-
-        result.terminate()
+        await self.drop_mute(guild.id, user.id)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -310,14 +424,15 @@ class Mute(commands.Cog):
             the new member joining the server
         """
         try:
-            self.timers[member.guild.id][member.id]
+            role = self.roles[member.guild.id]
         except KeyError:
             return
 
         try:
-            role = self.roles[member.guild.id]
+            self.timers[member.guild.id][member.id]
         except KeyError:
-            return
+            if not await self.find_mute(member.guild.id, member.id):
+                return
 
         await member.add_roles(role, reason="Left during a mute, time have not expired yet.")
 
@@ -345,26 +460,21 @@ class Mute(commands.Cog):
         try:
             old = self.roles[ctx.guild.id]
         except KeyError:
-            self.role_db.insert_one({"_id": ctx.guild.id, "role_id": new.id})
+            await self.role_db.insert_one({"_id": ctx.guild.id, "role_id": new.id})
             self.roles.update({ctx.guild.id: new})
         else:
             if old.id == new.id:
                 return await ctx.reply("No changes made")
-            self.bot.mongo["mute_role"].update_one({"guild_id": ctx.guild.id}, {"$set": {"role_id": new.id}})
+            await self.role_db.update_one({"_id": ctx.guild.id}, {"$set": {"role_id": new.id}})
             self.roles[ctx.guild.id] = new
-            try:
-                data = self.timers[ctx.guild.id]
-            except KeyError:
-                pass
-            else:
-                for i in data.keys():
-                    add = ctx.guild.get_member(i)
-                    if add:
-                        try:
-                            await add.add_roles(new, reason="Update mute role - added new role")
-                            await add.remove_roles(old, reason="Updated mute role - remove old role")
-                        except discord.HTTPException:
-                            pass
+            for i in await self.mute_db.find({"guild_id": ctx.guild.id}, {"user_id": True}):
+                add = ctx.guild.get_member(i["user_id"])
+                if add:
+                    try:
+                        await add.add_roles(new, reason="Update mute role - added new role")
+                        await add.remove_roles(old, reason="Updated mute role - remove old role")
+                    except discord.HTTPException:
+                        pass
 
         await ctx.reply(embed=discord.Embed(
             title="Server Mute Role Updated",
@@ -408,15 +518,10 @@ class Mute(commands.Cog):
         except ValueError as e:
             return await ctx.reply(str(e.args[0]))
 
-        try:
-            self.timers[ctx.guild.id]
-        except KeyError:
-            self.timers.update({ctx.guild.id: {}})
-
         try:
             role = self.roles[ctx.guild.id]
             if not role:
-                self.mute_db.delete_many({"guild_id": ctx.guild.id})
+                await self.mute_db.delete_many({"guild_id": ctx.guild.id})
                 self.roles.pop(ctx.guild.id)
                 raise KeyError()
         except KeyError:
@@ -426,16 +531,17 @@ class Mute(commands.Cog):
         has_role = role in target.roles
         time_str = time1.strftime('%B %#d, %Y | %I:%M %p UTC')
 
-        try:
-            data = self.timers[ctx.guild.id][target.id]
-        except KeyError:
+        data = await self.find_mute(ctx.guild.id, target.id)
+        if not data:
             if time.startswith("-") and not has_role:
                 return await ctx.reply("User is not muted, unable to remove duration.")
             if not has_role:
                 await target.add_roles(role, reason=f"Muted until {time_str} for: \n{reason}.")
-            data = MuteTimer(self.bot, ctx.guild.id, target.id, time1, reason)
-            self.timers[ctx.guild.id].update({target.id: data})
-            self.mute_db.insert_one({"guild_id": ctx.guild.id, "user_id": target.id, "end": time1, "reason": reason})
+            data = {"guild_id": ctx.guild.id, "user_id": target.id, "end": time1, "reason": reason}
+            # written first so the hydrator's sweep picks it up if it isn't within the loaded range yet
+            await self.mute_db.insert_one(data)
+            if self.hydrator.covers(time1):
+                await self.hydrate([data])
             await ctx.reply(embed=discord.Embed(
                 title="🔇 Muted",
                 timestamp=ctx.message.created_at,
@@ -444,21 +550,18 @@ class Mute(commands.Cog):
                            .add_field(name="Reason", value=reason, inline=False).set_thumbnail(url=target.avatar.url))
             await self.tell(ctx, target, reason, time_str)
         else:
-            original = data.end
             try:
-                time1 = time_converter(time, original)
+                time1 = time_converter(time, data["end"])
             except ValueError as e:
                 return await ctx.reply(str(e.args[0]))
-            await data.terminate()
-            try:
-                data = MuteTimer(self.bot, ctx.guild.id, target.id, time1, reason)
-            except ValueError:
+            await self.drop_mute(ctx.guild.id, target.id)
+            if time1 <= datetime.datetime.utcnow():
                 await target.remove_roles(role, reason=f"Mute removal after time recalculation")
                 return await ctx.reply("User un-muted after time re-calculation")
-            self.timers[ctx.guild.id].update({target.id: data})
-            self.mute_db.update({"guild_id": ctx.guild.id, "user_id": target.id}, {
-                "$set": {"end": time1, "reason": reason}
-            })
+            data = {"guild_id": ctx.guild.id, "user_id": target.id, "end": time1, "reason": reason}
+            await self.mute_db.insert_one(data)
+            if self.hydrator.covers(time1):
+                await self.hydrate([data])
             await ctx.reply(embed=discord.Embed(
                 title="🔇 Mute Time Changed",
                 timestamp=ctx.message.created_at,
@@ -481,16 +584,12 @@ class Mute(commands.Cog):
         if has_role:
             await target.remove_roles(role, reason=f"Manual mute removal with reason: \n{reason}")
 
-        try:
-            data = self.timers[ctx.guild.id][target.id]
-        except KeyError:
+        if not await self.drop_mute(ctx.guild.id, target.id):
             if has_role:
                 return await ctx.reply("Mute role removed, but user not detected with a mute timer")
             else:
                 return await ctx.reply("User currently don't have a mute role")
-        else:
-            await data.terminate()
-            await ctx.message.add_reaction(emoji='🔇')
+        await ctx.message.add_reaction(emoji='🔇')
 
     @commands.command(aliases=['ml'])
     @commands.guild_only()
@@ -500,14 +599,14 @@ class Mute(commands.Cog):
         if page < 1:
             return await ctx.reply("Page number can not be less than 1")
 
-        try:
-            data = list(self.timers[ctx.guild.id].values())
-            if len(data) == 0:
-                raise KeyError("empty")
-        except KeyError:
+        size = await self.mute_db.count_documents({"guild_id": ctx.guild.id})
+        if size == 0:
             return await ctx.reply("Mute list is empty")
 
-        start, end, total = range_calculator(10, len(data), page)
+        start, end, total = range_calculator(10, size, page)
+        # read from mute_db as timers only holds the ones due soon
+        data = await self.mute_db.find({"guild_id": ctx.guild.id}, sort=[("end", 1)], skip=start,
+                                       limit=end - start) if end > start else []
 
         embed = discord.Embed(
             colour=0x58B19F,
@@ -515,8 +614,8 @@ class Mute(commands.Cog):
         ).set_author(name="Timed Mute List", icon_url=ctx.guild.icon.replace(size=64).url)
         embed.set_footer(text=f"Page {page} / {total}")
 
-        for i in range(start, end):
-            embed.add_field(name=f"User ID: {data[i].member}",
-                            value=f"<@!{data[i].member}>'s Mute Reason:\n{data[i].reason}", inline=False)
+        for i in data:
+            embed.add_field(name=f"User ID: {i['user_id']}",
+                            value=f"<@!{i['user_id']}>'s Mute Reason:\n{i['reason']}", inline=False)
 
         await ctx.reply(embed=embed)
@@ -2,9 +2,12 @@ import typing
 import asyncio
 import discord
 import datetime
+import functools
 from discord.ext import commands
-from Components.DelayedTask import time_converter
+from Components.Hydrator import Hydrator
+from Components.DelayedTask import time_converter, range_calculator
 from Components.TemporaryBan import TemporaryBan, ban_over
+from Components.ActionPipeline import catch_up
 from Components.MangoPi import highest_role_position, MangoPi
 
 
@@ -45,7 +48,11 @@ class Removal(commands.Cog):
     db : MongoClient
         mongoDB client pointing to "reminders" collection
     temp_bans : dict
-        dictionary of all the temporary bans
+        dictionary of the temporary bans due within the bot's timer horizon
+    hydrator : Hydrator
+        pages in the temporary bans from the database as they get close
+    catching_up : set
+        tasks processing the documents that were already overdue upon loading
     """
 
     def __init__(self, bot: MangoPi):
@@ -59,31 +66,118 @@ class Removal(commands.Cog):
         """
         self.bot = bot
         self.temp_bans = {}
-        self.db = bot.mongo["temp_ban"]
-        self.update()
+        self.db = bot.db["temp_ban"]
+        self.hydrator = Hydrator(self.db, bot.timer_horizon, self.hydrate)
+        self.catching_up = set()
 
-    def update(self):
+    async def cog_load(self):
         """
-        Method that will populate the temp_ban dictionary with temporary ban from database. Recommended to call upon
-        loading Cog.
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
         """
-        late_bans = []
+        await self.update()
+
+    async def cog_unload(self):
+        """
+        Async method called by discord.py when the Cog is being removed, stops paging in temporary bans and cancels the
+        loaded ones so a reload doesn't leave them behind within the scheduler.
+        """
+        self.hydrator.stop()
+        for i in self.catching_up:
+            i.cancel()
+        for i in self.temp_bans.values():
+            for k in i.values():
+                k.cancel()
+
+    async def update(self):
+        """
+        Method that will populate the temp_ban dictionary with temporary ban due within the bot's timer horizon from
+        database, the hydrator pages in the rest later on. Recommended to call upon loading Cog.
+        """
+        for i in self.temp_bans.values():
+            for k in i.values():
+                k.cancel()
         self.temp_bans.clear()
-        data = self.db.find()
+        await self.hydrator.start()
+
+    async def hydrate(self, data: list):
+        """
+        Async method that turns temp_ban documents into TemporaryBan, the ones already in memory are skipped. Late ones
+        get unbanned in bulk by late_unban.
+
+        Parameters
+        ----------
+        data : list
+            list of temp_ban documents
+        """
+        late_bans = []
         for i in data:
             try:
                 self.temp_bans[i['guild_id']]
             except KeyError:
                 self.temp_bans.update({i['guild_id']: {}})
+            if i['user_id'] in self.temp_bans[i['guild_id']]:
+                continue
             try:
                 insert = TemporaryBan(bot=self.bot, pack=i)
             except ValueError:
                 late_bans.append(i)
-                self.db.delete_one({"_id": i['_id']})
             else:
                 self.temp_bans[i['guild_id']].update({i['user_id']: insert})
-        for i in late_bans:
-            asyncio.get_event_loop().create_task(ban_over(self.bot, i["guild_id"], i["user_id"], i["reason"], True))
+        if late_bans:
+            task = asyncio.create_task(catch_up(self.db, late_bans, "guild_id", self.late_unban))
+            self.catching_up.add(task)
+            task.add_done_callback(self.catching_up.discard)
+
+    async def late_unban(self, guild: int, data: list):
+        """
+        Async method that lifts the overdue temporary bans of a server through the bot's action pipeline. The documents
+        are deleted afterwards by catch_up, except for the ones whose unban failed.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        data : list
+            list of overdue temp_ban documents of the server
+
+        Returns
+        -------
+        list
+            list of the documents whose unban failed, a user no longer banned counts as done
+        """
+        server = self.bot.get_guild(guild)
+        if not server:
+            return []
+        # unbanning by ID saves fetching each user
+        calls = [(functools.partial(server.unban, discord.Object(id=i["user_id"]),
+                                    reason=f"{i['reason']}\nWarning: Late ban due to Cog downtime"),) for i in data]
+        results = await self.bot.actions.run_all(calls, "late unban")
+        return [i for i, r in zip(data, results) if isinstance(r, Exception) and not isinstance(r, discord.NotFound)]
+
+    async def drop_ban(self, guild: int, user: int):
+        """
+        Async method that removes the temporary ban timer of the user whether or not it has been loaded into memory.
+        This does not unban the user.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        user : int
+            ID of the user
+
+        Returns
+        -------
+        bool
+            whether or not the user had a temporary ban
+        """
+        try:
+            timer = self.temp_bans[guild][user]
+        except KeyError:
+            result = await self.db.delete_one({"guild_id": guild, "user_id": user})
+            return result.deleted_count > 0
+        await timer.terminate()
+        return True
 
     @commands.command()
     @commands.guild_only()
@@ -312,12 +406,7 @@ class Removal(commands.Cog):
         user : discord.User
             the user being unbanned
         """
-        try:
-            data = self.temp_bans[guild.id][user.id]
-        except KeyError:
-            return
-        else:
-            await data.terminate()
+        await self.drop_ban(guild.id, user.id)
 
     @commands.command(aliases=['tban'])
     @commands.guild_only()
@@ -337,11 +426,6 @@ class Removal(commands.Cog):
         except ValueError as e:
             return await ctx.reply(str(e.args[0]))
 
-        try:
-            self.temp_bans[ctx.guild.id]
-        except KeyError:
-            self.temp_bans.update({ctx.guild.id: {}})
-
         if isinstance(target, int):
             try:
                 target = await self.bot.fetch_user(target)
@@ -349,38 +433,33 @@ class Removal(commands.Cog):
                 return await ctx.reply("Can not find that user.")
 
         index = target.id
-        is_new = False
+        data = await self.db.find_one({"guild_id": ctx.guild.id, "user_id": index})
+        is_new = not data
 
-        try:
-            data = self.temp_bans[ctx.guild.id][index]
-        except KeyError:
-            is_new = True
+        if is_new:
             if duration.startswith('-'):
                 return await ctx.reply("User is not temporary banned, unable to remove duration.")
             reason = f"Temporary ban until {time.strftime('%B %#d, %Y | `%I:%M %p` UTC')} for:\n **{reason}**"
-            data = TemporaryBan(self.bot, ctx.message.id, ctx.guild.id, index, time, reason)
-            self.temp_bans[ctx.guild.id].update({index: data})
-            time = data.end
         else:
             try:
-                time = time_converter(duration, data.end)
+                time = time_converter(duration, data["end"])
             except ValueError as e:
                 return await ctx.reply(str(e.args[0]))
-            await data.terminate()
+            await self.drop_ban(ctx.guild.id, index)
             reason = f"Temporary ban until {time.strftime('%B %#d, %Y | `%I:%M %p` UTC')} for:\n **{reason}**"
-            try:
-                new = TemporaryBan(self.bot, ctx.message.id, ctx.guild.id, index, time, reason)
-            except ValueError:
+            if time <= datetime.datetime.utcnow():
                 await ban_over(self.bot, ctx.guild.id, index, f"{reason}\nUnbanned after time re-calculation")
                 return await ctx.reply("User unbanned after time re-calculation")
-            self.temp_bans[ctx.guild.id].update({index: new})
 
         try:
             await ctx.guild.fetch_ban(target)
         except discord.NotFound:
             await ctx.guild.ban(target, reason=reason)
-        self.db.insert_one({"_id": ctx.message.id, "guild_id": ctx.guild.id, "user_id": index, "end": time,
-                            "reason": reason})
+        data = {"_id": ctx.message.id, "guild_id": ctx.guild.id, "user_id": index, "end": time, "reason": reason}
+        # written first so the hydrator's sweep picks it up if it isn't within the loaded range yet
+        await self.db.insert_one(data)
+        if self.hydrator.covers(time):
+            await self.hydrate([data])
 
         if is_new:
             title = "New Temporary Ban Timer"
@@ -418,17 +497,14 @@ class Removal(commands.Cog):
         """Return a list of temporarily banned users (that is under bot's system)"""
         if page <= 0:
             return await ctx.reply("Page number can't be less than 1")
-        try:
-            data = list(self.temp_bans[ctx.guild.id].values())
-            if len(data) == 0:
-                raise KeyError("empty")
-        except KeyError:
+        size = await self.db.count_documents({"guild_id": ctx.guild.id})
+        if size == 0:
             return await ctx.reply("No temporary bans that I am aware of.")
 
-        limit = 5
-        total_page = (len(data) // limit) + 1
-        start = 0 if page == 1 else (limit * (page - 1))
-        end = len(data) if start + limit >= len(data) else start + limit
+        start, end, total_page = range_calculator(5, size, page)
+        # read from the database as temp_bans only holds the ones due soon
+        data = await self.db.find({"guild_id": ctx.guild.id}, sort=[("end", 1)], skip=start,
+                                  limit=end - start) if end > start else []
 
         embed = discord.Embed(
             colour=0xa29bfe,
@@ -436,9 +512,9 @@ class Removal(commands.Cog):
         ).set_author(name="Temporary Ban List", icon_url=ctx.guild.icon.replace(size=128).url)
         embed.set_footer(text=f"Page {page} / {total_page}")
 
-        for i in range(start, end):
-            embed.add_field(name=f"User ID: {data[i].user_id}",
-                            value=f"__<@!{data[i].user_id}>__\n{data[i].reason}", inline=False)
+        for i in data:
+            embed.add_field(name=f"User ID: {i['user_id']}",
+                            value=f"__<@!{i['user_id']}>__\n{i['reason']}", inline=False)
 
         await ctx.reply(embed=embed)
 
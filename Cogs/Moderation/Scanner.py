@@ -2,9 +2,13 @@ import typing
 import discord
 import asyncio
 import datetime
+import multiprocessing
 from discord.ext import commands
+from concurrent.futures import ProcessPoolExecutor
 from Components.MangoPi import MangoPi
 from Components.Detector import Detector
+from Components.ScanIndex import ScanIndex
+from Components.TaskTools import fan_out
 from Components.DelayedTask import range_calculator
 
 
@@ -44,6 +48,10 @@ class Scanner(commands.Cog):
         bot reference
     data: dict
         dictionary containing all the Detector classes
+    index: dict
+        dictionary of ScanIndex by server ID, built on demand and dropped whenever that server's word lists change
+    pool: ProcessPoolExecutor
+        process pool for tokenizing long messages, None if the bot isn't configured to use one
     s_db: MongoClient
         mongo collection "scanner" reference
     verify: list
@@ -67,16 +75,36 @@ class Scanner(commands.Cog):
         """
         self.bot = bot
         self.data = {}
+        self.index = {}
+        self.pool = None
         self.names = {}
-        self.s_db = bot.mongo["scanner"]
-        self.n_db = bot.mongo["name_change"]
+        self.s_db = bot.db["scanner"]
+        self.n_db = bot.db["name_change"]
         self.verify = ["✅", "❌"]
-        self.options = ['💡', '🗑', '👮', '💥', '⏸']
+        self.options = ['💡', '🗑', '👮', '🔣', '💥', '⏸']
         self.ports = ['📝', '👥', '💬', '📛', '🚫']
         self.default = "Mango 🥭"
-        self.update()
 
-    def update(self, guild: int = None):
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB and start
+        the process pool if the bot is configured to use one.
+        """
+        if self.bot.scan_processes > 0:
+            # spawn instead of fork, forking while pymongo's threads hold their locks can deadlock the children
+            self.pool = ProcessPoolExecutor(max_workers=self.bot.scan_processes,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        await self.update()
+
+    async def cog_unload(self):
+        """
+        Async method called by discord.py when the Cog is being removed, used to shut down the process pool.
+        """
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def update(self, guild: int = None):
         """
         Method to populate or update data base on data from mongoDB
 
@@ -85,33 +113,134 @@ class Scanner(commands.Cog):
         guild: int
             the specific server to update, if not then update everything
         """
+        # pending setting toggles need to land before reading them back
+        await self.bot.writes.flush(self.s_db.name)
         if not guild:
-            self.data.clear()
-            self.names.clear()
-            data = self.s_db.find({})
-            names = self.n_db.find({})
-            for i in names:
-                self.names.update({i["_id"]: i["name"]})
+            data = await self.s_db.find({})
+            names = await self.n_db.find({})
         else:
+            data = await self.s_db.find({"guild": guild})
+            name = await self.n_db.find_one({"_id": guild})
+
+        # build the new Detector aside and swap them in once MongoDB answered, so scans running meanwhile still use the
+        # old ones instead of caching an empty ScanIndex
+        fresh = {}
+        for i in data:
             try:
-                self.data[guild].clear()
+                fresh[i["guild"]].update({i["name"]: Detector(i)})
             except KeyError:
-                self.data.update({guild: {}})
-                
-            data = self.s_db.find({"guild": guild})
-            name = self.n_db.find_one({"_id": guild})
-
-            if name:
-                try:
-                    self.names[guild] = name["name"]
-                except KeyError:
-                    self.names.update({guild: name["name"]})
+                fresh.update({i["guild"]: {i["name"]: Detector(i)}})
 
-        for i in data:
+        if not guild:
+            self.data = fresh
+            self.names = {i["_id"]: i["name"] for i in names}
+            self.index.clear()
+        else:
             try:
-                self.data[i["guild"]].update({i["name"]: Detector(i)})
+                self.data[guild] = fresh[guild]
             except KeyError:
-                self.data.update({i["guild"]: {i["name"]: Detector(i)}})
+                self.data[guild] = {}
+            if name:
+                self.names[guild] = name["name"]
+            self.invalidate(guild)
+
+    def get_index(self, guild: int):
+        """
+        Method that returns the ScanIndex of the specified server, building it if needed.
+
+        Parameters
+        ----------
+        guild: int
+            server ID
+
+        Returns
+        -------
+        ScanIndex
+            the server's ScanIndex
+
+        Raises
+        ------
+        KeyError
+            if the server has no scanner
+        """
+        try:
+            return self.index[guild]
+        except KeyError:
+            ret = ScanIndex(self.data[guild])
+            self.index[guild] = ret
+            return ret
+
+    def invalidate(self, guild: int):
+        """
+        Method that drops the ScanIndex of the specified server, called whenever a word list of that server changes.
+
+        Parameters
+        ----------
+        guild: int
+            server ID
+        """
+        try:
+            self.index.pop(guild)
+        except KeyError:
+            pass
+
+    def trigger_channels(self, guild: discord.Guild):
+        """
+        Method that returns the log channels of the server that want scanner trigger reports.
+
+        Parameters
+        ----------
+        guild: discord.Guild
+            the server
+
+        Returns
+        -------
+        list
+            list of discord.TextChannel
+        """
+        try:
+            return self.bot.get_cog("Logging").route(guild.id, "trigger")
+        except AttributeError:
+            return []
+
+    @staticmethod
+    def result_string(result: dict):
+        """
+        Static method that turns the scan result into the "Problematic Words" string of the report embed.
+
+        Parameters
+        ----------
+        result: dict
+            dictionary of {scanner name: list of matching words}
+
+        Returns
+        -------
+        str
+            the formatted string
+        """
+        ret = ""
+        for k, v in result.items():
+            temp = ', '.join(v)
+            ret += f"**__{k}__**:\n{temp}\n\n"
+        return ret
+
+    @staticmethod
+    async def auto_warn(warn_cog: commands.Cog, *args):
+        """
+        Static async method that adds an automatic warn through the Warn Cog, ignoring the ValueError add_warn may
+        raise so it doesn't get reported by fan_out.
+
+        Parameters
+        ----------
+        warn_cog: commands.Cog
+            the Warn Cog
+        args
+            arguments for add_warn
+        """
+        try:
+            await warn_cog.add_warn(*args)
+        except ValueError:
+            pass
 
     def find(self, guild: int, name: str):
         """
@@ -159,37 +288,37 @@ class Scanner(commands.Cog):
         scan_nick = isinstance(after, discord.Member) and not special
         if scan_nick:
             try:
-                async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.member_update):
-                    if entry.user.id == self.bot.user.id:
-                        return True
-                    if entry.user.id != entry.target.id and after.id == entry.target.id:
-                        return False
+                entry = await self.bot.audit.find(guild, discord.AuditLogAction.member_update, after.id, 10)
             except discord.errors.Forbidden:
                 return False
+            if entry:
+                if entry.user.id == self.bot.user.id:
+                    return True
+                if entry.user.id != entry.target.id:
+                    return False
         else:
             after = guild.get_member(after.id) if isinstance(after, discord.User) else after
             if not after:
                 return False
 
         try:
-            data = self.data[guild.id]
+            index = self.get_index(guild.id)
         except KeyError:
             return False
 
-        result = {}
         rename = False
         warn = []
         now = datetime.datetime.utcnow()
 
-        for k, v in data.items():
-            temp = v.scan(after.nick if scan_nick and not new_member else after.name, after)
-            if temp:
-                result[k] = temp
-                rename = v.delete or rename
-                if v.warn:
-                    for i in temp:
-                        if i not in warn:
-                            warn.append(i)
+        result = await index.scan(after.nick if scan_nick and not new_member else after.name, after, self.pool,
+                                  self.bot.scan_threshold)
+        for k, v in result.items():
+            detector = index.get(k)
+            rename = detector.delete or rename
+            if detector.warn:
+                for i in v:
+                    if i not in warn:
+                        warn.append(i)
 
         if len(result) < 1:
             return False
@@ -230,19 +359,12 @@ class Scanner(commands.Cog):
             else:
                 reason = f"Username contained banned words: {reason}"
             try:
-                self.bot.get_cog("Warn").add_warn(now, guild.id, after.id,
-                                                  self.bot.user.id, 1, reason)
+                await self.bot.get_cog("Warn").add_warn(now, guild.id, after.id,
+                                                        self.bot.user.id, 1, reason)
             except ValueError:
                 pass
 
-        string = ""
-        for k, v in result.items():
-            temp = ', '.join(v)
-            string += f"**__{k}__**:\n{temp}\n\n"
-        try:
-            channels = self.bot.get_cog("Logging").memory[guild.id]
-        except (KeyError, ValueError):
-            channels = []
+        string = self.result_string(result)
         if new_member:
             embed = discord.Embed(
                 colour=0xF79F1F,
@@ -267,11 +389,8 @@ class Scanner(commands.Cog):
             )
             embed.set_author(icon_url=after.avatar.replace(size=64).url, name="🚨 Bad Username!")
         embed.add_field(inline=False, name="Problematic Words", value=string)
-        for i in channels:
-            if i.data['trigger']:
-                channel = self.bot.get_channel(i.channel)
-                if channel:
-                    await channel.send(embed=embed)
+        await fan_out(*(self.bot.log_batcher.send(i, embed) for i in self.trigger_channels(guild)),
+                      label="Scanner log report")
 
         return True
 
@@ -290,7 +409,8 @@ class Scanner(commands.Cog):
                             value="Create a new scanner menu.")
             embed.add_field(inline=False, name=f"{pre}s s <scanner name>",
                             value="Open up the setting menu with option to turn on or off the mentioned scanner, "
-                                  "delete scanner, toggle auto delete, or toggle auto-warn.")
+                                  "delete scanner, toggle auto delete, toggle auto-warn, or toggle look-alike "
+                                  "and leetspeak folding.")
             embed.add_field(inline=False, name=f"{pre}s + <scanner name> <word/phrase>",
                             value="Add the word/phrase into that specified scanner.")
             embed.add_field(inline=False, name=f"{pre}s - <scanner name> <existing word/phrase>",
@@ -327,9 +447,10 @@ class Scanner(commands.Cog):
         if data:
             return await ctx.reply("Scanner with the same name already exist")
         else:
-            self.s_db.insert_one({"guild": ctx.guild.id, "name": name, "delete": True, "warn": False, "active": False,
-                                  "words": [], "channels": [], "users": [], "roles": []})
-            self.update(ctx.guild.id)
+            await self.s_db.insert_one({"guild": ctx.guild.id, "name": name, "delete": True, "warn": False,
+                                        "active": False, "fold": False, "words": [], "channels": [], "users": [],
+                                        "roles": []})
+            await self.update(ctx.guild.id)
             await ctx.message.add_reaction(emoji="👍")
 
     @scanner.command(aliases=["s"])
@@ -346,13 +467,15 @@ class Scanner(commands.Cog):
         )
         embed.add_field(name="Auto Delete/Change", value=data.delete)
         embed.add_field(name="Auto Warn", value=data.warn)
+        embed.add_field(name="Look-alike Folding", value=data.folding)
         embed.add_field(name="Word Count", value=f"{len(data.words)}", inline=False)
         embed.add_field(name="Ignored User Count", value=f"{len(data.users)}", inline=False)
         embed.add_field(name="Ignored Roles Count", value=f"{len(data.roles)}", inline=False)
         embed.add_field(name="Ignored Channel Count", value=f"{len(data.channels)}", inline=False)
         embed.add_field(name="Options", inline=False,
                         value="💡 - Toggle on/off scanner\n🗑 - Toggle on/off auto-delete\n"
-                              "👮 - Toggle on/off auto warn\n💥 - Delete the scanner\n⏸ - Freeze the setting menu")
+                              "👮 - Toggle on/off auto warn\n🔣 - Toggle on/off look-alike and leetspeak folding\n"
+                              "💥 - Delete the scanner\n⏸ - Freeze the setting menu")
         message = await ctx.reply(embed=embed)
         for i in self.options:
             await message.add_reaction(emoji=i)
@@ -370,20 +493,30 @@ class Scanner(commands.Cog):
 
         if reaction.emoji == '💡':
             data.active = not data.active
-            self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"active": data.active}})
+            await self.bot.writes.queue(self.s_db.name, {"guild": ctx.guild.id, "name": name},
+                                        {"$set": {"active": data.active}})
             await message.edit(embed=None,
                                content=f"word list `{name}` is now " + ("active" if data.active else "inactive"))
         elif reaction.emoji == '🗑':
             data.delete = not data.delete
-            self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"delete": data.delete}})
+            await self.bot.writes.queue(self.s_db.name, {"guild": ctx.guild.id, "name": name},
+                                        {"$set": {"delete": data.delete}})
             await message.edit(embed=None,
                                content=f"auto deletion for `{name}` is now " + ("on" if data.delete else "off"))
         elif reaction.emoji == '👮':
             data.warn = not data.warn
-            self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"warn": data.warn}})
+            await self.bot.writes.queue(self.s_db.name, {"guild": ctx.guild.id, "name": name},
+                                        {"$set": {"warn": data.warn}})
             await message.edit(embed=None, content=f"auto warn for `{name}` is now " + ("on" if data.delete else "off"))
+        elif reaction.emoji == '🔣':
+            data.set_folding(not data.folding)
+            self.invalidate(ctx.guild.id)
+            await self.bot.writes.queue(self.s_db.name, {"guild": ctx.guild.id, "name": name},
+                                        {"$set": {"fold": data.folding}})
+            await message.edit(embed=None, content=f"look-alike folding for `{name}` is now " +
+                                                   ("on" if data.folding else "off"))
         elif reaction.emoji == '⏸':
-            embed.remove_field(6)
+            embed.remove_field(7)
             embed.set_footer(text="Setting menu paused", icon_url=self.bot.user.avatar.replace(size=64).url)
             await message.clear_reactions()
             return await message.edit(embed=embed)
@@ -407,9 +540,9 @@ class Scanner(commands.Cog):
                     await message.clear_reactions()
                     return await message.edit(content="Action cancelled")
                 else:
-                    self.s_db.delete_one({"guild": ctx.guild.id, "name": name})
+                    await self.s_db.delete_one({"guild": ctx.guild.id, "name": name})
                     await message.edit(content=f"Scanner `{name}` deleted")
-            self.update(ctx.guild.id)
+            await self.update(ctx.guild.id)
 
         await message.clear_reactions()
 
@@ -424,9 +557,9 @@ class Scanner(commands.Cog):
         if word in data:
             return await ctx.reply(f"**{word}** is already inside the Scanner")
 
-        data.words.append(word)
-        data.words.sort()
-        self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$push": {"words": word}})
+        data.add_word(word)
+        self.invalidate(ctx.guild.id)
+        await self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$push": {"words": word}})
         await ctx.reply(f"**{word}** has been added into scanner `{name}`")
 
     @scanner.command(aliases=["-"])
@@ -440,8 +573,9 @@ class Scanner(commands.Cog):
         if word not in data:
             return await ctx.reply(f"**{word}** can not be found in the `{name}` Scanner")
 
-        data.words.remove(word)
-        self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$pull": {"words": word}})
+        data.remove_word(word)
+        self.invalidate(ctx.guild.id)
+        await self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$pull": {"words": word}})
         await ctx.reply(f"**{word}** has been removed from `{name}`")
 
     @scanner.command(aliases=["++"])
@@ -458,16 +592,14 @@ class Scanner(commands.Cog):
         fail = []
 
         for i in words:
-            if i in data:
-                fail.append(i)
-            else:
-                data.words.append(i)
+            if data.add_word(i):
                 success.append(i)
-
-        data.words.sort()
+            else:
+                fail.append(i)
 
         if len(success) > 0:
-            self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"words": data.words}})
+            self.invalidate(ctx.guild.id)
+            await self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"words": data.words}})
 
         reply = discord.Embed(
             title="Scanner multi-add result",
@@ -499,14 +631,14 @@ class Scanner(commands.Cog):
         fail = []
 
         for i in words:
-            if i in data:
-                data.words.remove(i)
+            if data.remove_word(i):
                 success.append(i)
             else:
                 fail.append(i)
 
         if len(success) > 0:
-            self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"words": data.words}})
+            self.invalidate(ctx.guild.id)
+            await self.s_db.update_one({"guild": ctx.guild.id, "name": name}, {"$set": {"words": data.words}})
 
         reply = discord.Embed(
             title="Scanner multi-remove result",
@@ -639,8 +771,8 @@ class Scanner(commands.Cog):
             embed.add_field(inline=False, name="Failed to add the following undefined ID", value="\n".join(error))
 
         if update:
-            self.s_db.update_one({"guild": ctx.guild.id, "name": name},
-                                 {"$set": {"roles": data.roles, "channels": data.channels, "users": data.users}})
+            await self.s_db.update_one({"guild": ctx.guild.id, "name": name},
+                                       {"$set": {"roles": data.roles, "channels": data.channels, "users": data.users}})
         await ctx.reply(embed=embed)
 
     @scanner.command(aliases=["il"])
@@ -778,10 +910,14 @@ class Scanner(commands.Cog):
             else:
                 fail += 1
 
+        if mode == "Word List":
+            modify.rebuild()
+            self.invalidate(ctx.guild.id)
+
         if success != 0:
-            self.s_db.update_one({"guild": ctx.guild.id, "name": target},
-                                 {"$set": {"users": modify.users, "channels": modify.channels, "roles": modify.roles,
-                                           "words": modify.words}})
+            await self.s_db.update_one({"guild": ctx.guild.id, "name": target},
+                                       {"$set": {"users": modify.users, "channels": modify.channels,
+                                                 "roles": modify.roles, "words": modify.words}})
 
         embed = discord.Embed(
             colour=0x16a085,
@@ -817,10 +953,14 @@ class Scanner(commands.Cog):
             else:
                 fail += 1
 
+        if mode == "Word List":
+            modify.rebuild()
+            self.invalidate(ctx.guild.id)
+
         if success != 0:
-            self.s_db.update_one({"guild": ctx.guild.id, "name": target},
-                                 {"$set": {"users": modify.users, "channels": modify.channels, "roles": modify.roles,
-                                           "words": modify.words}})
+            await self.s_db.update_one({"guild": ctx.guild.id, "name": target},
+                                       {"$set": {"users": modify.users, "channels": modify.channels,
+                                                 "roles": modify.roles, "words": modify.words}})
 
         embed = discord.Embed(
             colour=0xa29bfe,
@@ -846,13 +986,13 @@ class Scanner(commands.Cog):
         except KeyError:
             if nickname == self.default:
                 return await ctx.reply("Nothing has changed")
-            self.n_db.insert_one({"_id": ctx.guild.id, "name": nickname})
+            await self.n_db.insert_one({"_id": ctx.guild.id, "name": nickname})
             self.names.update({ctx.guild.id: nickname})
         else:
             if data == nickname:
                 return await ctx.reply("Nothing has changed")
             data = nickname
-            self.n_db.update({"_id": ctx.guild.id}, {"$set": {"name": data}})
+            await self.n_db.update_one({"_id": ctx.guild.id}, {"$set": {"name": data}})
         await ctx.message.add_reaction(emoji="👍")
 
     @commands.Cog.listener()
@@ -870,53 +1010,30 @@ class Scanner(commands.Cog):
             return
 
         try:
-            data = self.data[message.guild.id]
+            index = self.get_index(message.guild.id)
         except KeyError:
             return
 
-        result = {}
         delete = False
         warn = []
 
-        for k, v in data.items():
-            temp = v.scan(message, message.author)
-            if temp:
-                result[k] = temp
-                delete = v.delete or delete
-                if v.warn:
-                    for i in temp:
-                        if i not in warn:
-                            warn.append(i)
+        result = await index.scan(message, message.author, self.pool, self.bot.scan_threshold)
+        for k, v in result.items():
+            detector = index.get(k)
+            delete = detector.delete or delete
+            if detector.warn:
+                for i in v:
+                    if i not in warn:
+                        warn.append(i)
 
         if len(result) < 1:
             return
 
-        try:
-            location = self.bot.get_cog("Logging").memory[message.guild.id]
-        except (ValueError, KeyError):
-            location = []
-
         time = message.created_at
-        mention = message.author.mention
-
-        if delete:
-            await message.delete()
-            if len(warn) > 0:
-                jump = await message.channel.send(f"Watch your language {message.author.mention}")
-                jump = jump.jump_url
-            else:
-                jump = message.jump_url
-        else:
-            jump = message.jump_url
-
-        if len(warn) > 0:
-            reason = ', '.join(warn)
-            try:
-                self.bot.get_cog("Warn").add_warn(time, message.guild.id, message.author.id,
-                                                  self.bot.user.id, 1, f"Used banned words: {reason}")
-            except ValueError:
-                pass
+        warn_cog = self.bot.get_cog("Warn")
+        reason = ', '.join(warn)
 
+        async def direct_message():
             try:
                 await message.author.send("⚠ Auto warn ⚠", embed=discord.Embed(
                     timestamp=message.created_at,
@@ -928,7 +1045,11 @@ class Scanner(commands.Cog):
             except discord.HTTPException:
                 pass
 
-        if len(result) > 0:
+        async def report():
+            jump = message.jump_url
+            if delete and len(warn) > 0:
+                jump = (await message.channel.send(f"Watch your language {message.author.mention}")).jump_url
+
             embed = discord.Embed(
                 colour=0xe74c3c,
                 timestamp=time,
@@ -937,20 +1058,23 @@ class Scanner(commands.Cog):
             ).set_footer(icon_url=message.author.avatar.replace(size=64).url, text=f"User ID: {message.author.id}")
             embed.add_field(name="Time", value=message.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
             embed.add_field(name="Message Location", value=f"[Jump]({jump})")
-            embed.add_field(name="Mention", value=mention)
-            string = ""
-            for k, v in result.items():
-                temp = ', '.join(v)
-                string += f"**__{k}__**:\n{temp}\n\n"
-            embed.add_field(inline=False, name="Problematic Words", value=string)
+            embed.add_field(name="Mention", value=message.author.mention)
+            embed.add_field(inline=False, name="Problematic Words", value=self.result_string(result))
             if delete:
                 embed.set_author(icon_url=message.guild.icon.replace(size=128).url, name="Automatic message deletion")
 
-            for i in location:
-                if i.data['trigger']:
-                    channel = message.guild.get_channel(i.channel)
-                    if channel:
-                        await channel.send(embed=embed)
+            await fan_out(*(self.bot.log_batcher.send(i, embed) for i in self.trigger_channels(message.guild)),
+                          label="Scanner log report")
+
+        # deletion goes out right away instead of waiting behind the other round-trips
+        await fan_out(
+            message.delete() if delete else None,
+            self.auto_warn(warn_cog, time, message.guild.id, message.author.id, self.bot.user.id, 1,
+                           f"Used banned words: {reason}") if warn and warn_cog else None,
+            direct_message() if warn else None,
+            report(),
+            label="Scanner.on_message"
+        )
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
@@ -969,65 +1093,47 @@ class Scanner(commands.Cog):
             return
 
         try:
-            data = self.data[after.guild.id]
+            index = self.get_index(after.guild.id)
         except KeyError:
             return
 
-        result = {}
         delete = False
         warn = []
 
-        for k, v in data.items():
-            temp = v.scan(after, after.author)
-            if temp:
-                result[k] = temp
-                delete = v.delete or delete
-                if v.warn:
-                    for i in temp:
-                        if i not in warn:
-                            warn.append(i)
+        result = await index.scan(after, after.author, self.pool, self.bot.scan_threshold)
+        for k, v in result.items():
+            detector = index.get(k)
+            delete = detector.delete or delete
+            if detector.warn:
+                for i in v:
+                    if i not in warn:
+                        warn.append(i)
 
         if len(result) < 1:
             return
 
-        try:
-            location = self.bot.get_cog("Logging").memory[after.guild.id]
-        except (ValueError, KeyError):
-            location = []
-
         time = datetime.datetime.utcnow()
-        mention = after.author.mention
-
-        if delete:
-            await after.delete()
-            if len(warn) > 0:
-                jump = await after.channel.send(f"Watch your language {after.author.mention} even in edited message")
-                jump = jump.jump_url
-            else:
-                jump = after.jump_url
-        else:
-            jump = after.jump_url
-
-        if len(warn) > 0:
-            reason = ", ".join(warn)
-            try:
-                self.bot.get_cog("Warn").add_warn(time, after.guild.id, after.author.id, self.bot.user.id, 1,
-                                                  f"Used banned words in edit message: {reason}")
-            except ValueError:
-                pass
+        warn_cog = self.bot.get_cog("Warn")
+        reason = ", ".join(warn)
 
+        async def direct_message():
             try:
                 await after.author.send("⚠ Auto warn ⚠", embed=discord.Embed(
                     timestamp=time,
                     description=f"Use of **{reason}** are banned, even in edited messages.",
                     colour=0xf1c40f
                 ).set_footer(icon_url=after.author.avatar.replace(size=64).url)
-                                          .set_author(icon_url=after.guild.icon.replace(size=128).url,
-                                                      name=f"{after.guild.name}"))
+                                        .set_author(icon_url=after.guild.icon.replace(size=128).url,
+                                                    name=f"{after.guild.name}"))
             except discord.HTTPException:
                 pass
 
-        if len(result) > 0:
+        async def report():
+            jump = after.jump_url
+            if delete and len(warn) > 0:
+                jump = (await after.channel.send(f"Watch your language {after.author.mention} even in edited "
+                                                 f"message")).jump_url
+
             embed = discord.Embed(
                 colour=0xe74c3c,
                 timestamp=time,
@@ -1037,17 +1143,19 @@ class Scanner(commands.Cog):
             embed.add_field(inline=False, name="Message Edited to:", value=after.content)
             embed.add_field(name="Time", value=after.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
             embed.add_field(name="Message Location", value=f"[Jump]({jump})")
-            embed.add_field(name="Mention", value=mention)
-            string = ""
-            for k, v in result.items():
-                temp = ', '.join(v)
-                string += f"**__{k}__**:\n{temp}\n\n"
-            embed.add_field(inline=False, name="Problematic Words", value=string)
+            embed.add_field(name="Mention", value=after.author.mention)
+            embed.add_field(inline=False, name="Problematic Words", value=self.result_string(result))
             if delete:
                 embed.set_author(icon_url=after.guild.icon.replace(size=128).url, name="Automatic message deletion")
 
-            for i in location:
-                if i.data['trigger']:
-                    channel = after.guild.get_channel(i.channel)
-                    if channel:
-                        await channel.send(embed=embed)
+            await fan_out(*(self.bot.log_batcher.send(i, embed) for i in self.trigger_channels(after.guild)),
+                          label="Scanner log report")
+
+        await fan_out(
+            after.delete() if delete else None,
+            self.auto_warn(warn_cog, time, after.guild.id, after.author.id, self.bot.user.id, 1,
+                           f"Used banned words in edit message: {reason}") if warn and warn_cog else None,
+            direct_message() if warn else None,
+            report(),
+            label="Scanner.on_message_edit"
+        )
@@ -1,6 +1,9 @@
+import math
 import typing
 import discord
 import datetime
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from discord.ext import commands
 from Components.MangoPi import MangoPi
 
@@ -40,8 +43,20 @@ class Warn(commands.Cog):
     bot: MangoPi
         bot reference
     db: MongoClient
-        mongo reference to the warns collection
+        mongo reference to the warns collection, one document per user within a server holding the "warns" array of
+        {id, kind, warner, reason, time, addition}, the next warn ID as "max" and the amount of warns as "count"
+    page_size: int
+        class attribute, amount of warns shown per page
+    legacy: list
+        class attribute, names of the parallel arrays warns used to be stored as
+    index: list
+        class attribute, keys of the unique index holding one document per user within a server
     """
+
+    page_size = 10
+    legacy = ["warn_id", "kind", "warner", "reason", "time", "addition"]
+    index = [("guild_id", 1), ("user_id", 1)]
+
     def __init__(self, bot: MangoPi):
         """
         Constructor for Warn class
@@ -52,12 +67,58 @@ class Warn(commands.Cog):
             pass in bot reference
         """
         self.bot = bot
-        self.db = bot.mongo["warns"]
+        self.db = bot.db["warns"]
+
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to convert the warn documents still using
+        the parallel arrays layout and merge duplicate documents of the same user before ensuring the unique index.
+        Both are one-off steps skipped once the unique index exists.
+        """
+        info = await self.db.index_information()
+        if not any(i["key"] == self.index and i.get("unique") for i in info.values()):
+            await self.convert()
+            await self.merge()
+        self.bot.index_report.update(await self.bot.db.ensure_indexes({self.db.name: [(self.index, {"unique": True})]}))
+
+    async def convert(self):
+        """
+        Async method that converts the warn documents still using the parallel arrays layout.
+        """
+        # zip the parallel arrays into the warns array within MongoDB itself, documents already converted are skipped
+        size = {"$size": "$warn_id"}
+        await self.db.update_many({"warn_id": {"$exists": True}}, [
+            {"$set": {"warns": {"$map": {"input": {"$range": [0, size]}, "as": "i", "in": {
+                ("id" if k == "warn_id" else k): {"$arrayElemAt": [f"${k}", "$$i"]} for k in self.legacy
+            }}}, "count": size}},
+            {"$unset": self.legacy}
+        ])
+
+    async def merge(self):
+        """
+        Async method that merges the documents of the same user within a server left by racing upserts into the oldest
+        one, renumbering the warn IDs as each document started counting from 1.
+        """
+        duplicates = await self.db.aggregate([
+            {"$sort": {"_id": 1}},
+            {"$group": {"_id": {"guild_id": "$guild_id", "user_id": "$user_id"}, "ids": {"$push": "$_id"},
+                        "warns": {"$push": "$warns"}}},
+            {"$match": {"ids.1": {"$exists": True}}}
+        ], allowDiskUse=True)
+        for i in duplicates:
+            warns = [w for ws in i["warns"] if ws for w in ws]
+            for num, w in enumerate(warns, 1):
+                w["id"] = num
+            await self.db.update_one({"_id": i["ids"][0]},
+                                     {"$set": {"warns": warns, "max": len(warns) + 1, "count": len(warns)}})
+            await self.db.delete_many({"_id": {"$in": i["ids"][1:]}})
+        if duplicates:
+            print(f"Merged the duplicate warn documents of {len(duplicates)} users")
 
-    def add_warn(self, time: datetime.datetime, guild: int, user: int, warner: int, kind: int, reason: str,
-                 additional: str = None):
+    async def add_warn(self, time: datetime.datetime, guild: int, user: int, warner: int, kind: int, reason: str,
+                       additional: str = None):
         """
-        Method that adds a warning to the user warn list within the mongo database.
+        Async method that adds a warning to the user warn list within the mongo database.
 
         Parameters
         ----------
@@ -75,21 +136,27 @@ class Warn(commands.Cog):
             the warn reason
         additional: str
             additional information if the kind of warn is mute
-        """
-        ret = 1
-        data = self.db.find_one({"guild_id": guild, "user_id": user})
-        time = time.strftime("%#d %B %Y, %I:%M %p UTC")
-        if data:
-            self.db.update_one({"guild_id": guild, "user_id": user},
-                               {"$push": {"warn_id": data["max"], "kind": kind, "warner": warner, "reason": reason,
-                                          "time": time, "addition": additional}})
-            self.db.update_one({"guild_id": guild, "user_id": user}, {"$inc": {"max": 1}})
-            ret = len(data["warn_id"]) + 1
-        else:
-            self.db.insert_one({"guild_id": guild, "user_id": user, "warn_id": [1], "kind": [kind], "warner": [warner],
-                                "reason": [reason], "time": [time], "addition": [additional], "max": 2})
 
-        return ret
+        Returns
+        -------
+        int
+            amount of warns the user now has within the server
+        """
+        current = {"$ifNull": ["$max", 1]}
+        # single upserting pipeline update so the warn ID and the counters can't race, $literal keeps reasons starting
+        # with "$" from being read as field paths
+        warn = {"id": current, "kind": kind, "warner": warner, "reason": {"$literal": reason},
+                "time": time.strftime("%#d %B %Y, %I:%M %p UTC"), "addition": {"$literal": additional}}
+        update = [{"$set": {"warns": {"$concatArrays": [{"$ifNull": ["$warns", []]}, [warn]]},
+                            "max": {"$add": [current, 1]}, "count": {"$add": [{"$ifNull": ["$count", 0]}, 1]}}}]
+        options = {"projection": {"_id": False, "count": True}, "upsert": True,
+                   "return_document": ReturnDocument.AFTER}
+        try:
+            data = await self.db.find_one_and_update({"guild_id": guild, "user_id": user}, update, **options)
+        except DuplicateKeyError:
+            # lost the insert race against another warn of the same user, the document exists now so this updates it
+            data = await self.db.find_one_and_update({"guild_id": guild, "user_id": user}, update, **options)
+        return data["count"]
 
     @commands.command(aliases=['w'])
     @commands.has_permissions(ban_members=True)
@@ -105,7 +172,7 @@ class Warn(commands.Cog):
         if len(reason) > 400:
             return await ctx.reply("That is a very long warning reason... Try keep in under 400 letters...")
 
-        data = self.add_warn(ctx.message.created_at, ctx.guild.id, target.id, ctx.author.id, 0, reason)
+        data = await self.add_warn(ctx.message.created_at, ctx.guild.id, target.id, ctx.author.id, 0, reason)
 
         try:
             await target.send("⚠ You received a warning ⚠", embed=discord.Embed(
@@ -139,7 +206,7 @@ class Warn(commands.Cog):
         else:
             target = target.id
 
-        self.db.delete_one({"guild_id": ctx.guild.id, "user_id": target})
+        await self.db.delete_one({"guild_id": ctx.guild.id, "user_id": target})
         await ctx.reply(f"Purged warn data of user with ID:`{target}`")
 
     @warn_menu.command(aliases=['-'])
@@ -150,36 +217,27 @@ class Warn(commands.Cog):
         else:
             target = target.id
 
-        data = self.db.find_one({"guild_id": ctx.guild.id, "user_id": target})
-        if data is None:
-            await ctx.reply("There is no warning to delete")
-        else:
-            if warn not in data["warn_id"]:
-                await ctx.reply("Can not find that warn_id")
+        query = {"guild_id": ctx.guild.id, "user_id": target}
+        result = await self.db.update_one({**query, "warns.id": warn},
+                                          {"$pull": {"warns": {"id": warn}}, "$inc": {"count": -1}})
+        if result.matched_count == 0:
+            if await self.db.count_documents(query, limit=1) == 0:
+                await ctx.reply("There is no warning to delete")
             else:
-                if len(data["warn_id"]) == 1:
-                    self.db.delete_one({"guild_id": ctx.guild.id, "user_id": target})
-                else:
-                    re = data["warn_id"].index(warn)
-                    data["warn_id"].pop(re)
-                    data["kind"].pop(re)
-                    data["warner"].pop(re)
-                    data["reason"].pop(re)
-                    data["time"].pop(re)
-                    data["addition"].pop(re)
-                    self.db.update_one({"guild_id": data["guild_id"], "user_id": data["user_id"]},
-                                       {"$set": {"warn_id": data["warn_id"], "kind": data["kind"],
-                                                 "warner": data["warner"], "reason": data["reason"],
-                                                 "time": data["time"],
-                                                 "addition": data["addition"]}})
-                await ctx.message.add_reaction(emoji='👍')
+                await ctx.reply("Can not find that warn_id")
+        else:
+            await self.db.delete_one({**query, "count": {"$lte": 0}})
+            await ctx.message.add_reaction(emoji='👍')
 
     @warn_menu.command(aliases=['s'])
     async def show(self, ctx: commands.Context, target: typing.Union[discord.Member, discord.User, int], page: int = 1):
         """List all the warnings the user may have"""
         if page < 1:
             return await ctx.reply("Page number must be bigger than 0")
-        data = self.db.find_one({"guild_id": ctx.guild.id, "user_id": target if isinstance(target, int) else target.id})
+        data = await self.db.find_one(
+            {"guild_id": ctx.guild.id, "user_id": target if isinstance(target, int) else target.id},
+            {"_id": False, "count": True, "warns": {"$slice": [(page - 1) * self.page_size, self.page_size]}}
+        )
         if not data:
             await ctx.reply(f"**{target}** have a clean record")
         else:
@@ -197,43 +255,23 @@ class Warn(commands.Cog):
                     timestamp=ctx.message.created_at,
                 ).set_author(name=f"Warn list for user with the ID: {target}")
             line = [[], [], []]
-            temp = [[], [], []]
-            counter = [0, 0, 0]
-            for i in range(len(data["warn_id"])):
-                index = data["kind"][i]
+            for i in data["warns"]:
                 hold = [
-                    f"**{data['warn_id'][i]}**. [`{data['time'][i]}`] __<@!{data['warner'][i]}>__ - "
-                    f"{data['reason'][i]}",
-                    f"**{data['warn_id'][i]}**. [`{data['time'][i]}`] - {data['reason'][i]}",
-                    f"**{data['warn_id'][i]}**. [`{data['time'][i]}`] ({data['addition'][i]} mute) - "
-                    f"{data['reason'][i]}"
+                    f"**{i['id']}**. [`{i['time']}`] __<@!{i['warner']}>__ - {i['reason']}",
+                    f"**{i['id']}**. [`{i['time']}`] - {i['reason']}",
+                    f"**{i['id']}**. [`{i['time']}`] ({i['addition']} mute) - {i['reason']}"
                 ]
-                if counter[index] % 5 == 0 and counter[index] != 0:
-                    new = "\n".join(temp[index])
-                    line[index].append(new)
-                    temp[index].clear()
-                temp[index].append(hold[index])
-                counter[index] += 1
-
-            for i in range(len(temp)):
-                new = "\n".join(temp[i])
-                if new != "":
-                    line[i].append(new)
+                line[i["kind"]].append(hold[i["kind"]])
 
             labels = ["Manual Warns", "Auto Warns", "Mutes"]
-            max_page = 0
-            index = 0
-            for i in line:
-                if len(i) > max_page:
-                    max_page = len(i)
-                try:
-                    hold = i[page - 1]
-                    if isinstance(hold, str):
-                        embed.add_field(inline=False, name=labels[index], value=hold)
-                except IndexError:
-                    pass
-                index += 1
+            for index in range(len(line)):
+                # 5 per field to stay under the field length limit
+                for k in range(0, len(line[index]), 5):
+                    embed.add_field(inline=False, name=labels[index], value="\n".join(line[index][k:k + 5]))
 
+            max_page = math.ceil(data["count"] / self.page_size)
+            if page > max_page:
+                embed.description = "Nothing on this page"
             embed.set_footer(text=f"{page} / {max_page} Page")
 
             await ctx.reply(embed=embed)
@@ -13,7 +13,7 @@ async def setup(bot: MangoPi):
         pass in bot reference to add Cog
     """
     temp = Ignore(bot)
-    temp.update()
+    await temp.update()
     await bot.add_cog(temp)
     bot.ignore_check = temp.ignore_check
     print("Load Cog:\tIgnore")
@@ -56,10 +56,10 @@ class Ignore(commands.Cog):
             pass in bot reference for the Cog
         """
         self.bot = bot
-        self.db = bot.mongo["ignore_channel"]
+        self.db = bot.db["ignore_channel"]
         self.data = {}
 
-    def update(self, target: int = None):
+    async def update(self, target: int = None):
         """
         Method that updates the data dictionary from MongoDB in it's entirety or a specific server.
 
@@ -70,9 +70,9 @@ class Ignore(commands.Cog):
         """
         if not target:
             self.data.clear()
-            data = self.db.find({})
+            data = await self.db.find({})
         else:
-            data = self.db.find({"guild_id": target})
+            data = await self.db.find({"guild_id": target})
             try:
                 self.data[target] = []
             except KeyError:
@@ -144,7 +144,7 @@ class Ignore(commands.Cog):
             for i in data:
                 channel = ctx.guild.get_channel(i)
                 if not channel:
-                    self.db.delete_one({"guild_id": ctx.guild.id, "_id": i})
+                    await self.db.delete_one({"guild_id": ctx.guild.id, "_id": i})
                 else:
                     display += f"* {channel.mention}\n"
 
@@ -169,9 +169,9 @@ class Ignore(commands.Cog):
         data = self.find(ctx.guild.id, channel.id)
 
         if not data:
-            self.db.insert_one({"guild_id": ctx.guild.id, "_id": channel.id})
+            await self.db.insert_one({"guild_id": ctx.guild.id, "_id": channel.id})
             await ctx.reply(f"{channel} has been added to ignore commands list.", delete_after=5)
         else:
-            self.db.delete_one({"guild_id": ctx.guild.id, "_id": channel.id})
+            await self.db.delete_one({"guild_id": ctx.guild.id, "_id": channel.id})
             await ctx.reply(f"{channel} has been removed from ignore commands list.", delete_after=5)
-        self.update(ctx.guild.id)
+        await self.update(ctx.guild.id)
@@ -1,6 +1,5 @@
 import discord
 import typing
-from pymongo import MongoClient
 from discord.ext import commands
 from Components.MangoPi import MangoPi
 from Components.AutoRole import AutoRole
@@ -40,8 +39,8 @@ class JoinRole(commands.Cog):
     ----------
     bot: MangoPi
         bot reference
-    db: MongoClient
-        the MongoClient reference to the join_auto collection
+    db: AsyncCollection
+        the async mongo reference to the join_auto collection
     data: dict
         the dictionary that holds AutoRole class for the specific server
     """
@@ -55,9 +54,14 @@ class JoinRole(commands.Cog):
             pass in bot reference
         """
         self.bot = bot
-        self.db = bot.mongo["join_auto"]
+        self.db = bot.db["join_auto"]
         self.data = {}
-        self.update()
+
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        await self.update()
 
     def search(self, guild: int):
         """
@@ -78,7 +82,7 @@ class JoinRole(commands.Cog):
         except KeyError:
             return
 
-    def update(self, guild: int = None):
+    async def update(self, guild: int = None):
         """
         Method to update data dictionary from mongo database. Either update the entire data dictionary or just that
         server.
@@ -93,13 +97,16 @@ class JoinRole(commands.Cog):
                 self.data.pop(guild)
             except KeyError:
                 pass
-            data = self.db.find({"_id": guild})
+            data = await self.db.find({"_id": guild})
         else:
             self.data.clear()
-            data = self.db.find()
+            data = await self.db.find()
         if data:
             for i in data:
-                self.data.update({i['_id']: AutoRole(self.bot, i)})
+                temp = AutoRole(self.bot, i)
+                if temp.outdated:
+                    await temp.update(self.db)
+                self.data.update({i['_id']: temp})
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -142,8 +149,8 @@ class JoinRole(commands.Cog):
         if not data:
             await ctx.reply("Nothing to purge")
         else:
-            self.db.delete_one({"_id": ctx.guild.id})
-            self.update(ctx.guild.id)
+            await self.db.delete_one({"_id": ctx.guild.id})
+            await self.update(ctx.guild.id)
             await ctx.reply("Join role system purged.")
 
     @join_role.command(aliases=['t'])
@@ -156,7 +163,7 @@ class JoinRole(commands.Cog):
         else:
             data.power = not data.power
             status = "On" if data.power else "Off"
-            self.db.update_one({"_id": ctx.guild.id}, {"$set": {"switch": data.power}})
+            await self.db.update_one({"_id": ctx.guild.id}, {"$set": {"switch": data.power}})
             await ctx.reply(f"Join role system is now {status}")
 
     @join_role.command(aliases=['+'])
@@ -167,11 +174,11 @@ class JoinRole(commands.Cog):
             ids = []
             for i in roles:
                 ids.append(i.id)
-            self.db.insert_one({"_id": ctx.guild.id, "role_array": ids, "switch": True})
+            await self.db.insert_one({"_id": ctx.guild.id, "role_array": ids, "switch": True})
             temp = ""
             for i in roles:
                 temp += f"{i.mention}\n"
-            self.update(ctx.guild.id)
+            await self.update(ctx.guild.id)
             await ctx.reply(embed=discord.Embed(
                 title="Added these role(s) into the join role system",
                 colour=0x74b9ff,
@@ -187,7 +194,7 @@ class JoinRole(commands.Cog):
                 else:
                     fails += f"{i.mention}\n"
             if data.change(self.bot):
-                data.update(self.db)
+                await data.update(self.db)
             embed = discord.Embed(title="Updated role(s) in the join role system", colour=0x55efc4)
             embed.add_field(name="Added Role(s)", value="None" if adds == "" else adds, inline=False)
             embed.add_field(name="Failed to add", value="None" if fails == "" else fails, inline=False)
@@ -213,7 +220,7 @@ class JoinRole(commands.Cog):
                 removes += f"<@&{num}>\n"
 
         if data.change(self.bot):
-            self.update(self.db)
+            await data.update(self.db)
 
         embed = discord.Embed(
             title="Updated roles in the join role system",
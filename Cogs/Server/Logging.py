@@ -64,8 +64,13 @@ class Notify:
         channel ID of the log channel
     data : dict
         dictionary storing booleans that dictates what information will show up on the log channel
+    events : list
+        class attribute, names of the log events a channel can toggle
     """
 
+    events = ['enter', 'leave', 'kick', 'ban', 'unban', 'trigger', 'raid', 'member_update', 'server_update',
+              'vc_update']
+
     def __init__(self, package: dict):
         """
         Constructor for Notify class.
@@ -78,9 +83,7 @@ class Notify:
         self.guild = package['guild_id']
         self.channel = package["_id"]
         self.data = {}
-        temp = ['enter', 'leave', 'kick', 'ban', 'unban', 'trigger', 'raid', 'member_update', 'server_update',
-                'vc_update']
-        for i in temp:
+        for i in self.events:
             self.data.update({i: package[i]})
 
 
@@ -104,6 +107,14 @@ class Logging(commands.Cog):
         list of check and cross emotes
     instance : list
         instances of setting menu
+    user_guilds : dict
+        dictionary of {user ID: set of IDs of the servers the user is in}, kept up to date by the member and server
+        join / leave listeners so user updates don't need to sweep every server
+    routes : dict
+        dictionary of {server ID: {event: list of discord.TextChannel}} compiled from memory, so dispatching a log
+        event is a single lookup
+    pruning : dict
+        dictionary of {server ID: asyncio.Task} of the servers having the settings of their deleted log channels removed
     """
 
     def __init__(self, bot: MangoPi):
@@ -122,8 +133,94 @@ class Logging(commands.Cog):
         self.label = {"➡": "enter", "🚪": "leave", "👢": "kick", "🔨": "ban", "👼": "unban", "⚠": "trigger",
                       "🚶": "raid", "🔃": "member_update", "🏗": "server_update", "💬": "vc_update"}
         self.second = ['✔', '🇽']
-        self.db = bot.mongo["logging"]
-        self.update()
+        self.db = bot.db["logging"]
+        self.user_guilds = {}
+        self.routes = {}
+        self.pruning = {}
+
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        await self.update()
+        for i in self.bot.guilds:
+            self.index_guild(i)
+
+    def index_member(self, guild: int, user: int):
+        """
+        Method that records the user being in the server within user_guilds.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        user : int
+            ID of the user
+        """
+        try:
+            self.user_guilds[user].add(guild)
+        except KeyError:
+            self.user_guilds[user] = {guild}
+
+    def unindex_member(self, guild: int, user: int):
+        """
+        Method that removes the server from the user's entry within user_guilds.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        user : int
+            ID of the user
+        """
+        try:
+            data = self.user_guilds[user]
+        except KeyError:
+            return
+        data.discard(guild)
+        if len(data) < 1:
+            self.user_guilds.pop(user)
+
+    def index_guild(self, guild: discord.Guild):
+        """
+        Method that records every cached member of the server within user_guilds.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the server to index
+        """
+        for i in guild.members:
+            self.index_member(guild.id, i.id)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        """
+        Async method called when the bot joins a server, adds its members into user_guilds.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the newly joined server
+        """
+        self.index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """
+        Async method called when the bot leaves a server, removes its members from user_guilds.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the server the bot left
+        """
+        for i in guild.members:
+            self.unindex_member(guild.id, i.id)
+        try:
+            self.routes.pop(guild.id)
+        except KeyError:
+            pass
 
     def find(self, guild: int, channel: int):
         """
@@ -150,7 +247,7 @@ class Logging(commands.Cog):
         except KeyError:
             pass
 
-    def update(self, guild: int = None):
+    async def update(self, guild: int = None):
         """
         Method that updates memory data from MongoDB.
 
@@ -159,15 +256,17 @@ class Logging(commands.Cog):
         guild : int
             the specific server to update
         """
+        # pending setting toggles need to land before reading them back
+        await self.bot.writes.flush(self.db.name)
         if guild:
             try:
                 self.memory.pop(guild)
             except KeyError:
                 pass
-            data = self.db.find({"guild_id": guild})
+            data = await self.db.find({"guild_id": guild})
         else:
             self.memory.clear()
-            data = self.db.find({})
+            data = await self.db.find({})
         for i in data:
             try:
                 fail = False
@@ -182,10 +281,118 @@ class Logging(commands.Cog):
                 if not fail:
                     self.memory[i['guild_id']].append(Notify(i))
                 else:
-                    self.db.delete_one({"guild_id": i['guild_id'], "_id": i["_id"]})
+                    await self.db.delete_one({"guild_id": i['guild_id'], "_id": i["_id"]})
             except KeyError:
                 self.memory.update({i['guild_id']: [Notify(i)]})
 
+        if guild:
+            self.build_routes(guild)
+        else:
+            self.routes.clear()
+            for i in self.memory.keys():
+                self.build_routes(i)
+
+    def build_routes(self, guild: int):
+        """
+        Method that compiles the routing table of the specified server from memory, needs to be called whenever the
+        Notify of the server change.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        """
+        server = self.bot.get_guild(guild)
+        try:
+            data = self.memory[guild]
+        except KeyError:
+            data = None
+
+        if not data or not server:
+            try:
+                self.routes.pop(guild)
+            except KeyError:
+                pass
+            return
+
+        table = {i: [] for i in Notify.events}
+        for i in data:
+            channel = server.get_channel(i.channel)
+            if not channel:
+                continue
+            for k in Notify.events:
+                if i.data[k]:
+                    table[k].append(channel)
+        self.routes[guild] = table
+
+    def route(self, guild: int, event: str):
+        """
+        Method that returns the log channels of the server that want the specified event.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        event : str
+            name of the log event, one of Notify.events
+
+        Returns
+        -------
+        list
+            list of discord.TextChannel, empty if there is none
+        """
+        try:
+            ret = self.routes[guild][event]
+        except KeyError:
+            return []
+
+        # the table holds channel objects, a channel deleted while the bot missed the event would still be in there
+        alive = [i for i in ret if self.bot.get_channel(i.id)]
+        if len(alive) != len(ret) and guild not in self.pruning:
+            task = asyncio.create_task(self.prune(guild))
+            self.pruning[guild] = task
+            task.add_done_callback(lambda _: self.pruning.pop(guild))
+        return alive
+
+    async def prune(self, guild: int):
+        """
+        Async method that removes the settings of the log channels that no longer exist within the server, then
+        rebuilds its routing table.
+
+        Parameters
+        ----------
+        guild : int
+            ID of the server
+        """
+        server = self.bot.get_guild(guild)
+        try:
+            data = self.memory[guild]
+        except KeyError:
+            return
+        if not server:
+            return
+
+        gone = [i.channel for i in data if not server.get_channel(i.channel)]
+        if gone:
+            await self.db.delete_many({"guild_id": guild, "_id": {"$in": gone}})
+            await self.update(guild)
+        else:
+            self.build_routes(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        """
+        Async method called when a server becomes available again after an outage or a reconnect, refreshes its
+        members within user_guilds and its routing table as its channels may have changed meanwhile.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the server that became available
+        """
+        self.index_guild(guild)
+        await self.prune(guild.id)
+
     @commands.group(aliases=["lc"])
     @commands.guild_only()
     @commands.has_permissions(manage_channels=True, view_audit_log=True)
@@ -235,11 +442,11 @@ class Logging(commands.Cog):
             await ctx.reply(f"**#{channel}** is already a log channel.")
         else:
             f = False
-            self.db.insert_one(
+            await self.db.insert_one(
                 {"guild_id": ctx.guild.id, "_id": channel.id, "leave": f, "enter": f, "kick": f, "ban": f,
                  "unban": f, "trigger": f, "raid": f, "member_update": f, "server_update": f, "vc_update": f}
             )
-            self.update(ctx.guild.id)
+            await self.update(ctx.guild.id)
             await ctx.reply(f"**#{channel}** has been set as a log channel")
 
     @log_channels.command(aliases=['s'])
@@ -262,8 +469,8 @@ class Logging(commands.Cog):
                 ret = await self.setting_menu(channel, message, data, ctx.author, ret == "Continue")
             if ret != "Deleted" or not ret:
                 temp = data.data
-                self.db.update_one(
-                    {"guild_id": ctx.guild.id, "_id": channel.id},
+                await self.bot.writes.queue(
+                    self.db.name, {"guild_id": ctx.guild.id, "_id": channel.id},
                     {"$set": {"enter": temp['enter'], "leave": temp['leave'], "kick": temp['kick'], "ban": temp['ban'],
                               "unban": temp['unban'], "trigger": temp['trigger'], "raid": temp['raid'],
                               "member_update": temp['member_update'], "server_update": temp['server_update'],
@@ -367,9 +574,9 @@ class Logging(commands.Cog):
                     if reaction.emoji == "🇽":
                         await message.delete()
                     if reaction.emoji == "✔":
-                        self.db.delete_one({"guild_id": message.guild.id, "_id": channel.id})
+                        await self.db.delete_one({"guild_id": message.guild.id, "_id": channel.id})
                         await message.clear_reactions()
-                        self.update(message.guild.id)
+                        await self.update(message.guild.id)
                         await message.edit(content=f"**{channel}** will no longer receive any log messages.")
                         return "Deleted"
             else:
@@ -377,6 +584,7 @@ class Logging(commands.Cog):
                 req = self.label[reaction.emoji]
                 res = data.data[req]
                 data.data[req] = False if res else True
+                self.build_routes(channel.guild.id)
                 return "Continue"
 
     @commands.Cog.listener()
@@ -392,9 +600,8 @@ class Logging(commands.Cog):
         after : discord.Guild
             Server information after the change
         """
-        try:
-            data = self.memory[after.id]
-        except KeyError:
+        channels = self.route(after.id, "server_update")
+        if not channels:
             return
 
         embed = discord.Embed(
@@ -434,14 +641,8 @@ class Logging(commands.Cog):
         if embed.fields == discord.Embed.Empty or len(embed.fields) < 1:
             return
 
-        for i in data:
-            if i.data['server_update']:
-                channel = self.bot.get_channel(i.channel)
-                if not channel:
-                    self.db.delete_one({"guild_id": i.guild, "_id": i.channel})
-                    return
-
-                await channel.send(embed=embed)
+        for i in channels:
+            await self.bot.log_batcher.send(i, embed)
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState,
@@ -459,9 +660,8 @@ class Logging(commands.Cog):
         after : discord.VoiceState
             voice state after
         """
-        try:
-            data = self.memory[member.guild.id]
-        except KeyError:
+        channels = self.route(member.guild.id, "vc_update")
+        if not channels:
             return
 
         now = datetime.datetime.utcnow()
@@ -490,15 +690,8 @@ class Logging(commands.Cog):
         embed = discord.Embed(colour=embed_stuff[label][0], timestamp=now, description=embed_stuff[label][1])
         embed.set_footer(icon_url=member.avatar.replace(size=64).url, text=label)
 
-        for i in data:
-            if i.data['vc_update']:
-                channel = self.bot.get_channel(i.channel)
-                if not channel:
-                    self.db.delete_one({"guild_id": i.guild, "_id": i.channel})
-                    return
-
-                if embed:
-                    await channel.send(embed=embed)
+        for i in channels:
+            await self.bot.log_batcher.send(i, embed)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -511,14 +704,15 @@ class Logging(commands.Cog):
         member : discord.Member
             new member who joined the server
         """
+        self.index_member(member.guild.id, member.id)
+
         try:
             await self.bot.get_cog("Scanner").scan_name(member.guild, member, True)
         except ValueError:
             pass
 
-        try:
-            data = self.memory[member.guild.id]
-        except KeyError:
+        channels = self.route(member.guild.id, "enter")
+        if not channels:
             return
 
         embed = discord.Embed(
@@ -548,14 +742,8 @@ class Logging(commands.Cog):
         elif days <= 7:
             embed.set_footer(icon_url=url, text="New to discord yo!")
 
-        for i in data:
-            if i.data['enter']:
-                channel = self.bot.get_channel(i.channel)
-                if not channel:
-                    self.db.delete_one({"guild_id": i.guild, "_id": i.channel})
-                    return
-
-                await channel.send(embed=embed)
+        for i in channels:
+            await self.bot.log_batcher.send(i, embed)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
@@ -568,9 +756,11 @@ class Logging(commands.Cog):
         member : discord.Member
             member who left the server
         """
-        try:
-            data = self.memory[member.guild.id]
-        except KeyError:
+        self.unindex_member(member.guild.id, member.id)
+
+        leave = self.route(member.guild.id, "leave")
+        kick = self.route(member.guild.id, "kick")
+        if not leave and not kick:
             return
 
         time = datetime.datetime.utcnow()
@@ -587,15 +777,18 @@ class Logging(commands.Cog):
                         value=time.strftime("%#d %B %Y, %I:%M %p UTC"))
 
         kicked = None
-        
-        async for entry in member.guild.audit_logs(
-            action=discord.AuditLogAction.kick, after=(datetime.datetime.utcnow() - datetime.timedelta(minutes=1))
-        ):
-            if entry.target.id == member.id:
+
+        # only dig through the audit log if someone wants to hear about kicks
+        if kick:
+            try:
+                entry = await self.bot.audit.find(member.guild, discord.AuditLogAction.kick, member.id)
+            except discord.Forbidden:
+                entry = None
+            if entry:
                 kicked = discord.Embed(
-                colour=0xe74c3c,
-                timestamp=entry.created_at,
-                description=f"**{entry.target.name}** got drop kicked out of **{member.guild}**!"
+                    colour=0xe74c3c,
+                    timestamp=entry.created_at,
+                    description=f"**{entry.target.name}** got drop kicked out of **{member.guild}**!"
                 )
                 kicked.set_thumbnail(url=member.avatar.url)
                 kicked.set_author(name="👢 Booted!", icon_url=member.guild.icon.replace(size=64).url)
@@ -604,19 +797,13 @@ class Logging(commands.Cog):
                 kicked.add_field(inline=False, name="Reason:", value=entry.reason)
                 kicked.add_field(name="User ID", value=member.id)
                 kicked.add_field(name="Kick Time", value=entry.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
-                break
-
-        for i in data:
-            target = self.bot.get_channel(i.channel)
-            if not target:
-                self.db.delete_one({"guild_id": i.guild, "_id": i.channel})
-                return
 
-            if i.data['leave']:
-                await target.send(embed=embed)
+        for i in leave:
+            await self.bot.log_batcher.send(i, embed)
 
-            if i.data['kick'] and kicked:
-                await target.send(embed=kicked)
+        if kicked:
+            for i in kick:
+                await self.bot.log_batcher.send(i, kicked)
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: typing.Union[discord.Member, discord.User]):
@@ -631,42 +818,35 @@ class Logging(commands.Cog):
         user : typing.Union[discord.Member, discord.User]
             The user/member banned
         """
-        try:
-            data = self.memory[guild.id]
-        except KeyError:
+        channels = self.route(guild.id, "ban")
+        if not channels:
             return
-        
-        async for entry in await guild.audit_logs(
-            action=discord.AuditLogAction.ban, limit=5
-        ):
-            if entry.target.id == user.id:
-                embed = discord.Embed(
-                    timestamp=datetime.datetime.utcnow() if not entry else entry.created_at,
-                    colour=0xED4C67,
-                    description=f"**{user.name}** got hit by a massive hammer and vanished into the "
-                                f"shadow realm!"
-                )
-                embed.set_footer(text="Banned")
-                embed.set_thumbnail(url=user.avatar.url)
-                embed.set_author(name="🔨 Banned!", icon_url=guild.icon.replace(size=64).url)
-                embed.add_field(name="User ID", value=user.id)
-
-                if entry:
-                    embed.add_field(inline=False, name="Banned by:", value=entry.user)
-                    embed.add_field(inline=False, name="Reason:", value=entry.reason)
-                    embed.add_field(name="Ban Time", value=entry.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
-                else:
-                    embed.add_field(inline=False, name="404 Not Found", value="Failed to fetch ban data from audit log")
-
-                for i in data:
-                    if i.data['ban'] and embed:
-                        channel = self.bot.get_channel(i.channel)
-                        if not channel:
-                            self.db.delete_one({"guild_id": i.guild, "_id": i.channel})
-                        else:
-                            if embed:
-                                await self.bot.get_channel(i.channel).send(embed=embed)
-                break
+
+        try:
+            entry = await self.bot.audit.find(guild, discord.AuditLogAction.ban, user.id, expect=True)
+        except discord.Forbidden:
+            entry = None
+
+        embed = discord.Embed(
+            timestamp=datetime.datetime.utcnow() if not entry else entry.created_at,
+            colour=0xED4C67,
+            description=f"**{user.name}** got hit by a massive hammer and vanished into the "
+                        f"shadow realm!"
+        )
+        embed.set_footer(text="Banned")
+        embed.set_thumbnail(url=user.avatar.url)
+        embed.set_author(name="🔨 Banned!", icon_url=guild.icon.replace(size=64).url)
+        embed.add_field(name="User ID", value=user.id)
+
+        if entry:
+            embed.add_field(inline=False, name="Banned by:", value=entry.user)
+            embed.add_field(inline=False, name="Reason:", value=entry.reason)
+            embed.add_field(name="Ban Time", value=entry.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
+        else:
+            embed.add_field(inline=False, name="404 Not Found", value="Failed to fetch ban data from audit log")
+
+        for i in channels:
+            await self.bot.log_batcher.send(i, embed)
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User):
@@ -681,37 +861,32 @@ class Logging(commands.Cog):
         user : discord.User
             user being unbanned
         """
-        try:
-            data = self.memory[guild.id]
-        except KeyError:
+        channels = self.route(guild.id, "unban")
+        if not channels:
             return
 
-        embed = None
+        try:
+            entry = await self.bot.audit.find(guild, discord.AuditLogAction.unban, user.id, expect=True)
+        except discord.Forbidden:
+            return
+        if not entry:
+            return
 
-        async for entry in guild.audit_logs(action=discord.AuditLogAction.unban, limit=3):
-            if entry.target.id == user.id:
-                embed = discord.Embed(
-                    colour=0x1abc9c,
-                    timestamp=entry.created_at,
-                    description=f"Don't lose hope just yet **{user.name}**! Stay determined!"
-                )
-                embed.set_footer(text="Unbanned")
-                embed.set_thumbnail(url=user.avatar.url)
-                embed.set_author(name="✝ Unbanned!", icon_url=guild.icon.replace(size=64).url)
-                embed.add_field(inline=False, name="Unbanned by:", value=entry.user.mention)
-                embed.add_field(inline=False, name="Reason:", value=entry.reason)
-                embed.add_field(name="User ID", value=user.id)
-                embed.add_field(name="Unban Time", value=entry.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
-                break
+        embed = discord.Embed(
+            colour=0x1abc9c,
+            timestamp=entry.created_at,
+            description=f"Don't lose hope just yet **{user.name}**! Stay determined!"
+        )
+        embed.set_footer(text="Unbanned")
+        embed.set_thumbnail(url=user.avatar.url)
+        embed.set_author(name="✝ Unbanned!", icon_url=guild.icon.replace(size=64).url)
+        embed.add_field(inline=False, name="Unbanned by:", value=entry.user.mention)
+        embed.add_field(inline=False, name="Reason:", value=entry.reason)
+        embed.add_field(name="User ID", value=user.id)
+        embed.add_field(name="Unban Time", value=entry.created_at.strftime("%#d %B %Y, %I:%M %p UTC"))
 
-        for i in data:
-            if i.data['unban']:
-                channel = self.bot.get_channel(i.channel)
-                if not channel:
-                    self.db.delete_one({"_id": i.channel})
-                else:
-                    if embed:
-                        await channel.send(embed=embed)
+        for i in channels:
+            await self.bot.log_batcher.send(i, embed)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
@@ -734,9 +909,8 @@ class Logging(commands.Cog):
             result = False
 
         if not result:
-            try:
-                data = self.memory[after.guild.id]
-            except KeyError:
+            channels = self.route(after.guild.id, "member_update")
+            if not channels:
                 return
 
             embed = discord.Embed(
@@ -750,14 +924,8 @@ class Logging(commands.Cog):
             if after.nick:
                 embed.add_field(name="Now", value=after.nick, inline=False)
 
-            for i in data:
-                if i.data['member_update']:
-                    channel = self.bot.get_channel(i.channel)
-                    if not channel:
-                        self.db.delete_one({"_id": i.channel})
-                    else:
-                        if embed:
-                            await channel.send(embed=embed)
+            for i in channels:
+                await self.bot.log_batcher.send(i, embed)
 
     @commands.Cog.listener()
     async def on_user_update(self, before: discord.User, after: discord.User):
@@ -776,9 +944,13 @@ class Logging(commands.Cog):
             return
 
         is_in = []
-        for i in self.bot.guilds:
-            if i.get_member(after.id):
-                is_in.append(i)
+        try:
+            for i in self.user_guilds[after.id]:
+                server = self.bot.get_guild(i)
+                if server:
+                    is_in.append(server)
+        except KeyError:
+            return
 
         for i in is_in:
             try:
@@ -789,10 +961,9 @@ class Logging(commands.Cog):
                 result = False
 
             if not result:
-                try:
-                    data = self.memory[i.id]
-                except KeyError:
-                    return
+                channels = self.route(i.id, "member_update")
+                if not channels:
+                    continue
 
                 embed = discord.Embed(
                     colour=0x45aaf2,
@@ -803,14 +974,8 @@ class Logging(commands.Cog):
                 embed.add_field(name="Before", value=before.display_name, inline=False)
                 embed.add_field(name="Now", value=after.display_name, inline=False)
 
-                for k in data:
-                    if k.data['member_update']:
-                        channel = self.bot.get_channel(k.channel)
-                        if not channel:
-                            self.db.delete_one({"_id": k.channel})
-                        else:
-                            if embed:
-                                await channel.send(embed=embed)
+                for k in channels:
+                    await self.bot.log_batcher.send(k, embed)
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
@@ -825,5 +990,7 @@ class Logging(commands.Cog):
         if isinstance(channel, discord.TextChannel):
             data = self.find(channel.guild.id, channel.id)
             if data:
-                self.db.delete_one({"_id": channel.id})
-                self.update(channel.guild.id)
+                # stop routing into the channel right away, the reload below waits on MongoDB
+                self.build_routes(channel.guild.id)
+                await self.db.delete_one({"_id": channel.id})
+                await self.update(channel.guild.id)
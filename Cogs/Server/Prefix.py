@@ -14,7 +14,7 @@ async def setup(bot: MangoPi):
         pass in bot reference to add Cog and modify command_prefix
     """
     temp = Prefix(bot)
-    temp.update()
+    await temp.update()
     await bot.add_cog(temp)
     bot.command_prefix = temp.get_prefix
     print("Load Cog:\tPrefix")
@@ -58,7 +58,7 @@ class Prefix(commands.Cog):
         """
         self.bot = bot
         self.prefix = {}
-        self.db = bot.mongo["prefix"]
+        self.db = bot.db["prefix"]
 
     # method to pass into bot command_prefix
     def get_prefix(self, client: MangoPi, message: discord.Message):
@@ -93,12 +93,12 @@ class Prefix(commands.Cog):
         # custom prefix
         return commands.when_mentioned_or(prefix)(client, message)
 
-    def update(self):
+    async def update(self):
         """
         Method that updates prefix dictionary from mongoDB.
         """
         self.prefix.clear()
-        data = self.db.find({})
+        data = await self.db.find({})
         for i in data:
             self.prefix.update({i['_id']: i['prefix']})
 
@@ -143,18 +143,18 @@ class Prefix(commands.Cog):
                 await ctx.reply("🤷 Nothing has changed.")
             else:
                 # resetting current prefix back to default
-                self.db.delete_one({"_id": ctx.guild.id})
+                await self.db.delete_one({"_id": ctx.guild.id})
                 self.prefix.pop(ctx.guild.id)
                 await ctx.reply(f"Server prefix have been reset to: **{self.bot.default_prefix}**.")
             return
 
         if not data:
             # inserts the new prefix setting over the default
-            self.db.insert_one({"_id": ctx.guild.id, "prefix": pre})
+            await self.db.insert_one({"_id": ctx.guild.id, "prefix": pre})
             self.prefix.update({ctx.guild.id: pre})
             await ctx.reply(f"Server prefix have been set to: ** {pre} **.")
         else:
             # changing the current prefix setting
-            self.db.update_one({"_id": ctx.guild.id}, {"$set": {"prefix": pre}})
+            await self.db.update_one({"_id": ctx.guild.id}, {"$set": {"prefix": pre}})
             self.prefix[ctx.guild.id] = pre
             await ctx.reply(f"Server prefix have been updated to: ** {pre} **.")
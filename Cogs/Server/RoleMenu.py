@@ -58,10 +58,15 @@ class RoleMenu(commands.Cog):
         self.bot = bot
         self.data = {}
         self.label = {}
-        self.db = bot.mongo["static_role"]
-        self.update()
+        self.db = bot.db["static_role"]
 
-    def update(self, guild: int = None):
+    async def cog_load(self):
+        """
+        Async method called by discord.py when the Cog is being added, used to populate data from MongoDB.
+        """
+        await self.update()
+
+    async def update(self, guild: int = None):
         """
         Method that pulls data from mongoDB collection "static_role" and populate data and label with it
 
@@ -70,8 +75,10 @@ class RoleMenu(commands.Cog):
         guild: int
             the specific server to update if any
         """
+        # pending setting toggles need to land before reading them back
+        await self.bot.writes.flush(self.db.name)
         if guild:
-            ret = self.db.find({"guild_id": guild})
+            ret = await self.db.find({"guild_id": guild})
             try:
                 self.data[guild].clear()
             except KeyError:
@@ -81,7 +88,7 @@ class RoleMenu(commands.Cog):
             except KeyError:
                 self.label.update({guild: {}})
         else:
-            ret = self.db.find({})
+            ret = await self.db.find({})
             self.data.clear()
             self.label.clear()
 
@@ -95,7 +102,7 @@ class RoleMenu(commands.Cog):
             try:
                 self.data[i["guild_id"]].update({i["message_id"]: RoleSelector(self.bot, i)})
             except discord.DiscordException:
-                self.db.delete_many({"guild_id": i["guild_id"]})
+                await self.db.delete_many({"guild_id": i["guild_id"]})
 
     def search(self, guild: int, name: str):
         """
@@ -203,11 +210,11 @@ class RoleMenu(commands.Cog):
             pass
         else:
             return await ctx.reply(f"Role menu with the name **{name}** already exists.")
-        self.db.insert_one(
+        await self.db.insert_one(
             {"guild_id": ctx.guild.id, "name": name, "active": False, "custom": [], "emote": [], "role_id": [],
              "message_id": ctx.message.id, "channel_id": ctx.channel.id, "multi": True}
         )
-        self.update(ctx.guild.id)
+        await self.update(ctx.guild.id)
         await ctx.message.add_reaction(emoji='✅')
 
     @role_menu.command(aliases=['+'])
@@ -259,15 +266,16 @@ class RoleMenu(commands.Cog):
             return await ctx.reply(f"**{name}** role menu does not exists, please create it first with the create "
                                    f"command.")
         mes += f"{hold} >> `{role}` >> **{name}**"
-        data = self.db.find_one({"guild_id": ctx.guild.id, "name": name})
+        await self.bot.writes.flush(self.db.name)
+        data = await self.db.find_one({"guild_id": ctx.guild.id, "name": name})
         data['role_id'].append(role.id)
         data['custom'].append(custom)
         data['emote'].append(str(emote))
-        self.db.update_one({"guild_id": ctx.guild.id, "name": name},
-                           {"$set": {
-                               "custom": data['custom'], "emote": data['emote'], "role_id": data['role_id']
-                           }})
-        self.update(ctx.guild.id)
+        await self.db.update_one({"guild_id": ctx.guild.id, "name": name},
+                                 {"$set": {
+                                     "custom": data['custom'], "emote": data['emote'], "role_id": data['role_id']
+                                 }})
+        await self.update(ctx.guild.id)
         if warn:
             mes += warn
         await message.edit(content=mes)
@@ -280,7 +288,9 @@ class RoleMenu(commands.Cog):
         ret = self.search(ctx.guild.id, name)
         if not isinstance(ret, RoleSelector):
             return await ctx.reply(f"Can not find role menu with the name **{name}**")
-        data = self.db.find_one({"guild_id": ctx.guild.id, "name": name})
+        # toggles are queued within the write-behind, flushed first so they don't land on top of this write
+        await self.bot.writes.flush(self.db.name)
+        data = await self.db.find_one({"guild_id": ctx.guild.id, "name": name})
         if isinstance(target, discord.Role):
             if target not in ret:
                 return await ctx.reply(f"Can not find `{target}` within **{name}**")
@@ -297,10 +307,10 @@ class RoleMenu(commands.Cog):
         act = data['active']
         if len(data['role_id']) < 1:
             act = False
-        self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {
+        await self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {
             "$set": {"custom": data['custom'], "emote": data['emote'], "role_id": data['role_id'], "active": act}
         })
-        self.update(ctx.guild.id)
+        await self.update(ctx.guild.id)
         await ctx.message.add_reaction(emoji='✅')
 
     @role_menu.command(aliases=['r'])
@@ -309,7 +319,8 @@ class RoleMenu(commands.Cog):
         find = self.search(ctx.guild.id, name)
         if not isinstance(find, RoleSelector):
             return await ctx.reply(f"Can not find role menu named **{name}**")
-        data = self.db.find_one({"guild_id": ctx.guild.id, "name": name})
+        await self.bot.writes.flush(self.db.name)
+        data = await self.db.find_one({"guild_id": ctx.guild.id, "name": name})
         if not data:
             return await ctx.message.add_reaction(emoji='❌')
         if len(find.error) > 0:
@@ -318,10 +329,10 @@ class RoleMenu(commands.Cog):
                 data['role_id'].pop(num)
                 data['custom'].pop(num)
                 data['emote'].pop(num)
-            self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {"$set": {
+            await self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {"$set": {
                 "custom": data['custom'], "emote": data['emote'], "role_id": data['role_id']
             }})
-            self.update(ctx.guild.id)
+            await self.update(ctx.guild.id)
             await ctx.message.add_reaction(emoji='✔')
         else:
             await ctx.reply(f"**{name}** contains no errors.")
@@ -350,8 +361,8 @@ class RoleMenu(commands.Cog):
                 await message.clear_reactions()
                 return
             if reaction.emoji == "✅":
-                self.db.delete_one({"guild_id": ctx.guild.id, "name": name})
-                self.update(ctx.guild.id)
+                await self.db.delete_one({"guild_id": ctx.guild.id, "name": name})
+                await self.update(ctx.guild.id)
                 await message.edit(content=f"Role menu - **{name}** has been purged 💥")
             if reaction.emoji == "❌":
                 await message.edit(content=f"Cancelled deletion of role menu: **{name}**")
@@ -380,10 +391,10 @@ class RoleMenu(commands.Cog):
                 return await ctx.reply("The target message is current in use by another role menu, action cancelled")
         except KeyError:
             pass
-        self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {"$set": {
+        await self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {"$set": {
             "message_id": mes.id, "channel_id": chan.id
         }})
-        self.update(ctx.guild.id)
+        await self.update(ctx.guild.id)
         await ctx.message.add_reaction(emoji='✅')
 
     @role_menu.command(aliases=['t'])
@@ -400,7 +411,7 @@ class RoleMenu(commands.Cog):
         else:
             data.active = not data.active
             await ctx.message.add_reaction(emoji='✅')
-        self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {"$set": {
+        await self.bot.writes.queue(self.db.name, {"guild_id": ctx.guild.id, "name": name}, {"$set": {
             "active": data.active
         }})
 
@@ -411,7 +422,7 @@ class RoleMenu(commands.Cog):
         if not isinstance(data, RoleSelector):
             return await ctx.reply(f"Can not find role menu named **{name}**")
         data.multiple = not data.multiple
-        self.db.update_one({"guild_id": ctx.guild.id, "name": name}, {"$set": {
+        await self.bot.writes.queue(self.db.name, {"guild_id": ctx.guild.id, "name": name}, {"$set": {
             "multi": data.multiple
         }})
         await ctx.message.add_reaction(emoji='✌' if data.multiple else '☝')
@@ -0,0 +1,193 @@
+import sys
+import asyncio
+import typing
+import discord
+import traceback
+from Components.AsyncMongo import AsyncCollection
+from Components.PrintColor import PrintColors as Colors
+
+
+def _retry_after(error: typing.Union[discord.HTTPException, discord.RateLimited]):
+    """
+    Function that returns how long Discord asked to wait before retrying.
+
+    Parameters
+    ----------
+    error : typing.Union[discord.HTTPException, discord.RateLimited]
+        the rate limit error
+
+    Returns
+    -------
+    float
+        seconds to wait, none if Discord didn't say
+    """
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    try:
+        return float(error.response.headers["Retry-After"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+class ActionPipeline:
+    """
+    Class that runs Discord API actions in bulk with a bounded amount of them in flight at once. Actions that got rate
+    limited are retried after the wait Discord asked for.
+
+    Attributes
+    ----------
+    limit : int
+        max amount of actions running at the same time
+    retries : int
+        amount of times a rate limited action is retried before giving up
+    _semaphore : asyncio.Semaphore
+        private semaphore bounding the actions in flight, created on first use
+    """
+
+    def __init__(self, limit: int = 5, retries: int = 3):
+        """
+        Constructor for ActionPipeline class.
+
+        Parameters
+        ----------
+        limit : int
+            max amount of actions running at the same time, default is 5
+        retries : int
+            amount of times a rate limited action is retried before giving up, default is 3
+        """
+        self.limit = limit
+        self.retries = retries
+        self._semaphore = None
+
+    async def run(self, action: typing.Callable[..., typing.Awaitable], *args, **kwargs):
+        """
+        Async method that runs one action within the pipeline.
+
+        Parameters
+        ----------
+        action : typing.Callable[..., typing.Awaitable]
+            the async function to call, it's called again on retry
+        args
+            arguments for the action
+        kwargs
+            keyword arguments for the action
+
+        Returns
+        -------
+        whatever the action returned
+
+        Raises
+        ------
+        discord.HTTPException
+            if the action failed or was still rate limited after all the retries
+        discord.RateLimited
+            if the action was still rate limited for too long after all the retries
+        """
+        if not self._semaphore:
+            self._semaphore = asyncio.Semaphore(self.limit)
+
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                try:
+                    return await action(*args, **kwargs)
+                except (discord.HTTPException, discord.RateLimited) as e:
+                    if not (isinstance(e, discord.RateLimited) or e.status == 429) or attempt >= self.retries:
+                        raise
+                    wait = _retry_after(e)
+            # back off outside of the semaphore so other actions can go through once the bucket resets
+            attempt += 1
+            await asyncio.sleep(wait if wait else 2 ** attempt)
+
+    async def run_all(self, calls: typing.Iterable[tuple], label: str = "pipeline",
+                      progress: typing.Callable[[int, int], typing.Awaitable] = None):
+        """
+        Async method that runs the passed in actions concurrently within the pipeline. An exception from one action
+        does not stop the others, it is printed onto console and returned in its place.
+
+        Parameters
+        ----------
+        calls : typing.Iterable[tuple]
+            tuples of (async function, arguments...)
+        label : str
+            name used when printing exceptions onto console
+        progress : typing.Callable[[int, int], typing.Awaitable]
+            async function called with (amount done, total) about every tenth of the way, default is none
+
+        Returns
+        -------
+        list
+            list of the results or exceptions in the same order as the passed in calls
+        """
+        calls = list(calls)
+        total = len(calls)
+        step = max(total // 10, 1)
+        done = 0
+        lock = asyncio.Lock()
+
+        async def tracked(call: tuple):
+            nonlocal done
+            try:
+                return await self.run(*call)
+            finally:
+                done += 1
+                if progress and (done % step == 0 or done == total):
+                    # one report at a time so they arrive in order
+                    async with lock:
+                        try:
+                            await progress(done, total)
+                        except discord.HTTPException:
+                            pass
+
+        ret = await asyncio.gather(*(tracked(i) for i in calls), return_exceptions=True)
+        for i in ret:
+            if isinstance(i, Exception) and not isinstance(i, (discord.NotFound, discord.Forbidden)):
+                print(f"{Colors.WARNING}Ignoring exception in {label}:{Colors.END}", file=sys.stderr)
+                traceback.print_exception(type(i), i, i.__traceback__, file=sys.stderr)
+        return ret
+
+
+async def catch_up(collection: AsyncCollection, late: list, group: str, process):
+    """
+    Async function that processes the overdue documents of a collection one group at a time, then removes the ones
+    processed successfully with a single delete_many. Groups that raised and documents returned as failed stay within
+    MongoDB to be retried on the next load, the ones done are still removed if the catch up gets cancelled midway.
+
+    Parameters
+    ----------
+    collection : AsyncCollection
+        the collection the documents are from
+    late : list
+        the overdue documents
+    group : str
+        field to group the documents by, e.g. "guild_id"
+    process
+        async function taking the group value and the list of its documents, returning the documents that failed
+    """
+    if not late:
+        return
+
+    groups = {}
+    for i in late:
+        try:
+            groups[i[group]].append(i)
+        except KeyError:
+            groups[i[group]] = [i]
+
+    done = []
+    try:
+        for key, documents in groups.items():
+            try:
+                failed = await process(key, documents)
+            except Exception:
+                print(f"{Colors.FAIL}Failed to catch up on {collection.name} for {key}{Colors.END}")
+                traceback.print_exc()
+            else:
+                failed = [i["_id"] for i in failed]
+                if failed:
+                    print(f"{Colors.WARNING}Failed to catch up on {len(failed)} {collection.name} for {key}, "
+                          f"retrying on next load{Colors.END}")
+                done += [i["_id"] for i in documents if i["_id"] not in failed]
+    finally:
+        if done:
+            await collection.delete_many({"_id": {"$in": done}})
@@ -0,0 +1,318 @@
+import asyncio
+import functools
+import traceback
+from pymongo import errors
+from concurrent.futures import ThreadPoolExecutor
+from pymongo.database import Database
+from pymongo.collection import Collection
+from Components.PrintColor import PrintColors as Colors
+
+
+class AsyncCollection:
+    """
+    Class that wraps a pymongo Collection and runs every blocking call inside a thread pool so the event loop never
+    waits on a MongoDB round-trip.
+
+    Attributes
+    ----------
+    name : str
+        name of the wrapped collection
+    collection : Collection
+        the synchronous pymongo collection
+    _executor : ThreadPoolExecutor
+        private thread pool shared by every collection of the same AsyncDatabase
+    """
+
+    def __init__(self, collection: Collection, executor: ThreadPoolExecutor):
+        """
+        Constructor for AsyncCollection class.
+
+        Parameters
+        ----------
+        collection : Collection
+            the pymongo collection to wrap
+        executor : ThreadPoolExecutor
+            the thread pool to run the blocking calls in
+        """
+        self.name = collection.name
+        self.collection = collection
+        self._executor = executor
+
+    async def _run(self, method, *args, **kwargs):
+        """
+        Protected async method that runs the passed in blocking method within the thread pool.
+
+        Parameters
+        ----------
+        method
+            the blocking function to call
+        args
+            positional arguments for the function
+        kwargs
+            keyword arguments for the function
+
+        Returns
+        -------
+        Any
+            whatever the blocking function returned
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+    async def find(self, *args, **kwargs):
+        """
+        Async method that runs find and exhausts the cursor off the event loop.
+
+        Returns
+        -------
+        list
+            list of the matching documents
+        """
+        return await self._run(lambda: list(self.collection.find(*args, **kwargs)))
+
+    async def find_one(self, *args, **kwargs):
+        """
+        Async method that runs find_one off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        dict
+            the first matching document, None if there is none
+        """
+        return await self._run(self.collection.find_one, *args, **kwargs)
+
+    async def insert_one(self, *args, **kwargs):
+        """
+        Async method that runs insert_one off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        InsertOneResult
+            result of the insert
+        """
+        return await self._run(self.collection.insert_one, *args, **kwargs)
+
+    async def insert_many(self, *args, **kwargs):
+        """
+        Async method that runs insert_many off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        InsertManyResult
+            result of the insert
+        """
+        return await self._run(self.collection.insert_many, *args, **kwargs)
+
+    async def update_one(self, *args, **kwargs):
+        """
+        Async method that runs update_one off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        UpdateResult
+            result of the update
+        """
+        return await self._run(self.collection.update_one, *args, **kwargs)
+
+    async def update_many(self, *args, **kwargs):
+        """
+        Async method that runs update_many off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        UpdateResult
+            result of the update
+        """
+        return await self._run(self.collection.update_many, *args, **kwargs)
+
+    async def delete_one(self, *args, **kwargs):
+        """
+        Async method that runs delete_one off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        DeleteResult
+            result of the deletion
+        """
+        return await self._run(self.collection.delete_one, *args, **kwargs)
+
+    async def delete_many(self, *args, **kwargs):
+        """
+        Async method that runs delete_many off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        DeleteResult
+            result of the deletion
+        """
+        return await self._run(self.collection.delete_many, *args, **kwargs)
+
+    async def find_one_and_update(self, *args, **kwargs):
+        """
+        Async method that runs find_one_and_update off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        dict
+            the document before or after the update depending on return_document, None if nothing matched
+        """
+        return await self._run(self.collection.find_one_and_update, *args, **kwargs)
+
+    async def aggregate(self, *args, **kwargs):
+        """
+        Async method that runs aggregate and exhausts the cursor off the event loop.
+
+        Returns
+        -------
+        list
+            list of the resulting documents
+        """
+        return await self._run(lambda: list(self.collection.aggregate(*args, **kwargs)))
+
+    async def count_documents(self, *args, **kwargs):
+        """
+        Async method that runs count_documents off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        int
+            amount of matching documents
+        """
+        return await self._run(self.collection.count_documents, *args, **kwargs)
+
+    async def bulk_write(self, *args, **kwargs):
+        """
+        Async method that runs bulk_write off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        BulkWriteResult
+            result of the bulk write
+        """
+        return await self._run(self.collection.bulk_write, *args, **kwargs)
+
+    async def create_index(self, *args, **kwargs):
+        """
+        Async method that runs create_index off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        str
+            name of the index
+        """
+        return await self._run(self.collection.create_index, *args, **kwargs)
+
+    async def drop_index(self, *args, **kwargs):
+        """
+        Async method that runs drop_index off the event loop, takes the same arguments as pymongo's.
+        """
+        return await self._run(self.collection.drop_index, *args, **kwargs)
+
+    async def index_information(self, *args, **kwargs):
+        """
+        Async method that runs index_information off the event loop, takes the same arguments as pymongo's.
+
+        Returns
+        -------
+        dict
+            dictionary of {index name: index details}
+        """
+        return await self._run(self.collection.index_information, *args, **kwargs)
+
+
+class AsyncDatabase:
+    """
+    Class that hands out AsyncCollection for a pymongo Database. Meant to be the only way Cogs talk to MongoDB.
+
+    Attributes
+    ----------
+    database : Database
+        the synchronous pymongo database
+    executor : ThreadPoolExecutor
+        thread pool where all the database calls are executed
+    _collections : dict
+        private dictionary caching the AsyncCollection by collection name
+    """
+
+    def __init__(self, database: Database, workers: int = 8):
+        """
+        Constructor for AsyncDatabase class.
+
+        Parameters
+        ----------
+        database : Database
+            pymongo database to wrap
+        workers : int
+            max amount of threads for database calls, default is 8
+        """
+        self.database = database
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mongo")
+        self._collections = {}
+
+    def __getitem__(self, name: str):
+        """
+        Method that allows the class to be used like pymongo database through "[]".
+
+        Parameters
+        ----------
+        name : str
+            name of the collection
+
+        Returns
+        -------
+        AsyncCollection
+            the async wrapper of that collection
+        """
+        try:
+            return self._collections[name]
+        except KeyError:
+            ret = AsyncCollection(self.database[name], self.executor)
+            self._collections[name] = ret
+            return ret
+
+    async def ensure_indexes(self, indexes: dict):
+        """
+        Async method that creates the passed in indexes if they don't exist yet. Creating an index that already exists
+        does nothing, so this is safe to call upon every start. An existing index on the same keys but with different
+        options (e.g. not unique yet) is dropped and created again.
+
+        Parameters
+        ----------
+        indexes : dict
+            dictionary of {collection name: list of indexes}, each index being either a list of (field, direction) or
+            a tuple of (list of (field, direction), dictionary of create_index options like unique)
+
+        Returns
+        -------
+        dict
+            dictionary of {collection name: list of the index names now on the collection}, None if it failed
+        """
+        ret = {}
+        for name, keys in indexes.items():
+            collection = self[name]
+            try:
+                for i in keys:
+                    i, options = i if isinstance(i, tuple) else (i, {})
+                    try:
+                        await collection.create_index(i, **options)
+                    except errors.OperationFailure as e:
+                        # 85 IndexOptionsConflict, 86 IndexKeySpecsConflict
+                        if e.code not in (85, 86):
+                            raise
+                        for k, v in (await collection.index_information()).items():
+                            if v["key"] == i:
+                                await collection.drop_index(k)
+                        await collection.create_index(i, **options)
+                ret[name] = list((await collection.index_information()).keys())
+            except errors.PyMongoError:
+                print(f"{Colors.FAIL}Failed to ensure the indexes of {name}{Colors.END}")
+                traceback.print_exc()
+                ret[name] = None
+        return ret
+
+    async def close(self):
+        """
+        Async method that waits for the pending database calls to finish and shuts down the thread pool. The wait
+        happens in another thread so the event loop isn't blocked meanwhile.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(self.executor.shutdown, wait=True))
@@ -0,0 +1,182 @@
+import asyncio
+import datetime
+import discord
+
+
+class AuditCache:
+    """
+    Class that keeps the recent audit log entries of each server by action for a short while, so a burst of events
+    (mass ban, raid cleanup, nickname spam) shares a handful of audit log fetches instead of doing one each. Lookups
+    arriving while a fetch is in flight wait on that same fetch.
+
+    Attributes
+    ----------
+    ttl : float
+        seconds a fetched page of entries is served from memory
+    page : int
+        amount of entries fetched at once, the most Discord returns in a single request
+    slack : float
+        seconds a page may predate a lookup and still answer it with "no entry", so a stream of lookups that mostly
+        find nothing (leaves checked for kicks, nickname changes) shares fetches too
+    _entries : dict
+        private dictionary of {(server ID, action): (loop time the fetch started, list of discord.AuditLogEntry)}
+    _fetching : dict
+        private dictionary of {(server ID, action): (loop time the fetch started, asyncio.Task)} of in-flight fetches
+    """
+
+    ttl = 30
+    page = 100
+    slack = 3
+
+    def __init__(self):
+        """
+        Constructor for AuditCache class.
+        """
+        self._entries = {}
+        self._fetching = {}
+
+    async def find(self, guild: discord.Guild, action: discord.AuditLogAction, target: int, within: float = 60,
+                   expect: bool = False):
+        """
+        Async method that returns the newest audit log entry of the action targeting the specified ID. A cached page
+        that doesn't hold the entry is fetched again once if it's more than slack seconds older than the call, or if
+        it predates the call at all when the entry is expected, as the entry may have been written since.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the server
+        action : discord.AuditLogAction
+            the audit log action to look for
+        target : int
+            ID of the entry's target
+        within : float
+            only entries created within this many seconds are considered, default is 60
+        expect : bool
+            whether or not the entry should exist (the event was a ban or unban), default is False
+
+        Returns
+        -------
+        discord.AuditLogEntry
+            the entry if found
+        None
+            if there is no such entry
+
+        Raises
+        ------
+        discord.Forbidden
+            if the bot can not view the audit log of the server
+        """
+        seen = asyncio.get_running_loop().time()
+        cutoff = discord.utils.utcnow() - datetime.timedelta(seconds=within)
+
+        fresh = seen if expect else seen - self.slack
+        fetched, entries = await self.entries(guild, action)
+        ret = self._match(entries, target, cutoff)
+        if ret or fetched >= fresh:
+            return ret
+
+        fetched, entries = await self.entries(guild, action, fresh)
+        return self._match(entries, target, cutoff)
+
+    @staticmethod
+    def _match(entries: list, target: int, cutoff: datetime.datetime):
+        """
+        Protected static method that returns the first entry targeting the specified ID created after cutoff.
+
+        Parameters
+        ----------
+        entries : list
+            list of discord.AuditLogEntry, newest first
+        target : int
+            ID of the target
+        cutoff : datetime.datetime
+            entries created before this time are ignored
+
+        Returns
+        -------
+        discord.AuditLogEntry
+            the entry if found
+        """
+        for i in entries:
+            if i.created_at < cutoff:
+                break
+            if i.target and i.target.id == target:
+                return i
+
+    async def entries(self, guild: discord.Guild, action: discord.AuditLogAction, fresh: float = None):
+        """
+        Async method that returns the recent entries of the action, from memory if they were fetched within the ttl.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the server
+        action : discord.AuditLogAction
+            the audit log action
+        fresh : float
+            loop time the fetch needs to have started after, default is none meaning any cached page will do
+
+        Returns
+        -------
+        tuple
+            tuple of (loop time the fetch started, list of discord.AuditLogEntry newest first)
+
+        Raises
+        ------
+        discord.Forbidden
+            if the bot can not view the audit log of the server
+        """
+        loop = asyncio.get_running_loop()
+        key = (guild.id, action)
+        while True:
+            try:
+                ret = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                if loop.time() - ret[0] < self.ttl and (fresh is None or ret[0] >= fresh):
+                    return ret
+
+            try:
+                started, task = self._fetching[key]
+            except KeyError:
+                started = loop.time()
+                task = asyncio.create_task(self._fetch(guild, action, started))
+                self._fetching[key] = (started, task)
+
+            # shield so one caller being cancelled doesn't cancel the fetch for everyone else waiting on it
+            ret = await asyncio.shield(task)
+            if fresh is None or started >= fresh:
+                return ret
+            # joined a fetch that started too early, the next loop picks its result up or starts a new one
+
+    async def _fetch(self, guild: discord.Guild, action: discord.AuditLogAction, started: float):
+        """
+        Protected async method that fetches a page of entries and stores them, pruning the expired pages.
+
+        Parameters
+        ----------
+        guild : discord.Guild
+            the server
+        action : discord.AuditLogAction
+            the audit log action
+        started : float
+            loop time the fetch started
+
+        Returns
+        -------
+        tuple
+            tuple of (started, list of discord.AuditLogEntry newest first)
+        """
+        key = (guild.id, action)
+        try:
+            entries = [i async for i in guild.audit_logs(action=action, limit=self.page)]
+        finally:
+            self._fetching.pop(key)
+
+        now = asyncio.get_running_loop().time()
+        for k in [k for k, v in self._entries.items() if now - v[0] >= self.ttl]:
+            self._entries.pop(k)
+        ret = self._entries[key] = (started, entries)
+        return ret
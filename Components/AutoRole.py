@@ -1,6 +1,6 @@
 import discord
-from pymongo import MongoClient
 from discord.ext import commands
+from Components.AsyncMongo import AsyncCollection
 
 
 class AutoRole:
@@ -17,6 +17,8 @@ class AutoRole:
         whether or not join role system is enabled for the server
     roles: list
         list of discord.Role to assign to new incoming members
+    outdated: bool
+        whether or not roles_id got cleaned up during construction and needs to be saved back into mongo
     """
     def __init__(self, bot: commands.Bot, package: dict):
         """
@@ -33,19 +35,19 @@ class AutoRole:
         self.roles_id = package["role_array"]
         self.power = package["switch"]
         self.roles = []
-        if self.change(bot):
-            self.update(bot.mongo["join_auto"])
+        self.outdated = self.change(bot)
 
-    def update(self, client: MongoClient):
+    async def update(self, client: AsyncCollection):
         """
-        Method that accepts a passed in MongoClient and update mongo database with the information within the class
+        Async method that accepts a passed in AsyncCollection and update mongo database with the information within
+        the class
 
         Parameters
         ----------
-        client: MongoClient
-            pass in mongo client linked to "join_auto" to update existing JoinRole data
+        client: AsyncCollection
+            pass in collection linked to "join_auto" to update existing JoinRole data
         """
-        client.update({"_id": self.guild_id}, {"$set": {"role_array": self.roles_id, "switch": self.power}})
+        await client.update_one({"_id": self.guild_id}, {"$set": {"role_array": self.roles_id, "switch": self.power}})
 
     def change(self, bot: commands.Bot):
         """
@@ -44,8 +44,8 @@ class BotData:
         self.bot = bot
         self.owner = bot.app_info.owner.id
         self._db = {
-            "console": bot.mongo["console"],
-            "settings": bot.mongo["bot_settings"]
+            "console": bot.db["console"],
+            "settings": bot.db["bot_settings"]
         }
 
         self._data = {
@@ -56,16 +56,21 @@ class BotData:
             "rsa": (False, False, False, True, 10)
         }
 
+    async def load(self):
+        """
+        Async method that populates the class data from MongoDB and starts the RSA process if it's on. Meant to be
+        called right after the constructor.
+        """
         # status: [custom status, stat, act. type, activity]
         # rsa: [power, status, act. type, activity, timer]
-        for i in self._db["console"].find():
+        for i in await self._db["console"].find():
             self._data['console'][i['_id']] = i['data']
 
         index = 0
         for i in ("status", "rsa", "activities", "staff"):
-            temp = self._db["settings"].find_one({"_id": index})
+            temp = await self._db["settings"].find_one({"_id": index})
             if not temp:
-                self._db["settings"].insert_one({"_id": index, "data": self._data[i]})
+                await self._db["settings"].insert_one({"_id": index, "data": self._data[i]})
             else:
                 self._data[i] = list(temp["data"])
             index += 1
@@ -86,7 +91,7 @@ class BotData:
         """
         return self._data["staff"]
 
-    def add_staff(self, user: int):
+    async def add_staff(self, user: int):
         """
         Method that will attempt to add the specified ID to the administrator list.
 
@@ -106,9 +111,9 @@ class BotData:
             return 'You are the owner...'
 
         self._data["staff"].append(user)
-        self.settings_db_update('staff')
+        await self.settings_db_update('staff')
 
-    def remove_staff(self, user: int):
+    async def remove_staff(self, user: int):
         """
         Method that will attempt remove a specific ID from the administrator list.
 
@@ -129,7 +134,7 @@ class BotData:
         else:
             self._data["staff"].pop(user)
 
-        self.settings_db_update('staff')
+        await self.settings_db_update('staff')
 
     def staff_check(self, data: Union[commands.Context, int]):
         """
@@ -165,7 +170,7 @@ class BotData:
         """
         return item in self._data["console"].keys()
 
-    def modify_console(self, item: Union[discord.TextChannel, discord.User, discord.Member], data: list):
+    async def modify_console(self, item: Union[discord.TextChannel, discord.User, discord.Member], data: list):
         """
         Method to add or modify a text channel or discord user into the console report data
 
@@ -180,11 +185,11 @@ class BotData:
         self._data['console'][item.id] = (isinstance(item, discord.TextChannel), data[0], data[1], data[2])
 
         if result:
-            self._db['console'].update_one({'_id': item.id}, {'$set': {'data': self._data['console'][item.id]}})
+            await self._db['console'].update_one({'_id': item.id}, {'$set': {'data': self._data['console'][item.id]}})
         else:
-            self._db["console"].insert_one({"_id": item.id, 'data': self._data["console"][item.id]})
+            await self._db["console"].insert_one({"_id": item.id, 'data': self._data["console"][item.id]})
 
-    def remove_console(self, item: Union[discord.TextChannel, discord.User, discord.Member, int]):
+    async def remove_console(self, item: Union[discord.TextChannel, discord.User, discord.Member, int]):
         """
         Method to remove a text channel or discord user from the console report data
 
@@ -206,9 +211,9 @@ class BotData:
         else:
             raise ValueError(f"{item} not found within console list")
 
-        self._db["console"].delete_one({"_id": item})
+        await self._db["console"].delete_one({"_id": item})
 
-    def settings_db_update(self, update: str):
+    async def settings_db_update(self, update: str):
         """
         Method to update MongoDB based on provided string to update either status or rsa
 
@@ -222,11 +227,12 @@ class BotData:
             mode = translate.index(update)
         except ValueError:
             return "Unknown parameter"
-        self._db["settings"].update_one({"_id": mode}, {"$set": {"data": self._data[update]}})
+        await self.bot.writes.queue(self._db["settings"].name, {"_id": mode},
+                                    {"$set": {"data": list(self._data[update])}})
         if update == "rsa":
             self.rsa_process.change_interval(seconds=self.rsa[4])
 
-    def add_activity(self, item: str):
+    async def add_activity(self, item: str):
         """
         Method to add activity into the RSA data
 
@@ -236,9 +242,9 @@ class BotData:
             activity to add
         """
         self.activities.append(item)
-        self.settings_db_update('activities')
+        await self.settings_db_update('activities')
 
-    def remove_activity(self, item: str):
+    async def remove_activity(self, item: str):
         """
         Method to remove activity from the RSA data
 
@@ -248,7 +254,7 @@ class BotData:
             activity to remove
         """
         self.activities.remove(item)
-        self.settings_db_update('activities')
+        await self.settings_db_update('activities')
 
     @property
     def activities(self):
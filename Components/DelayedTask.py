@@ -2,7 +2,7 @@ import re
 import asyncio
 import datetime
 from abc import abstractmethod
-from discord.ext import commands
+from Components.Scheduler import Scheduler
 
 
 def time_converter(time: str, start: datetime.datetime):
@@ -83,21 +83,24 @@ def range_calculator(limit: int, size: int, current: int):
 
 class DelayedTask:
     """
-    Class designed to be modified to execute that async task at the specified end time and perform cleanup.
+    Class designed to be modified to execute that async task at the specified end time and perform cleanup. The wait
+    itself is handled by the bot's Scheduler, no task exists until the end time is reached. The timer has no finalizer,
+    it has to be stopped explicitly through cancel or terminate.
 
     Attributes
     ----------
     end : datetime.datetime
         represents the time when the task will execute
-    seconds : float
-        contains how many second until end time from constructor
-    loop : asyncio.get_event_loop()
-        asyncio loop
-    process : method
-        current running process
+    scheduler : Scheduler
+        the scheduler holding the deadline
+    process : Handle
+        scheduler handle of the current process
     """
 
-    def __init__(self, end: datetime.datetime):
+    # child classes should declare __slots__ as well, thousands of these can be held at once
+    __slots__ = ("end", "scheduler", "process")
+
+    def __init__(self, end: datetime.datetime, scheduler: Scheduler):
         """
         Constructor for the DelayedTask class.
 
@@ -105,16 +108,29 @@ class DelayedTask:
         ----------
         end : datetime.datetime
             time for the task to execute
+        scheduler : Scheduler
+            the bot's scheduler
         """
         self.end = end
-        self.seconds = 0.0
-        self.loop = asyncio.get_event_loop()
+        self.scheduler = scheduler
         self.process = None
 
+    @property
+    def seconds(self):
+        """
+        Property that returns how many seconds are left until the end time.
+
+        Returns
+        -------
+        float
+            seconds until end time, negative if it has passed
+        """
+        return (self.end - datetime.datetime.utcnow()).total_seconds()
+
     def begin(self):
         """
         Method of DelayedTask class that meant to be called at the start the child constructor. This method will
-        create a task base on the task method and execute it at the designated time.
+        schedule the task method to be executed at the designated time.
 
         Raises
         ------
@@ -123,18 +139,15 @@ class DelayedTask:
         asyncio.InvalidStateError
             if the task is already running
         """
-        start = datetime.datetime.utcnow()
-        if self.end > start:
-            self.seconds = float((self.end - start).total_seconds())
-        else:
+        if self.end <= datetime.datetime.utcnow():
             raise ValueError("Time has passed...")
         if self.process:
             raise asyncio.InvalidStateError("Process is already running")
-        self.process = self.loop.create_task(self.task())
+        self.process = self.scheduler.schedule(self.end, self.task)
 
     async def terminate(self, ignore: bool = False):
         """
-        Method of DelayedTask class that cancels the current running task if any.
+        Method of DelayedTask class that cancels the current scheduled or running task if any.
 
         Parameters
         ----------
@@ -151,9 +164,17 @@ class DelayedTask:
                 raise asyncio.InvalidStateError("No process is running")
             else:
                 return
-        self.process.cancel()
+        self.cancel()
         await self.on_exit()
-        self.process = None
+
+    def cancel(self):
+        """
+        Method of DelayedTask class that cancels the scheduled or running task without calling on_exit, meant for
+        dropping the timer from memory while leaving its database entry alone.
+        """
+        if self.process:
+            self.scheduler.cancel(self.process)
+            self.process = None
 
     @abstractmethod
     async def task(self):
@@ -168,6 +189,3 @@ class DelayedTask:
         Empty exit method for terminate method. Meant to be implemented and be called from terminate method.
         """
         pass
-
-    def __del__(self):
-        asyncio.get_event_loop().create_task(self.terminate(True))
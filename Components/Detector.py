@@ -1,8 +1,79 @@
 import re
+import bisect
 import typing
 import discord
 import unicodedata
 
+# look-alike characters and leetspeak mapped back to the latin letter they imitate, "|" is left alone for spoiler tags
+confusables = str.maketrans({
+    # leetspeak
+    "0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "8": "b", "@": "a", "$": "s", "€": "e",
+    # cyrillic
+    "а": "a", "в": "b", "е": "e", "ё": "e", "з": "e", "і": "i", "ї": "i", "ј": "j", "к": "k", "м": "m", "н": "h",
+    "о": "o", "р": "p", "с": "c", "ѕ": "s", "т": "t", "у": "y", "х": "x", "ԁ": "d", "ԛ": "q", "ԝ": "w",
+    "А": "a", "В": "b", "Е": "e", "Ё": "e", "І": "i", "Ј": "j", "К": "k", "М": "m", "Н": "h", "О": "o", "Р": "p",
+    "С": "c", "Ѕ": "s", "Т": "t", "У": "y", "Х": "x",
+    # greek
+    "α": "a", "β": "b", "ε": "e", "ι": "i", "κ": "k", "ν": "v", "ο": "o", "ρ": "p", "τ": "t", "υ": "u", "χ": "x",
+    "Α": "a", "Β": "b", "Ε": "e", "Η": "h", "Ι": "i", "Κ": "k", "Μ": "m", "Ν": "n", "Ο": "o", "Ρ": "p", "Τ": "t",
+    "Υ": "y", "Χ": "x", "Ζ": "z",
+})
+# str.translate walks a dictionary for every character, which is slow compared to the rest of the scan, so fold uses
+# a byte table for ascii content and a compiled character class that only calls back on actual look-alikes otherwise
+ascii_confusables = bytes.maketrans(bytes(k for k in confusables.keys() if k < 128),
+                                    bytes(ord(v) for k, v in confusables.items() if k < 128))
+confusable_pattern = re.compile("[" + re.escape("".join(chr(i) for i in confusables.keys())) + "]")
+
+
+def fold(word: str):
+    """
+    Function that maps look-alike characters and leetspeak within the word back to latin letters.
+
+    Parameters
+    ----------
+    word: str
+        the word to fold
+
+    Returns
+    -------
+    str
+        the folded word
+    """
+    if word.isascii():
+        return word.encode().translate(ascii_confusables).decode()
+    return confusable_pattern.sub(lambda x: confusables[ord(x.group())], word)
+
+
+def tokenize(target: str, folding: bool = False):
+    """
+    Function that normalizes the passed in string and splits it into the list of lowercase tokens the scanners match
+    against.
+
+    Parameters
+    ----------
+    target: str
+        the string to tokenize
+    folding: bool
+        whether or not to fold look-alike characters and leetspeak before normalizing
+
+    Returns
+    -------
+    list
+        list of tokens
+    """
+    if folding:
+        target = fold(target)
+    # code from (Jack)Tewi#8723 and Commando950#0251
+    target = target.replace("||", "")
+    temp = str(unicodedata.normalize('NFKD', target).encode('ascii', 'ignore')).lower()
+    # https://stackoverflow.com/questions/4128332/re-findall-additional-criteria
+    # https://stackoverflow.com/questions/14198497/remove-char-at-specific-index-python
+    # https://stackoverflow.com/questions/1798465/python-remove-last-3-characters-of-a-string
+    analyze = re.findall(r"[\w']+", (temp[:0]) + temp[2:])
+    f = len(analyze) - 1
+    analyze[f] = analyze[f][:-1]
+    return analyze
+
 
 class Detector:
     """
@@ -15,7 +86,7 @@ class Detector:
     name: str
         name of the scanner
     words: list
-        list of string of unacceptable words
+        sorted list of string of unacceptable words
     delete: bool
         whether or not scanner should delete the problematic message
     warn: bool
@@ -28,6 +99,12 @@ class Detector:
         list of IDs for the users to ignore
     roles: list
         list of IDs for the role to ignore
+    folding: bool
+        whether or not look-alike characters and leetspeak are folded before scanning
+    _lookup: set
+        private set mirroring words for constant time token lookup
+    _folded: set
+        private set of the folded words, only used when folding is on
     """
 
     def __init__(self, package: dict):
@@ -49,6 +126,9 @@ class Detector:
         self.channels = package["channels"]
         self.users = package["users"]
         self.roles = package["roles"]
+        self.folding = package.get("fold", False)
+        self._lookup = set(self.words)
+        self._folded = {fold(i) for i in self.words} if self.folding else set()
 
     def __contains__(self, target: typing.Union[discord.Member, discord.User, discord.TextChannel, discord.Role,
                                                 str, int]):
@@ -72,9 +152,106 @@ class Detector:
         if isinstance(target, discord.TextChannel):
             return target.id in self.channels
         if isinstance(target, str):
-            return target in self.words
+            return target in self._lookup
         return target in self.users or target in self.channels or target in self.roles
 
+    def add_word(self, word: str):
+        """
+        Method that adds the word into the word list while keeping it sorted and the lookup set up to date.
+
+        Parameters
+        ----------
+        word: str
+            the word to add
+
+        Returns
+        -------
+        bool
+            whether or not the word was added, False if it's already in the list
+        """
+        if word in self._lookup:
+            return False
+        bisect.insort(self.words, word)
+        self._lookup.add(word)
+        if self.folding:
+            self._folded.add(fold(word))
+        return True
+
+    def remove_word(self, word: str):
+        """
+        Method that removes the word from the word list and the lookup set.
+
+        Parameters
+        ----------
+        word: str
+            the word to remove
+
+        Returns
+        -------
+        bool
+            whether or not the word was removed, False if it's not in the list
+        """
+        if word not in self._lookup:
+            return False
+        self.words.remove(word)
+        self._lookup.discard(word)
+        if self.folding:
+            # another word might fold into the same thing
+            self._folded = {fold(i) for i in self.words}
+        return True
+
+    def rebuild(self):
+        """
+        Method that re-sorts the word list and rebuilds the lookup sets, needed after words got modified directly.
+        """
+        self.words.sort()
+        self._lookup = set(self.words)
+        self._folded = {fold(i) for i in self.words} if self.folding else set()
+
+    def set_folding(self, value: bool):
+        """
+        Method that turns look-alike and leetspeak folding on or off.
+
+        Parameters
+        ----------
+        value: bool
+            whether or not to fold
+        """
+        self.folding = value
+        self.rebuild()
+
+    def ignores(self, channel: typing.Optional[int], author: typing.Union[discord.Member, discord.User]):
+        """
+        Method that checks whether or not this scanner should skip content from the passed in channel and author.
+
+        Parameters
+        ----------
+        channel: typing.Optional[int]
+            ID of the channel the content is from if any
+        author: typing.Union[discord.Member, discord.User]
+            member or user associated with the content
+
+        Returns
+        -------
+        bool
+            True if the scanner is inactive or the channel, user or any of the roles are ignored
+        """
+        if not self.active:
+            return True
+
+        if author.id in self.users:
+            return True
+
+        if channel and channel in self.channels:
+            return True
+
+        if isinstance(author, discord.Member):
+            for i in author.roles:
+                if i.id in self.roles:
+                    return True
+
+        return False
+
     def scan(self, target: typing.Union[discord.Message, str], author: typing.Union[discord.Member, discord.User]):
         """
         Method that takes in a string and scans it through the word list and returns list of matching words as result
@@ -91,36 +268,17 @@ class Detector:
         list
             return list of matching words or None
         """
-        if not self.active:
-            return
-
-        if author.id in self.users:
-            return
-
         if isinstance(target, discord.Message):
-            if target.channel.id in self.channels:
+            if self.ignores(target.channel.id, author):
                 return
             target = target.content
-
-        if isinstance(author, discord.Member):
-            for i in author.roles:
-                if i.id in self.roles:
-                    return
+        elif self.ignores(None, author):
+            return
 
         ret = []
-
-        # code from (Jack)Tewi#8723 and Commando950#0251
-        target = target.replace("||", "")
-        temp = str(unicodedata.normalize('NFKD', target).encode('ascii', 'ignore')).lower()
-        # https://stackoverflow.com/questions/4128332/re-findall-additional-criteria
-        # https://stackoverflow.com/questions/14198497/remove-char-at-specific-index-python
-        # https://stackoverflow.com/questions/1798465/python-remove-last-3-characters-of-a-string
-        analyze = re.findall(r"[\w']+", (temp[:0]) + temp[2:])
-        f = len(analyze) - 1
-        analyze[f] = analyze[f][:-1]
-
-        for i in analyze:
-            if i in self.words:
+        lookup = self._folded if self.folding else self._lookup
+        for i in tokenize(target, self.folding):
+            if i in lookup:
                 ret.append(i)
 
         return ret if len(ret) != 0 else None
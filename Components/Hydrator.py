@@ -0,0 +1,110 @@
+import datetime
+import traceback
+from discord.ext import tasks
+from Components.AsyncMongo import AsyncCollection
+from Components.PrintColor import PrintColors as Colors
+
+
+class Hydrator:
+    """
+    Class that keeps only the timed documents (those with an "end" field) due within the horizon loaded in memory. The
+    rest stays within MongoDB and gets paged in by a background sweep as time advances.
+
+    Documents need to be written into MongoDB before checking covers, that way a document is either picked up by the
+    sweep or by the one who wrote it. The load callback is expected to skip the documents it already holds.
+
+    Attributes
+    ----------
+    collection : AsyncCollection
+        the collection holding the timed documents
+    horizon : datetime.timedelta
+        how far ahead of now documents get loaded
+    load
+        async function taking a list of documents to turn into timers
+    query : dict
+        extra filter applied on top of the range on "end"
+    loaded : datetime.datetime
+        every document that ends before this time has been loaded, None before start
+    min_sweep : float
+        class attribute, shortest interval between two sweeps
+    """
+
+    min_sweep = 30
+
+    def __init__(self, collection: AsyncCollection, horizon: float, load, query: dict = None):
+        """
+        Constructor for Hydrator class.
+
+        Parameters
+        ----------
+        collection : AsyncCollection
+            the collection holding the timed documents
+        horizon : float
+            seconds ahead of now to keep loaded, raised to twice min_sweep if shorter so nothing falls due between
+            two sweeps
+        load
+            async function taking a list of documents to turn into timers
+        query : dict
+            extra filter applied on top of the range on "end", default is none
+        """
+        horizon = max(horizon, self.min_sweep * 2)
+        self.collection = collection
+        self.horizon = datetime.timedelta(seconds=horizon)
+        self.load = load
+        self.query = query if query else {}
+        self.loaded = None
+        # sweep well before the loaded documents run out
+        self.sweep.change_interval(seconds=max(horizon / 4, self.min_sweep))
+
+    def covers(self, end: datetime.datetime):
+        """
+        Method that checks whether or not a document ending at the passed in time should already be in memory.
+
+        Parameters
+        ----------
+        end : datetime.datetime
+            end time of the document
+
+        Returns
+        -------
+        bool
+            whether or not the end time falls within what has been loaded
+        """
+        return self.loaded is not None and end <= self.loaded
+
+    async def start(self, query: dict = None):
+        """
+        Async method that loads the documents due within the horizon and starts the sweep.
+
+        Parameters
+        ----------
+        query : dict
+            additional filter for this load only, used to reload a single server
+        """
+        if self.loaded is None or not query:
+            self.loaded = datetime.datetime.utcnow() + self.horizon
+        data = await self.collection.find({**self.query, **(query if query else {}), "end": {"$lte": self.loaded}})
+        await self.load(data)
+        if not self.sweep.is_running():
+            self.sweep.start()
+
+    def stop(self):
+        """
+        Method that stops the sweep.
+        """
+        self.sweep.cancel()
+
+    @tasks.loop(seconds=900)
+    async def sweep(self):
+        """
+        Async task method that pages in the documents that entered the horizon since the last sweep.
+        """
+        previous, self.loaded = self.loaded, datetime.datetime.utcnow() + self.horizon
+        try:
+            data = await self.collection.find({**self.query, "end": {"$gt": previous, "$lte": self.loaded}})
+            await self.load(data)
+        except Exception:
+            # try the same range again next time
+            self.loaded = previous
+            print(f"{Colors.FAIL}Failed to page in timers from {self.collection.name}{Colors.END}")
+            traceback.print_exc()
@@ -4,6 +4,19 @@ import json
 
 class KeyReader:
 
+    # optional settings and their default value if not in the json
+    optional = {
+        "scan-processes": 0,
+        "scan-threshold": 1000,
+        "deferred-cogs": [],
+        "timer-horizon": 3600
+    }
+    # lowest accepted value of the optional settings that have one, the timers get paged in every 30 seconds at the
+    # fastest so a shorter horizon would let them fall due before being loaded
+    minimum = {
+        "timer-horizon": 60
+    }
+
     def __init__(self, location: str = "./Bot Settings/keys.json"):
         self._data = {
             "token": "",
@@ -28,6 +41,14 @@ class KeyReader:
             if verified[i] == "":
                 sys.exit(f"{location} error: {i} can not be empty.")
 
+        for k, v in self.optional.items():
+            if not isinstance(verified.setdefault(k, v), type(v)):
+                sys.exit(f"{location} error: {k} needs to be a {type(v).__name__}.")
+            if isinstance(v, int) and verified[k] < 0:
+                sys.exit(f"{location} error: {k} can not be negative.")
+            if k in self.minimum and verified[k] < self.minimum[k]:
+                sys.exit(f"{location} error: {k} needs to be at least {self.minimum[k]}.")
+
         self.location = location
         self._data = verified
 
@@ -46,3 +67,19 @@ class KeyReader:
     @property
     def cluster(self):
         return self._data["DB-cluster"]
+
+    @property
+    def scan_processes(self):
+        return self._data["scan-processes"]
+
+    @property
+    def scan_threshold(self):
+        return self._data["scan-threshold"]
+
+    @property
+    def deferred_cogs(self):
+        return self._data["deferred-cogs"]
+
+    @property
+    def timer_horizon(self):
+        return self._data["timer-horizon"]
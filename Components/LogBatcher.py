@@ -0,0 +1,217 @@
+import asyncio
+import discord
+import collections
+from Components.ActionPipeline import ActionPipeline
+from Components.PrintColor import PrintColors as Colors
+
+
+class LogBatcher:
+    """
+    Class that coalesces the embeds heading to the same log channel, waiting a short window so a burst of events goes
+    out as messages of up to 10 embeds instead of one message each. Senders wait for room when a channel's queue is
+    full and the embed is dropped if none frees up in time.
+
+    Attributes
+    ----------
+    actions : ActionPipeline
+        pipeline the messages are sent through
+    window : float
+        seconds to wait for more embeds before sending a channel's first batch
+    capacity : int
+        max amount of embeds waiting per channel
+    patience : float
+        seconds a sender waits for room within a full queue before the embed is dropped
+    sent : int
+        amount of messages sent
+    merged : int
+        amount of embeds that shared a message with an earlier one
+    dropped : int
+        amount of embeds dropped due to a full queue or an unusable channel
+    _queues : dict
+        private dictionary of {channel ID: deque of discord.Embed}
+    _workers : dict
+        private dictionary of {channel ID: asyncio.Task} of the channels being drained
+    _flushed : dict
+        private dictionary of {channel ID: asyncio.Event} pulsed each time a batch leaves the queue
+    _closing : asyncio.Event
+        private event set upon close, the channel workers stop waiting for more embeds once it is
+    """
+
+    max_embeds = 10
+    max_characters = 6000
+
+    def __init__(self, actions: ActionPipeline, window: float = 2, capacity: int = 100, patience: float = 10):
+        """
+        Constructor for LogBatcher class.
+
+        Parameters
+        ----------
+        actions : ActionPipeline
+            pipeline the messages are sent through
+        window : float
+            seconds to wait for more embeds before sending a channel's first batch, default is 2
+        capacity : int
+            max amount of embeds waiting per channel, default is 100
+        patience : float
+            seconds a sender waits for room within a full queue before the embed is dropped, default is 10
+        """
+        self.actions = actions
+        self.window = window
+        self.capacity = capacity
+        self.patience = patience
+        self.sent = 0
+        self.merged = 0
+        self.dropped = 0
+        self._queues = {}
+        self._workers = {}
+        self._flushed = {}
+        self._closing = asyncio.Event()
+
+    def __len__(self):
+        """
+        Method that returns the amount of embeds waiting to be sent.
+
+        Returns
+        -------
+        int
+            amount of queued embeds across all channels
+        """
+        return sum(len(i) for i in self._queues.values())
+
+    async def send(self, channel: discord.abc.Messageable, embed: discord.Embed):
+        """
+        Async method that queues the embed for the channel, waiting for room if the channel is backed up.
+
+        Parameters
+        ----------
+        channel : discord.abc.Messageable
+            the log channel
+        embed : discord.Embed
+            the embed to send
+
+        Returns
+        -------
+        bool
+            whether or not the embed got queued, False if it was dropped
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.patience
+        while True:
+            # looked up again after each wait as the worker may have retired the queue in the meantime
+            try:
+                queue = self._queues[channel.id]
+            except KeyError:
+                queue = self._queues[channel.id] = collections.deque()
+                self._flushed[channel.id] = asyncio.Event()
+            if len(queue) < self.capacity:
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self.dropped += 1
+                return False
+            try:
+                await asyncio.wait_for(self._flushed[channel.id].wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+        queue.append(embed)
+        if channel.id not in self._workers:
+            self._workers[channel.id] = asyncio.create_task(self._drain(channel, queue))
+        return True
+
+    def _batch(self, queue: collections.deque):
+        """
+        Protected method that takes as many embeds from the front of the queue as a single message can hold.
+
+        Parameters
+        ----------
+        queue : collections.deque
+            the channel's queue
+
+        Returns
+        -------
+        list
+            list of discord.Embed, never empty as long as the queue isn't
+        """
+        ret = [queue.popleft()]
+        size = len(ret[0])
+        while queue and len(ret) < self.max_embeds and size + len(queue[0]) <= self.max_characters:
+            size += len(queue[0])
+            ret.append(queue.popleft())
+        return ret
+
+    async def _drain(self, channel: discord.abc.Messageable, queue: collections.deque):
+        """
+        Protected async method that sends out the channel's queue in batches until it stays empty for a window.
+
+        Parameters
+        ----------
+        channel : discord.abc.Messageable
+            the log channel
+        queue : collections.deque
+            the channel's queue
+        """
+        flushed = self._flushed[channel.id]
+        try:
+            while queue:
+                try:
+                    await asyncio.wait_for(self._closing.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+                while queue:
+                    batch = self._batch(queue)
+                    # wake up the senders waiting on room
+                    flushed.set()
+                    flushed.clear()
+                    try:
+                        await self.actions.run(channel.send, embeds=batch)
+                    except (discord.NotFound, discord.Forbidden):
+                        self.dropped += len(batch) + len(queue)
+                        print(f"{Colors.WARNING}Dropped {len(batch) + len(queue)} log embeds for unusable channel "
+                              f"{channel.id}{Colors.END}")
+                        queue.clear()
+                        return
+                    except (discord.HTTPException, discord.RateLimited) as e:
+                        self.dropped += len(batch)
+                        print(f"{Colors.WARNING}Dropped {len(batch)} log embeds for channel {channel.id}: "
+                              f"{e}{Colors.END}")
+                        continue
+                    self.sent += 1
+                    self.merged += len(batch) - 1
+        finally:
+            self._workers.pop(channel.id)
+            if not queue:
+                self._queues.pop(channel.id)
+                self._flushed.pop(channel.id).set()
+
+    def report(self):
+        """
+        Method that returns a short summary of the batcher's counters.
+
+        Returns
+        -------
+        str
+            the summary
+        """
+        return f"{self.sent} messages sent, {self.merged} embeds merged, {self.dropped} dropped, {len(self)} waiting"
+
+    async def close(self, timeout: float = 10):
+        """
+        Async method that sends out the embeds still waiting right away, then cancels the channel workers still going
+        after the timeout, discarding their embeds.
+
+        Parameters
+        ----------
+        timeout : float
+            seconds to wait for the channels to be flushed, default is 10
+        """
+        self._closing.set()
+        workers = list(self._workers.values())
+        if not workers:
+            return
+        done, pending = await asyncio.wait(workers, timeout=timeout)
+        for i in pending:
+            i.cancel()
+        if pending:
+            print(f"{Colors.WARNING}Discarded the log embeds of {len(pending)} channels not flushed in "
+                  f"time{Colors.END}")
@@ -1,6 +1,7 @@
 import os
 import sys
 import discord
+import time
 import asyncio
 import datetime
 import platform
@@ -8,12 +9,27 @@ import traceback
 from discord.ext import commands
 from pymongo import errors, MongoClient
 from Components.BotData import BotData
+from Components.AsyncMongo import AsyncDatabase
+from Components.Scheduler import Scheduler
+from Components.ActionPipeline import ActionPipeline
+from Components.LogBatcher import LogBatcher
+from Components.AuditCache import AuditCache
+from Components.WriteBehind import WriteBehind
 from Components.KeyReader import KeyReader
 from Components.HelpMenu import CustomHelpCommand
 from Components.PrintColor import PrintColors as Colors
 from Components.MessageTools import embed_message, split_string
 
 
+# indexes ensured on start, the lookups go by user within a server and the hydrator scans ranges of "end", the warns
+# index is ensured by the Warn Cog as it has to merge duplicate documents before the index can be unique
+collection_indexes = {
+    "mute_time": [[("guild_id", 1), ("user_id", 1)], [("end", 1)]],
+    "temp_ban": [[("guild_id", 1), ("user_id", 1)], [("end", 1)]],
+    "reminders": [[("user_id", 1), ("end", 1)], [("end", 1)]],
+}
+
+
 def offline(ctx: commands.Context, ignore_dm: bool = False):
     """
     A function that checks if DM is ignored. This is only used when Ignore Cog is offline.
@@ -90,13 +106,41 @@ class MangoPi(commands.Bot):
     _separator : str
         separator string
     mongo : MongoClient
-        the connection to bot's MongoDB via MongoClient
+        the connection to bot's MongoDB via MongoClient, blocking and should not be used within Cogs
+    db : AsyncDatabase
+        non-blocking access to bot's MongoDB that Cogs should use
+    writes : WriteBehind
+        queue for MongoDB updates that don't need to be written right away
+    scheduler : Scheduler
+        single heap holding the deadlines of every mute, temporary ban and reminder
+    actions : ActionPipeline
+        shared rate limit aware worker for bulk Discord API actions
+    log_batcher : LogBatcher
+        coalesces the embeds sent to log channels into messages of up to 10 embeds
+    audit : AuditCache
+        short lived cache of audit log entries shared by the Cogs looking up who did what
+    index_report : dict
+        dictionary of {collection name: list of index names} from ensuring the indexes on start, None if it failed
     default_prefix : str
         string of bot's default prefix
+    scan_processes : int
+        amount of processes Scanner can use for tokenizing long messages, 0 to scan everything on the event loop
+    scan_threshold : int
+        message length above which Scanner tokenizes within the process pool
+    timer_horizon : int
+        seconds ahead of now that mutes, temporary bans and reminders are kept in memory
     loaded_cogs : dict
         dictionary of strings that for bot's loaded Cogs
     unloaded_cogs : dict
         dictionary of strings for unloaded Cogs
+    deferred_cogs : dict
+        dictionary of strings for Cogs that will be loaded upon the first unknown command
+    cog_times : dict
+        dictionary of how many seconds each Cog took to load
+    _defer : list
+        private list of Cog names to defer
+    _deferring : asyncio.Future
+        private future of the ongoing or finished deferred Cogs loading
     app_info : discord.AppInfo
         discord application info fetched from API or none
     data : BotData
@@ -137,10 +181,24 @@ class MangoPi(commands.Bot):
             self.mongo.list_collection_names()
         except errors.ServerSelectionTimeoutError:
             raise ConnectionRefusedError("Can not connect to the specified MongoDB")
+        self.db = AsyncDatabase(self.mongo)
+        self.writes = WriteBehind(self.db)
+        self.scheduler = Scheduler()
+        self.actions = ActionPipeline()
+        self.log_batcher = LogBatcher(self.actions)
+        self.audit = AuditCache()
+        self.index_report = {}
 
         self.default_prefix = data.prefix
+        self.scan_processes = data.scan_processes
+        self.scan_threshold = data.scan_threshold
+        self.timer_horizon = data.timer_horizon
         self.loaded_cogs = {}
         self.unloaded_cogs = {}
+        self.deferred_cogs = {}
+        self.cog_times = {}
+        self._defer = data.deferred_cogs
+        self._deferring = None
 
         intents = discord.Intents(
             guilds=True,
@@ -173,9 +231,9 @@ class MangoPi(commands.Bot):
 
         self.run(data.bot_token)
 
-    async def _load_all_cogs(self, location: str = './Cogs', note: str = 'Cogs'):
+    def _find_cogs(self, location: str = './Cogs', note: str = 'Cogs'):
         """
-        A protected method that attempt to load cogs within the specified directory.
+        A protected method that scans the specified directory and its sub-directories for potential Cogs.
 
         Parameters
         ----------
@@ -183,31 +241,91 @@ class MangoPi(commands.Bot):
             the directory to scan
         note : str
             String necessary for loading cog according to location
+
+        Returns
+        -------
+        dict
+            dictionary of {Cog name: extension path}
         """
-        # load all the Cogs inside that directory
+        ret = {}
         for root, dirs, files in os.walk(location):
-            # Scan sub-directories for potential Cogs
-            for i in dirs:
-                if not i.startswith('__'):
-                    new_location = f"{location}/{i}"
-                    new_note = f"{note}.{i}"
-                    await self._load_all_cogs(new_location, new_note)
-
-            for i in files:
-                if i.endswith(".py") and not i.startswith("!") and i.replace(".py", "") not in self.loaded_cogs.keys():
-                    element = i.replace('.py', '')
-                    temp = f"{note}.{element}"
-
-                    try:
-                        await self.load_extension(temp)
-                        self.loaded_cogs[element] = temp
-                    except commands.NoEntryPointError:
-                        print(f"{Colors.FAIL}failed to load, missing setup function{Colors.FAIL}")
-                    except Exception:
-                        self.unloaded_cogs[element] = temp
-                        print(f"{Colors.FAIL}{location}/{i} Cog has failed to load with error:{Colors.END}")
-                        traceback.print_exc()
-                        # traceback.format_exc()
+            # don't walk into __pycache__ and the likes
+            dirs[:] = [i for i in dirs if not i.startswith('__')]
+            relative = os.path.relpath(root, location)
+            prefix = note if relative == "." else f"{note}.{relative.replace(os.sep, '.')}"
+            for i in sorted(files):
+                element = i.replace('.py', '')
+                if i.endswith(".py") and not i.startswith("!") and element not in ret:
+                    ret[element] = f"{prefix}.{element}"
+        return ret
+
+    async def _load_cog(self, element: str, path: str):
+        """
+        A protected method that attempts to load a single Cog and records how long it took.
+
+        Parameters
+        ----------
+        element : str
+            name of the Cog
+        path : str
+            extension path of the Cog
+        """
+        start = time.perf_counter()
+        try:
+            await self.load_extension(path)
+            self.loaded_cogs[element] = path
+        except commands.NoEntryPointError:
+            print(f"{Colors.FAIL}failed to load, missing setup function{Colors.FAIL}")
+        except Exception:
+            self.unloaded_cogs[element] = path
+            print(f"{Colors.FAIL}{path} Cog has failed to load with error:{Colors.END}")
+            traceback.print_exc()
+        self.cog_times[element] = time.perf_counter() - start
+
+    async def _load_all_cogs(self, location: str = './Cogs', note: str = 'Cogs'):
+        """
+        A protected method that attempt to load cogs within the specified directory concurrently. Cogs listed as
+        deferred are only remembered to be loaded on first use.
+
+        Parameters
+        ----------
+        location : str
+            the directory to scan
+        note : str
+            String necessary for loading cog according to location
+        """
+        targets = {}
+        for element, path in self._find_cogs(location, note).items():
+            if element in self.loaded_cogs:
+                continue
+            if element in self._defer:
+                self.deferred_cogs[element] = path
+            else:
+                targets[element] = path
+
+        # Cogs don't depend on each other during setup, each of them only waits on its own database reads
+        await asyncio.gather(*(self._load_cog(k, v) for k, v in targets.items()))
+
+    async def load_deferred(self):
+        """
+        Async method that loads all the deferred Cogs, or waits for the ongoing load if one has been started already.
+
+        Returns
+        -------
+        bool
+            whether or not any Cog got loaded (or waited on) by this call
+        """
+        if not self._deferring:
+            if len(self.deferred_cogs) < 1:
+                return False
+            targets = dict(self.deferred_cogs)
+            self.deferred_cogs.clear()
+            print(f"{self._separator}\nLoading deferred Cogs: {', '.join(targets.keys())}")
+            self._deferring = asyncio.gather(*(self._load_cog(k, v) for k, v in targets.items()))
+        elif self._deferring.done():
+            return False
+        await self._deferring
+        return True
 
     async def on_ready(self):
         """
@@ -215,11 +333,20 @@ class MangoPi(commands.Bot):
         console when the bot is ready and connected to discord.
         """
         if self._first_ready:
+            self.writes.start()
             self.app_info = await self.application_info()
             self.data = BotData(self)
+            await self.data.load()
+            self.index_report = await self.db.ensure_indexes(collection_indexes)
 
             print(f"Attempting to load all Cogs\n{self._separator}")
+            start = time.perf_counter()
             await self._load_all_cogs()
+            total = time.perf_counter() - start
+
+            timing = "".join(f"{k}:\t| \t{v * 1000:.0f} ms\n"
+                             for k, v in sorted(self.cog_times.items(), key=lambda x: x[1], reverse=True))
+            deferred = f"Deferred:\t| \t{', '.join(self.deferred_cogs.keys())}\n" if self.deferred_cogs else ""
 
             print("=========================================================\n"
                   "\t\tSuccessfully logged into Discord\n"
@@ -227,6 +354,9 @@ class MangoPi(commands.Bot):
                   f"Bot:\t| \t{self.user.name}\t({self.user.id})\n"
                   f"Owner:\t| \t{self.app_info.owner}\t({self.app_info.owner.id})\n"
                   "*********************************************************\n"
+                  f"{timing}{deferred}"
+                  f"Cogs loaded in {total * 1000:.0f} ms\n"
+                  "*********************************************************\n"
                   "\t\tInitialization complete, ready to go\n"
                   "=========================================================\n")
 
@@ -272,6 +402,18 @@ class MangoPi(commands.Bot):
         self.last_dc = datetime.datetime.utcnow()
         print(f"{self._separator}\n\tDisconnected from Discord\n{self._separator}")
 
+    async def close(self):
+        """
+        Async method that overrides commands.Bot's close to also send out the queued log embeds while the bot is still
+        connected, then write out the pending database updates and shut down the database thread pool after the bot is
+        disconnected.
+        """
+        await self.log_batcher.close()
+        await super().close()
+        self.scheduler.close()
+        await self.writes.close()
+        await self.db.close()
+
     async def on_error(self, event_method: str, *args, **kwargs):
         """
         Async method that overrides commands.Bot's error event handler. This will attempt to convert error into string
@@ -328,6 +470,12 @@ class MangoPi(commands.Bot):
         if isinstance(error, safe):
             return
 
+        if isinstance(error, commands.CommandNotFound) and await self.load_deferred():
+            # command might belong to one of the Cogs that just got loaded
+            ctx = await self.get_context(ctx.message)
+            if ctx.command:
+                return await self.invoke(ctx)
+
         if isinstance(error, (commands.CommandNotFound, commands.BadArgument, commands.errors.MissingRequiredArgument,
                               discord.ext.commands.errors.BadUnionArgument)):
             emote = "😕"
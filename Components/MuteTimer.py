@@ -1,5 +1,4 @@
 import discord
-import asyncio
 import datetime
 from discord.ext import commands
 from Components.DelayedTask import DelayedTask
@@ -22,23 +21,23 @@ async def remove_mute(bot: commands.Bot, guild: int, target: int, reason: str =
     """
     mute = bot.get_cog("Mute")
 
-    def mass_delete():
+    async def mass_delete():
         try:
             mute.timers.pop(guild)
             mute.roles.pop(guild)
         except KeyError:
             pass
-        bot.mongo["mute_time"].delete_many({"guild_id": guild})
-        bot.mongo["mute_role"].delete_many({"_id": guild})
+        await bot.db["mute_time"].delete_many({"guild_id": guild})
+        await bot.db["mute_role"].delete_many({"_id": guild})
 
     server = bot.get_guild(guild)
     if not server:
-        mass_delete()
+        await mass_delete()
     else:
         try:
             role = mute.roles[guild]
         except KeyError:
-            mass_delete()
+            await mass_delete()
         else:
             member = server.get_member(target)
             try:
@@ -53,7 +52,7 @@ async def remove_mute(bot: commands.Bot, guild: int, target: int, reason: str =
                 else:
                     raise ValueError("remove request")
             except ValueError:
-                bot.mongo["mute_time"].delete_one({"guild_id": guild, "user_id": target})
+                await bot.db["mute_time"].delete_one({"guild_id": guild, "user_id": target})
 
 
 class MuteTimer(DelayedTask):
@@ -72,6 +71,8 @@ class MuteTimer(DelayedTask):
         reason for the mute
     """
 
+    __slots__ = ("bot", "guild", "member", "reason")
+
     def __init__(self, bot: commands.Bot, guild_id: int = None, user_id: int = None, end: datetime.datetime = None,
                  reason: str = "", pack: dict = None):
         """
@@ -97,19 +98,18 @@ class MuteTimer(DelayedTask):
             self.guild = pack["guild_id"]
             self.member = pack["user_id"]
             self.reason = pack["reason"]
-            DelayedTask.__init__(self, pack["end"])
+            DelayedTask.__init__(self, pack["end"], bot.scheduler)
         else:
             self.guild = guild_id
             self.member = user_id
             self.reason = reason
-            DelayedTask.__init__(self, end)
+            DelayedTask.__init__(self, end, bot.scheduler)
         self.begin()
 
     async def task(self):
         """
         Async method containing the process to execute (removing mute from the specified user) after reaching said time.
         """
-        await asyncio.sleep(self.seconds)
         await remove_mute(self.bot, self.guild, self.member)
         await self.on_exit()
 
@@ -120,6 +120,6 @@ class MuteTimer(DelayedTask):
         """
         try:
             self.bot.get_cog("Mute").timers[self.guild].pop(self.member)
-            self.bot.mongo["mute_time"].delete_one({"guild_id": self.guild, "user_id": self.member})
+            await self.bot.db["mute_time"].delete_one({"guild_id": self.guild, "user_id": self.member})
         except KeyError:
             pass
@@ -1,7 +1,9 @@
+import time
 import typing
-import asyncio
 import discord
 import datetime
+import functools
+from collections import deque
 from discord.ext import commands
 
 
@@ -41,13 +43,27 @@ class RaidFilter:
     ----------
     bot: commands.Bot
         bot reference
-    in_progress: bool
-        whether or not there is a loop in progress for timeout delay
+    time: datetime.datetime
+        time of the last join during raid mode, none if raid mode won't time out
+    deadline: Handle
+        scheduler handle of the raid mode timeout, none if there isn't one
+    alarms: list
+        raiders waiting to be sent within the next alarm digest
+    alarm_flush: Handle
+        scheduler handle of the next alarm digest, none if there isn't one
+    alarm_window: int
+        seconds raiders are gathered for before the alarm digest is sent
+    alarm_fields: int
+        max amount of fields (of 20 raiders each) in a digest embed, kept low enough for the 6000 character embed limit
     raiders: dict
         dictionary containing potential raider member data
     holding: dict
         dictionary of temporary holding cell for newly joined members, will be release if system is not triggered
         within set intervals
+    joins: deque
+        sliding window of (monotonic join time, member ID) in join order, used to release members from the holding cell
+    release: Handle
+        scheduler handle of the next holding cell release, none if the holding cell has no joins to release
     raid: bool
         whether or not system have detected an raid
     role_id: int
@@ -67,6 +83,10 @@ class RaidFilter:
     role: discord.Role
         the raider role reference for that server
     """
+
+    alarm_window = 5
+    alarm_fields = 8
+
     def __init__(self, bot: commands.Bot, package: dict):
         """
         Constructor for RaidFilter class
@@ -79,10 +99,14 @@ class RaidFilter:
             pass in Mongo data for class value initialization
         """
         self.bot = bot
-        self.in_progress = False
         self.time = None
+        self.deadline = None
+        self.alarms = []
+        self.alarm_flush = None
         self.raiders = {}
         self.holding = {}
+        self.joins = deque()
+        self.release = None
         self.raid = False
         self.role_id = package["role_id"]
         self.switch = package["power"]
@@ -108,31 +132,50 @@ class RaidFilter:
         role: discord.Role
             the new raider role to change the anti-raid system to
         """
-        for i in self.raiders.values():
-            await i.add_roles(role, reason="Updated raider role - add new role")
-            await i.remove_roles(self.role, reason="Updated raider role - remove old one")
+        old = self.role
+
+        async def swap(member: discord.Member):
+            await member.add_roles(role, reason="Updated raider role - add new role")
+            await member.remove_roles(old, reason="Updated raider role - remove old one")
+
+        await self.bot.actions.run_all(((swap, i) for i in self.raiders.values()), "raider role update")
         if self.role != role:
             self.role = role
             self.role_id = role.id
 
     async def alarm(self, raiders: list):
         """
-        Async method that takes passed in list of raider and sends it to the appropriate logging channel
+        Async method that takes passed in list of raider and queues it for the appropriate logging channel. Raiders are
+        gathered for alarm_window seconds and sent as a digest so a raid only costs a handful of messages.
 
         Parameters
         ----------
         raiders: list
             list of raiders for notifying
         """
-        for k in raiders:
+        self.alarms.extend(raiders)
+        if self.alarms and not self.alarm_flush:
+            self.alarm_flush = self.bot.scheduler.schedule(
+                datetime.datetime.utcnow() + datetime.timedelta(seconds=self.alarm_window), self.send_alarm)
+
+    async def send_alarm(self):
+        """
+        Async method called by the scheduler once the alarm window is over, sends the gathered raiders as digest
+        embeds of up to alarm_fields fields with 20 raiders each.
+        """
+        self.alarm_flush = None
+        raiders, self.alarms = self.alarms, []
+        fields = to_mention_list(raiders)
+        pages = (len(fields) - 1) // self.alarm_fields + 1
+        for i in range(0, len(fields), self.alarm_fields):
             embed = discord.Embed(
                 colour=0xe056fd,
-                title="Potential Raider",
-                timestamp=k.joined_at
-            ).set_footer(text="Joined", icon_url=self.server.icon.replace(size=64).url)
-            embed.set_thumbnail(url=k.avatar.url)
-            embed.add_field(name="Mention", value=k.mention)
-            embed.add_field(name="ID", value=k.id)
+                title=f"Potential Raiders [{len(raiders)}]",
+                timestamp=datetime.datetime.utcnow()
+            ).set_footer(text=f"Page {i // self.alarm_fields + 1} / {pages}",
+                         icon_url=self.server.icon.replace(size=64).url)
+            for k in range(i, min(i + self.alarm_fields, len(fields))):
+                embed.add_field(name=f"Joined {k * 20 + 1} - {min(k * 20 + 20, len(raiders))}", value=fields[k])
             await self.notification(embed)
 
     async def timeout_alert(self, manual: bool = False):
@@ -144,7 +187,7 @@ class RaidFilter:
         manual: bool
             whether or not a user specified the raid mode to turn off
         """
-        if not self.in_progress and not self.raid:
+        if not self.raid:
             embed = discord.Embed(
                 colour=0x55efc4,
                 title="Coast is Clear",
@@ -165,16 +208,12 @@ class RaidFilter:
             message to send
         """
         try:
-            data = self.bot.get_cog("Logging").memory[self.guild_id]
-        except ValueError:
-            return
-        except KeyError:
+            data = self.bot.get_cog("Logging").route(self.guild_id, "raid")
+        except AttributeError:
             return
         for i in data:
-            channel = self.bot.get_channel(i.channel)
-            if channel and i.data['raid']:
-                await channel.send(content=message if isinstance(message, str) else None,
-                                   embed=message if isinstance(message, discord.Embed) else None)
+            await i.send(content=message if isinstance(message, str) else None,
+                         embed=message if isinstance(message, discord.Embed) else None)
 
     async def triggered(self, indefinite: bool = False):
         """
@@ -191,42 +230,68 @@ class RaidFilter:
         self.raid = True
         temp = list(self.holding.values())
         self.holding.clear()
-        for i in temp:
-            if self.role not in i.roles:
-                try:
-                    await i.add_roles(self.role, reason="Potential Raider")
-                    self.raiders[i.id] = i
-                except discord.NotFound:
-                    pass
+        self.joins.clear()
+        self.cancel_release()
+        targets = [i for i in temp if self.role not in i.roles]
+        result = await self.bot.actions.run_all(
+            ((functools.partial(i.add_roles, self.role, reason="Potential Raider"),) for i in targets), "raider mark")
+        for i, k in zip(targets, result):
+            if not isinstance(k, Exception):
+                self.raiders[i.id] = i
         await self.alarm(temp)
-        if self.time and not self.in_progress:
-            await self.countdown()
+        if self.time and not self.deadline and self.switch:
+            self.deadline = self.bot.scheduler.schedule(self.time + datetime.timedelta(seconds=self.timeout),
+                                                        self.countdown)
 
     async def countdown(self):
         """
-        Async method that will turn off raid mode automatically if there is no new member
-
-        Raises
-        ------
-        ValueError
-            if there is also a instance of this method running
+        Async method called by the scheduler once the raid mode timeout is reached. New joins only update self.time,
+        so if one came in since the deadline was set, the deadline is pushed back to the new time instead.
         """
-        if not self.switch:
+        self.deadline = None
+        if not self.raid or not self.time:
+            return
+        end = self.time + datetime.timedelta(seconds=self.timeout)
+        if self.switch and end > datetime.datetime.utcnow():
+            self.deadline = self.bot.scheduler.schedule(end, self.countdown)
             return
-        if self.in_progress:
-            raise ValueError("Timer in progress, no need to call another one")
-        self.in_progress = True
-        while self.raid and (self.time + datetime.timedelta(seconds=self.timeout) > datetime.datetime.utcnow()) \
-                and self.switch:
-            await asyncio.sleep(1)
-        manual = False
+        await self.stop_raid(not self.switch)
+
+    async def stop_raid(self, manual: bool = False):
+        """
+        Async method that turns off raid mode and cancels its timeout, sending the all clear if raid mode was on.
+
+        Parameters
+        ----------
+        manual: bool
+            whether or not a user turned off the raid mode, default is no
+        """
+        self.cancel_timeout()
         if not self.raid:
-            manual = True
+            return
         self.time = None
         self.raid = False
-        self.in_progress = False
         await self.timeout_alert(manual)
 
+    def cancel_timeout(self):
+        """
+        Method that cancels the raid mode timeout if any.
+        """
+        if self.deadline:
+            self.bot.scheduler.cancel(self.deadline)
+            self.deadline = None
+
+    def close(self):
+        """
+        Method that cancels everything the RaidFilter has scheduled, called when the RaidFilter is discarded. A pending
+        alarm digest is sent right away instead so the gathered raiders still get reported.
+        """
+        self.cancel_timeout()
+        self.cancel_release()
+        if self.alarm_flush:
+            self.bot.scheduler.cancel(self.alarm_flush)
+            self.alarm_flush = self.bot.scheduler.schedule(datetime.datetime.utcnow(), self.send_alarm)
+
     async def add(self, member: discord.Member, reason: str = "Marked raider"):
         """
         Async method that will attempt to add the passed in member into the raider cell and append the raider role
@@ -296,23 +361,68 @@ class RaidFilter:
                 await member.add_roles(self.role, reason="Marked raider rejoined")
             except discord.HTTPException:
                 pass
+        elif self.raid:
+            self.time = datetime.datetime.utcnow()
+            await self.add(member, "Potential raider")
+            await self.alarm([member])
         else:
+            now = time.monotonic()
+            # release the ones whose interval is up before counting, same as if each had been waited on
+            self.expire(now)
             self.holding[member.id] = member
-            if self.raid:
-                self.holding.pop(member.id)
-                self.time = datetime.datetime.utcnow()
-                await self.add(member, "Potential raider")
-                await self.alarm([member])
+            self.joins.append((now, member.id))
+            if len(self.holding) >= self.count:
+                await self.triggered()
             else:
-                if len(self.holding) >= self.count:
-                    await self.triggered()
-                else:
-                    await asyncio.sleep(self.interval)
-                    if not self.raid:
-                        try:
-                            self.holding.pop(member.id)
-                        except KeyError:
-                            pass
+                self.arm_release()
+
+    def arm_release(self):
+        """
+        Method that schedules the next holding cell release for when the oldest join's interval is up, if there are
+        joins and it isn't scheduled already. Nothing is scheduled while the holding cell has no joins.
+        """
+        if self.release or not self.joins:
+            return
+        delay = max(self.joins[0][0] + self.interval - time.monotonic(), 0)
+        self.release = self.bot.scheduler.schedule(datetime.datetime.utcnow() + datetime.timedelta(seconds=delay),
+                                                   self.release_holding)
+
+    async def release_holding(self):
+        """
+        Async method called by the scheduler once the oldest join's interval is up, releases the expired members and
+        schedules the next release if joins remain.
+        """
+        self.release = None
+        self.expire()
+        self.arm_release()
+
+    def cancel_release(self):
+        """
+        Method that cancels the scheduled holding cell release if any.
+        """
+        if self.release:
+            self.bot.scheduler.cancel(self.release)
+            self.release = None
+
+    def expire(self, now: float = None):
+        """
+        Method that releases the members who joined more than interval seconds ago from the holding cell. Called on
+        each join and by the scheduler when the oldest join's interval is up so the holding cell drains even without
+        new joins.
+
+        Parameters
+        ----------
+        now: float
+            current monotonic time, taken from time.monotonic if not passed in
+        """
+        limit = (now if now else time.monotonic()) - self.interval
+        while self.joins and self.joins[0][0] <= limit:
+            member = self.joins.popleft()[1]
+            if not self.raid:
+                try:
+                    self.holding.pop(member)
+                except KeyError:
+                    pass
 
     def raiders_to_string(self):
         """
@@ -336,9 +446,12 @@ class RaidFilter:
         """
         return to_mention_list(list(self.holding.values()))
 
-    async def ban_all(self, ctx: commands.Context, stop: bool = True):
+    async def ban_all(self, ctx: commands.Context, stop: bool = True,
+                      progress: typing.Callable[[int, int], typing.Awaitable] = None):
         """
-        Async method to ban all members within the raid cell.
+        Async method to ban all members within the raid cell through the bot's action pipeline. Uses Discord's bulk ban
+        endpoint if the installed discord.py supports it and the bot can manage the server, raiders the bulk ban could
+        not go through for are banned one by one. Raiders that failed to be banned stay within the raid cell.
 
         Parameters
         ----------
@@ -346,47 +459,74 @@ class RaidFilter:
             pass in context for process
         stop: bool
             whether or not to turn off the raid mode, default to yes
+        progress: typing.Callable[[int, int], typing.Awaitable]
+            async function called with (amount of raiders done, total) as the bans go through, default is none
 
         Returns
         -------
         list:
             list of banned members after
-        """
-        for i in self.raiders.values():
-            try:
-                await i.ban(reason="Raider ban")
-            except discord.HTTPException:
-                user = ctx.bot.get_user(i.id)
-                await ctx.guild.ban(user, reason="Raider ban")
+        list:
+            list of members that failed to be banned
+        """
+        targets = [discord.Object(id=i) for i in self.raiders.keys()]
+        total = len(targets)
+        banned = set()
+        # bulk ban needs manage server on top of ban members, it's forbidden without it
+        if hasattr(ctx.guild, "bulk_ban") and ctx.guild.me.guild_permissions.manage_guild:
+            # endpoint takes at most 200 users per request
+            size = 200
+            chunks = [targets[i:i + size] for i in range(0, total, size)]
+
+            async def report(done: int, amount: int):
+                await progress(min(done * size, total), total)
+
+            results = await self.bot.actions.run_all(
+                ((functools.partial(ctx.guild.bulk_ban, i, reason="Raider ban"),) for i in chunks), "raider bulk ban",
+                report if progress else None)
+            targets = []
+            for chunk, result in zip(chunks, results):
+                if isinstance(result, Exception):
+                    targets += chunk
+                else:
+                    banned.update(i.id for i in result.banned)
 
-        ret = self.raiders_to_string()
-        self.raiders.clear()
-        self.raid = not stop
-        return ret
+        if targets:
+            results = await self.bot.actions.run_all(
+                ((functools.partial(ctx.guild.ban, i, reason="Raider ban"),) for i in targets), "raider ban", progress)
+            banned.update(i.id for i, result in zip(targets, results) if not isinstance(result, Exception))
 
-    async def kick_all(self, stop: bool = False):
+        ret = to_mention_list([v for k, v in self.raiders.items() if k in banned])
+        for i in banned:
+            self.raiders.pop(i)
+        if stop:
+            await self.stop_raid(True)
+        return ret, self.raiders_to_string()
+
+    async def kick_all(self, stop: bool = False, progress: typing.Callable[[int, int], typing.Awaitable] = None):
         """
-        Async method to kick all members within the raid cell.
+        Async method to kick all members within the raid cell through the bot's action pipeline.
 
         Parameters
         ----------
         stop: bool
             whether or not to stop the raid mode after, default is no
+        progress: typing.Callable[[int, int], typing.Awaitable]
+            async function called with (amount of raiders done, total) as the kicks go through, default is none
 
         Returns
         -------
         list
             list of kicked member after
         """
-        for i in self.raiders.values():
-            try:
-                await i.kick(reason="Raider kick")
-            except discord.HTTPException:
-                pass
+        await self.bot.actions.run_all(
+            ((functools.partial(i.kick, reason="Raider kick"),) for i in self.raiders.values()), "raider kick",
+            progress)
 
         ret = self.raiders_to_string()
         self.raiders.clear()
-        self.raid = not stop
+        if stop:
+            await self.stop_raid(True)
         return ret
 
     def toggle(self):
@@ -415,13 +555,11 @@ class RaidFilter:
         list
             list of freed member from the raid cell
         """
-        self.raid = not stop
-        for i in self.raiders.values():
-            if self.role in i.roles:
-                try:
-                    await i.remove_roles(self.role, reason="Release marked raiders. All clear, not a raid.")
-                except discord.NotFound:
-                    pass
+        if stop:
+            await self.stop_raid(True)
+        await self.bot.actions.run_all(
+            ((functools.partial(i.remove_roles, self.role, reason="Release marked raiders. All clear, not a raid."),)
+             for i in self.raiders.values() if self.role in i.roles), "raider release")
 
         ret = self.raiders_to_string()
         self.raiders.clear()
@@ -1,10 +1,35 @@
-import asyncio
 import discord
 import datetime
 from discord.ext import commands
 from Components.DelayedTask import DelayedTask
 
 
+def remind_embed(details: str, late: bool = False):
+    """
+    Function that creates the reminder embed.
+
+    Parameters
+    ----------
+    details : str
+        reminder details
+    late : bool
+        whether or not the reminder was late, used to append additional info on the embed
+
+    Returns
+    -------
+    discord.Embed
+        the reminder embed
+    """
+    embed = discord.Embed(
+        colour=0xfffa65,
+        title="⏰ Reminder ⏰",
+        description=details
+    )
+    if late:
+        embed.set_footer(text="late reminder due to Cog downtime")
+    return embed
+
+
 async def dm_remind(bot: commands.Bot, user_id: int, details: str, late: bool = False):
     """
     Function that will send reminder to the specified user in embed format.
@@ -24,19 +49,12 @@ async def dm_remind(bot: commands.Bot, user_id: int, details: str, late: bool =
     if not user:
         try:
             bot.get_cog("Reminder").memory.pop(user_id)
-            bot.mongo["reminders"].delete_many({"user_id": user_id})
+            await bot.db["reminders"].delete_many({"user_id": user_id})
         except KeyError:
             pass
         return
-    embed = discord.Embed(
-        colour=0xfffa65,
-        title="⏰ Reminder ⏰",
-        description=details
-    )
-    if late:
-        embed.set_footer(text="late reminder due to Cog downtime")
     try:
-        await user.send(embed=embed)
+        await user.send(embed=remind_embed(details, late))
     except discord.HTTPException or discord.Forbidden:
         pass
 
@@ -56,6 +74,9 @@ class RemindTimer(DelayedTask):
     identity : int
         ID for the reminder (the message ID sent by the user as reminder request)
     """
+
+    __slots__ = ("bot", "details", "user_id", "identity")
+
     def __init__(self, bot: commands.Bot, me: int = None, end: datetime.datetime = None, details: str = None,
                  user: int = None, pack: dict = None):
         """
@@ -82,12 +103,12 @@ class RemindTimer(DelayedTask):
             self.details = pack["details"]
             self.user_id = pack["user_id"]
             self.identity = pack["_id"]
-            DelayedTask.__init__(self, pack["end"])
+            DelayedTask.__init__(self, pack["end"], bot.scheduler)
         else:
             self.details = details
             self.user_id = user
             self.identity = me
-            DelayedTask.__init__(self, end)
+            DelayedTask.__init__(self, end, bot.scheduler)
         self.begin()
 
     async def on_exit(self):
@@ -96,7 +117,7 @@ class RemindTimer(DelayedTask):
         """
         try:
             self.bot.get_cog("Reminder").memory[self.user_id].pop(self.identity)
-            self.bot.mongo["reminders"].delete_one({"_id": self.identity})
+            await self.bot.db["reminders"].delete_one({"_id": self.identity})
         except KeyError:
             pass
 
@@ -104,6 +125,5 @@ class RemindTimer(DelayedTask):
         """
         Method of the task for this class. This will call upon the dm_remind after specified amount of time.
         """
-        await asyncio.sleep(self.seconds)
         await dm_remind(self.bot, self.user_id, self.details)
         await self.on_exit()
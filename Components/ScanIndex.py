@@ -0,0 +1,274 @@
+import typing
+import asyncio
+import hashlib
+import discord
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from Components.Detector import tokenize, fold
+
+
+class ScanIndex:
+    """
+    Class that merges the word lists of all the Detector within a server so a message only needs to be normalized and
+    tokenized once no matter how many scanners the server has.
+
+    Attributes
+    ----------
+    detectors: dict
+        snapshot of the server's Detector by name, so an in-flight scan stays consistent if the Cog reloads
+    words: dict
+        dictionary of {word: list of names of the Detector containing the word}
+    folded: dict
+        same as words but for the Detector with folding on, keyed by the folded word
+    cache_size: int
+        maximum amount of scan results to remember
+    _cache: OrderedDict
+        private LRU of {digest: result of match} keyed by both the digest of the raw content, so repeated spam skips the
+        tokenization, and the digest of its tokens, so spam only differing in case, spacing or punctuation skips the
+        matching. The whole index is thrown away whenever a Detector of the server changes so the cache never outlives
+        the word lists it was built from
+    """
+
+    cache_size = 256
+
+    def __init__(self, detectors: dict):
+        """
+        Constructor for ScanIndex class.
+
+        Parameters
+        ----------
+        detectors: dict
+            dictionary of Detector by name of the server to index
+        """
+        self.detectors = dict(detectors)
+        self.words = {}
+        self.folded = {}
+        self._cache = OrderedDict()
+        for name, detector in detectors.items():
+            target = self.folded if detector.folding else self.words
+            for i in detector.words:
+                if detector.folding:
+                    i = fold(i)
+                try:
+                    if name not in target[i]:
+                        target[i].append(name)
+                except KeyError:
+                    target[i] = [name]
+
+    async def scan(self, target: typing.Union[discord.Message, str], author: typing.Union[discord.Member, discord.User],
+                   pool: ProcessPoolExecutor = None, threshold: int = 0):
+        """
+        Async method that scans the passed in content through every Detector of the server in a single pass, reusing
+        the result if the same content was scanned recently. Each Detector's active state and ignore lists are still
+        respected.
+
+        Parameters
+        ----------
+        target: typing.Union[discord.Message, str]
+            the string or message to be scanned
+        author: typing.Union[discord.Member, discord.User]
+            member or user associated with the passed in target
+        pool: ProcessPoolExecutor
+            process pool content longer than threshold is tokenized in, default is none meaning on the event loop
+        threshold: int
+            content length above which the pool is used, default is 0
+
+        Returns
+        -------
+        dict
+            dictionary of {Detector name: list of matching words} in the same order as the detectors, empty if nothing
+            is found
+        """
+        channel = None
+        if isinstance(target, discord.Message):
+            channel = target.channel.id
+            target = target.content
+
+        eligible = self.eligible(channel, author)
+        if not eligible:
+            return {}
+
+        key = self.digest(target)
+        result = self.cached(key)
+        if result is None:
+            tokens = await self.tokens(target, False, pool, threshold) if self.words else None
+            folded = await self.tokens(target, True, pool, threshold) if self.folded else None
+            # tokens never contain line breaks or null characters so they can safely separate the two lists
+            similar = self.digest("\n".join(tokens or ()) + "\0" + "\n".join(folded or ()), b"tokens")
+            result = self.cached(similar)
+            if result is None:
+                result = self.match(tokens, folded)
+                self.remember(similar, result)
+            self.remember(key, result)
+        return self.select(result, eligible)
+
+    @staticmethod
+    def digest(content: str, kind: bytes = b"content"):
+        """
+        Static method that returns the fixed size cache key of the passed in string, so the cache doesn't hold on to
+        the messages themselves.
+
+        Parameters
+        ----------
+        content: str
+            the string to digest
+        kind: bytes
+            what the string is, keeps the keys of raw content and joined tokens apart, default is b"content"
+
+        Returns
+        -------
+        bytes
+            16 bytes digest
+        """
+        return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16, person=kind).digest()
+
+    @staticmethod
+    async def tokens(target: str, folding: bool = False, pool: ProcessPoolExecutor = None, threshold: int = 0):
+        """
+        Static async method that tokenizes the passed in string, within the process pool if there is one and the
+        string is longer than threshold.
+
+        Parameters
+        ----------
+        target: str
+            the string to tokenize
+        folding: bool
+            whether or not to fold look-alike characters and leetspeak
+        pool: ProcessPoolExecutor
+            process pool to tokenize long strings in, default is none
+        threshold: int
+            string length above which the pool is used, default is 0
+
+        Returns
+        -------
+        list
+            list of tokens
+        """
+        if pool and len(target) > threshold:
+            return await asyncio.get_running_loop().run_in_executor(pool, tokenize, target, folding)
+        return tokenize(target, folding)
+
+    def eligible(self, channel: typing.Optional[int], author: typing.Union[discord.Member, discord.User]):
+        """
+        Method that returns the names of the Detector that should scan content from the passed in channel and author.
+
+        Parameters
+        ----------
+        channel: typing.Optional[int]
+            ID of the channel the content is from if any
+        author: typing.Union[discord.Member, discord.User]
+            member or user associated with the content
+
+        Returns
+        -------
+        set
+            set of Detector names
+        """
+        ret = set()
+        for name, detector in self.detectors.items():
+            if not detector.ignores(channel, author):
+                ret.add(name)
+        return ret
+
+    def match(self, tokens: typing.Optional[list], folded: typing.Optional[list] = None):
+        """
+        Method that looks up already tokenized content against the merged word lists.
+
+        Parameters
+        ----------
+        tokens: typing.Optional[list]
+            list of tokens from the tokenize function, only needed if words isn't empty
+        folded: typing.Optional[list]
+            list of tokens from the tokenize function with folding on, only needed if folded isn't empty
+
+        Returns
+        -------
+        dict
+            dictionary of {Detector name: list of matching words} in the same order as the detectors, empty if nothing
+            is found
+        """
+        hits = {}
+        for content, words in ((tokens, self.words), (folded, self.folded)):
+            if not content:
+                continue
+            for i in content:
+                # most tokens miss, get avoids raising a KeyError for each of them
+                names = words.get(i)
+                if not names:
+                    continue
+                for k in names:
+                    try:
+                        hits[k].append(i)
+                    except KeyError:
+                        hits[k] = [i]
+
+        return {k: hits[k] for k in self.detectors.keys() if k in hits}
+
+    @staticmethod
+    def select(result: dict, eligible: set):
+        """
+        Static method that narrows down the result of match to the eligible Detector.
+
+        Parameters
+        ----------
+        result: dict
+            result from match
+        eligible: set
+            names of the Detector to report hits for
+
+        Returns
+        -------
+        dict
+            the narrowed down result
+        """
+        return {k: v for k, v in result.items() if k in eligible}
+
+    def cached(self, key: bytes):
+        """
+        Method that returns the remembered result of match for the key.
+
+        Parameters
+        ----------
+        key: bytes
+            digest from the digest method
+
+        Returns
+        -------
+        dict
+            the remembered result or None if there is none
+        """
+        ret = self._cache.get(key)
+        if ret is not None:
+            self._cache.move_to_end(key)
+        return ret
+
+    def remember(self, key: bytes, result: dict):
+        """
+        Method that stores the result of match for the key, evicting the least recently used one if full.
+
+        Parameters
+        ----------
+        key: bytes
+            digest from the digest method
+        result: dict
+            result from match
+        """
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, name: str):
+        """
+        Method that returns the Detector of the specified name.
+
+        Parameters
+        ----------
+        name: str
+            name of the Detector
+
+        Returns
+        -------
+        Detector
+            the Detector if found
+        """
+        return self.detectors.get(name)
@@ -0,0 +1,201 @@
+import heapq
+import asyncio
+import datetime
+import itertools
+import traceback
+from Components.PrintColor import PrintColors as Colors
+
+
+class Handle:
+    """
+    Class representing a single callback scheduled within the Scheduler.
+
+    Attributes
+    ----------
+    when : datetime.datetime
+        UTC time of when the callback should run
+    callback
+        the async function to call
+    args : tuple
+        arguments for the callback
+    cancelled : bool
+        whether or not the handle has been cancelled
+    task : asyncio.Task
+        task running the callback once it's due, None before that
+    """
+
+    __slots__ = ("when", "callback", "args", "cancelled", "task")
+
+    def __init__(self, when: datetime.datetime, callback, args: tuple):
+        """
+        Constructor for the Handle class.
+
+        Parameters
+        ----------
+        when : datetime.datetime
+            UTC time of when the callback should run
+        callback
+            the async function to call
+        args : tuple
+            arguments for the callback
+        """
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.task = None
+
+    def cancel(self):
+        """
+        Method that cancels the handle, the callback will be stopped if it's already running.
+        """
+        self.cancelled = True
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+
+class Scheduler:
+    """
+    Class that owns every timed callback of the bot within a single min-heap. Only one timer handle sits on the event
+    loop for the earliest deadline, tasks are only created once a callback is due.
+
+    Attributes
+    ----------
+    max_sleep : float
+        the longest the scheduler sleeps in one go, so wall clock changes are picked up
+    _heap : list
+        private min-heap of (when, sequence, Handle)
+    _counter : itertools.count
+        private counter that keeps the heap ordering stable for identical deadlines
+    _timer : asyncio.TimerHandle
+        private handle of the next wake-up
+    _running : set
+        private set of the tasks running due callbacks
+    _cancelled : int
+        private count of the cancelled handles still within the heap
+    """
+
+    max_sleep = 3600
+
+    def __init__(self):
+        """
+        Constructor for the Scheduler class.
+        """
+        self._heap = []
+        self._counter = itertools.count()
+        self._timer = None
+        self._running = set()
+        self._cancelled = 0
+
+    def __len__(self):
+        """
+        Method that returns the amount of callbacks waiting within the scheduler.
+
+        Returns
+        -------
+        int
+            amount of pending callbacks
+        """
+        return len(self._heap) - self._cancelled
+
+    def schedule(self, when: datetime.datetime, callback, *args):
+        """
+        Method that schedules the async callback to be called at the specified UTC time. Needs to be called from within
+        the running event loop.
+
+        Parameters
+        ----------
+        when : datetime.datetime
+            UTC time of when the callback should run
+        callback
+            the async function to call
+        args
+            arguments for the callback
+
+        Returns
+        -------
+        Handle
+            the handle that can be used to cancel the callback
+        """
+        ret = Handle(when, callback, args)
+        heapq.heappush(self._heap, (when, next(self._counter), ret))
+        if self._heap[0][2] is ret:
+            # new earliest deadline, move the wake-up forward
+            self._arm()
+        return ret
+
+    def cancel(self, handle: Handle):
+        """
+        Method that cancels the passed in handle. The entry is left within the heap and skipped when it surfaces, the
+        heap gets compacted once more than half of it is cancelled.
+
+        Parameters
+        ----------
+        handle : Handle
+            the handle to cancel
+        """
+        if handle.cancelled:
+            return
+        handle.cancel()
+        if handle.task is None:
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) // 2:
+                self._heap = [i for i in self._heap if not i[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _arm(self):
+        """
+        Protected method that (re)sets the single wake-up for the earliest deadline.
+        """
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if not self._heap:
+            return
+        delay = (self._heap[0][0] - datetime.datetime.utcnow()).total_seconds()
+        self._timer = asyncio.get_running_loop().call_later(min(max(delay, 0), self.max_sleep), self._fire)
+
+    def _fire(self):
+        """
+        Protected method called by the event loop on wake-up. Starts every due callback then re-arms.
+        """
+        self._timer = None
+        now = datetime.datetime.utcnow()
+        while self._heap and self._heap[0][0] <= now:
+            handle = heapq.heappop(self._heap)[2]
+            if handle.cancelled:
+                self._cancelled -= 1
+                continue
+            handle.task = asyncio.create_task(self._run(handle))
+            self._running.add(handle.task)
+            handle.task.add_done_callback(self._running.discard)
+        self._arm()
+
+    @staticmethod
+    async def _run(handle: Handle):
+        """
+        Protected static async method that runs the callback of the handle and prints any exception.
+
+        Parameters
+        ----------
+        handle : Handle
+            the due handle
+        """
+        try:
+            await handle.callback(*handle.args)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            print(f"{Colors.FAIL}Scheduled callback {handle.callback} has failed with error:{Colors.END}")
+            traceback.print_exc()
+
+    def close(self):
+        """
+        Method that stops the scheduler wake-up and cancels the running callbacks.
+        """
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        for i in list(self._running):
+            i.cancel()
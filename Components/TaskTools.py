@@ -0,0 +1,47 @@
+import sys
+import asyncio
+import discord
+import traceback
+import typing
+from Components.PrintColor import PrintColors as Colors
+
+
+async def fan_out(*coros: typing.Awaitable, limit: int = 5, label: str = "fan_out"):
+    """
+    Async function that runs the passed in coroutines concurrently with at most limit of them running at once. An
+    exception from one coroutine does not stop the others, it is returned in its place. Messages already gone or
+    missing permissions are expected during raids and are ignored, other Discord errors get a single line on console
+    and anything else has its traceback printed.
+
+    Parameters
+    ----------
+    coros: typing.Awaitable
+        the coroutines to run, None are skipped so optional actions can be passed in directly
+    limit: int
+        max amount of coroutines running at the same time, default is 5
+    label: str
+        name used when printing exceptions onto console
+
+    Returns
+    -------
+    list
+        list of the results or exceptions in the same order as the passed in coroutines
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: typing.Awaitable):
+        if coro is None:
+            return
+        async with semaphore:
+            return await coro
+
+    ret = await asyncio.gather(*(run(i) for i in coros), return_exceptions=True)
+    for i in ret:
+        if not isinstance(i, Exception) or isinstance(i, (discord.NotFound, discord.Forbidden)):
+            continue
+        if isinstance(i, discord.HTTPException):
+            print(f"{Colors.WARNING}Ignoring {type(i).__name__} in {label}: {i}{Colors.END}", file=sys.stderr)
+        else:
+            print(f"{Colors.WARNING}Ignoring exception in {label}:{Colors.END}", file=sys.stderr)
+            traceback.print_exception(type(i), i, i.__traceback__, file=sys.stderr)
+    return ret
@@ -1,4 +1,3 @@
-import asyncio
 import discord
 import datetime
 from discord.ext import commands
@@ -26,7 +25,7 @@ async def ban_over(bot: commands.Bot, guild_id: int, user_id: int, reason: str,
     guild = bot.get_guild(guild_id)
     if not guild:
         try:
-            bot.mongo["temp_ban"].delete_many({"guild_id": guild_id})
+            await bot.db["temp_ban"].delete_many({"guild_id": guild_id})
             bot.get_cog("Removal").temp_bans.pop(guild_id)
         except KeyError:
             pass
@@ -37,7 +36,7 @@ async def ban_over(bot: commands.Bot, guild_id: int, user_id: int, reason: str,
             user = await bot.fetch_user(user_id)
         except discord.NotFound:
             try:
-                bot.mongo["temp_ban"].delete_one({"guild_id": guild_id, "user_id": user_id})
+                await bot.db["temp_ban"].delete_one({"guild_id": guild_id, "user_id": user_id})
                 bot.get_cog("Removal").temp_bans[guild_id].pop(user_id)
             except KeyError:
                 pass
@@ -65,6 +64,8 @@ class TemporaryBan(DelayedTask):
         ID of the temporary ban (command invoke message based)
     """
 
+    __slots__ = ("bot", "reason", "user_id", "guild_id", "identity")
+
     def __init__(self, bot: commands.Bot, me: int = None, guild_id: int = None, user_id: int = None,
                  end: datetime.datetime = None, reason: str = "", pack: dict = None):
         """
@@ -93,13 +94,13 @@ class TemporaryBan(DelayedTask):
             self.user_id = pack["user_id"]
             self.guild_id = pack["guild_id"]
             self.identity = pack["_id"]
-            DelayedTask.__init__(self, pack["end"])
+            DelayedTask.__init__(self, pack["end"], bot.scheduler)
         else:
             self.reason = reason
             self.user_id = user_id
             self.identity = me
             self.guild_id = guild_id
-            DelayedTask.__init__(self, end)
+            DelayedTask.__init__(self, end, bot.scheduler)
         self.begin()
 
     async def on_exit(self):
@@ -108,7 +109,7 @@ class TemporaryBan(DelayedTask):
         """
         try:
             self.bot.get_cog("Removal").temp_bans[self.guild_id].pop(self.user_id)
-            self.bot.mongo["temp_ban"].delete_one({"_id": self.identity})
+            await self.bot.db["temp_ban"].delete_one({"_id": self.identity})
         except KeyError:
             pass
 
@@ -116,6 +117,5 @@ class TemporaryBan(DelayedTask):
         """
         Method of the delayed task which will automatically unban the user on the specified time.
         """
-        await asyncio.sleep(self.seconds)
         await ban_over(self.bot, self.guild_id, self.user_id, self.reason)
         await self.on_exit()
@@ -0,0 +1,286 @@
+import asyncio
+import traceback
+from pymongo import UpdateOne, errors
+from discord.ext import tasks
+from Components.AsyncMongo import AsyncDatabase
+from Components.PrintColor import PrintColors as Colors
+
+# operators where a later value simply replaces the earlier one
+_replace = ("$set", "$unset", "$max", "$min")
+
+
+def _document_key(query: dict):
+    """
+    Function that turns a filter dictionary into a hashable key identifying the targeted document.
+
+    Parameters
+    ----------
+    query : dict
+        the update filter
+
+    Returns
+    -------
+    tuple
+        sorted tuple of the filter items
+    """
+    return tuple(sorted(query.items(), key=lambda x: x[0]))
+
+
+def _merge(pending: dict, update: dict):
+    """
+    Function that attempts to fold the passed in update into the pending update of the same document.
+
+    Parameters
+    ----------
+    pending : dict
+        the update document waiting to be written, will be modified if merge is possible
+    update : dict
+        the new update document
+
+    Returns
+    -------
+    bool
+        whether or not the merge was successful, pending is left untouched if it wasn't
+    """
+    touched = {}
+    for op, fields in pending.items():
+        for k in fields.keys():
+            touched[k] = op
+
+    for op, fields in update.items():
+        for k in fields.keys():
+            try:
+                existing = touched[k]
+            except KeyError:
+                continue
+            if existing != op:
+                return False
+            if op not in _replace and op != "$inc":
+                # $push, $pull, $addToSet and so on are order sensitive, write them one by one
+                return False
+
+    for op, fields in update.items():
+        target = pending.setdefault(op, {})
+        for k, v in fields.items():
+            if op == "$inc" and k in target:
+                target[k] += v
+            else:
+                target[k] = v
+    return True
+
+
+class WriteBehind:
+    """
+    Class that holds MongoDB update operations in memory, coalesce the ones targeting the same document and write them
+    in bulk_write batches either periodically or once enough of them piled up.
+
+    Attributes
+    ----------
+    db : AsyncDatabase
+        the async database to write into
+    limit : int
+        amount of pending operations that triggers an immediate flush
+    _pending : dict
+        private dictionary of {collection name: {document key: [filter, [update, ...], upsert]}}
+    _count : int
+        private count of the pending operations
+    _lock : asyncio.Lock
+        private lock making sure only one flush happens at a time
+    """
+
+    def __init__(self, db: AsyncDatabase, interval: float = 5, limit: int = 100):
+        """
+        Constructor for WriteBehind class.
+
+        Parameters
+        ----------
+        db : AsyncDatabase
+            the async database to write into
+        interval : float
+            seconds between each timed flush, default is 5
+        limit : int
+            amount of pending operations that triggers an immediate flush, default is 100
+        """
+        self.db = db
+        self.limit = limit
+        self._pending = {}
+        self._count = 0
+        self._lock = asyncio.Lock()
+        self.flush_process.change_interval(seconds=interval)
+
+    def __len__(self):
+        """
+        Method that returns the amount of pending operations.
+
+        Returns
+        -------
+        int
+            amount of update operations waiting to be written
+        """
+        return self._count
+
+    def _add(self, collection: str, query: dict, update: dict, upsert: bool):
+        """
+        Protected method that inserts the operation into the pending dictionary, merging it when possible.
+
+        Parameters
+        ----------
+        collection : str
+            name of the target collection
+        query : dict
+            the update filter
+        update : dict
+            the update document
+        upsert : bool
+            whether or not to insert the document if it doesn't exist
+        """
+        documents = self._pending.setdefault(collection, {})
+        key = _document_key(query)
+        try:
+            entry = documents[key]
+        except KeyError:
+            documents[key] = [query, [update], upsert]
+            self._count += 1
+            return
+
+        entry[2] = entry[2] or upsert
+        if not _merge(entry[1][-1], update):
+            entry[1].append(update)
+            self._count += 1
+
+    async def queue(self, collection: str, query: dict, update: dict, upsert: bool = False):
+        """
+        Async method that schedules an update_one to be written later on. Flushes right away if the amount of pending
+        operations reaches the limit.
+
+        Parameters
+        ----------
+        collection : str
+            name of the target collection
+        query : dict
+            the update filter, values need to be hashable
+        update : dict
+            the update document, only operator style updates are supported
+        upsert : bool
+            whether or not to insert the document if it doesn't exist
+        """
+        # copy the update so caller's later changes don't leak into the pending write
+        self._add(collection, dict(query), {k: dict(v) for k, v in update.items()}, upsert)
+        if self._count >= self.limit:
+            await self.flush()
+
+    async def flush(self, collection: str = None):
+        """
+        Async method that writes the pending operations into MongoDB, one bulk_write per collection. Operations of a
+        batch that failed due to connection loss are put back in front of the queue if they are safe to apply twice,
+        the rest are dropped and reported as they may have already been applied.
+
+        Parameters
+        ----------
+        collection : str
+            only flush the operations of this collection if specified, meant to be called before reloading from it
+        """
+        async with self._lock:
+            if collection:
+                try:
+                    batch = {collection: self._pending.pop(collection)}
+                except KeyError:
+                    return
+                self._count -= sum(len(i[1]) for i in batch[collection].values())
+            else:
+                if self._count == 0:
+                    return
+                batch, self._pending, self._count = self._pending, {}, 0
+
+            for name, documents in batch.items():
+                operations = []
+                ordered = False
+                for query, updates, upsert in documents.values():
+                    ordered = ordered or len(updates) > 1
+                    for k in updates:
+                        operations.append(UpdateOne(query, k, upsert=upsert))
+                try:
+                    await self.db[name].bulk_write(operations, ordered=ordered)
+                except errors.ConnectionFailure:
+                    # part of the batch may have been applied before the connection dropped, so only the updates
+                    # that can safely be applied twice are retried on the next flush
+                    dropped = self._idempotent(documents)
+                    print(f"{Colors.WARNING}Lost connection while writing into {name}, "
+                          f"{len(operations) - dropped} operation(s) re-queued{Colors.END}")
+                    if dropped:
+                        print(f"{Colors.FAIL}Dropped {dropped} non-idempotent operation(s) for {name}, they may or may "
+                              f"not have been applied{Colors.END}")
+                    self._restore(name, documents)
+                except errors.PyMongoError:
+                    # server rejected part of the batch, retrying would re-apply the accepted ones
+                    print(f"{Colors.FAIL}Failed to write pending operation(s) into {name}{Colors.END}")
+                    traceback.print_exc()
+
+    @staticmethod
+    def _idempotent(documents: dict):
+        """
+        Protected static method that strips the updates using anything other than the replacing operators ($set,
+        $unset, $max, $min) from the failed batch, as those would be applied twice if they made it through.
+
+        Parameters
+        ----------
+        documents : dict
+            the failed batch, modified in place
+
+        Returns
+        -------
+        int
+            amount of updates removed
+        """
+        ret = 0
+        for key in list(documents.keys()):
+            entry = documents[key]
+            kept = [i for i in entry[1] if all(op in _replace for op in i.keys())]
+            ret += len(entry[1]) - len(kept)
+            if kept:
+                entry[1] = kept
+            else:
+                documents.pop(key)
+        return ret
+
+    def _restore(self, collection: str, documents: dict):
+        """
+        Protected method that puts the failed batch back before whatever got queued during the flush.
+
+        Parameters
+        ----------
+        collection : str
+            name of the collection the batch was for
+        documents : dict
+            the failed batch
+        """
+        newer = self._pending.get(collection, {})
+        for key, entry in newer.items():
+            try:
+                documents[key][1].extend(entry[1])
+                documents[key][2] = documents[key][2] or entry[2]
+            except KeyError:
+                documents[key] = entry
+        self._pending[collection] = documents
+        self._count = sum(len(i[1]) for k in self._pending.values() for i in k.values())
+
+    def start(self):
+        """
+        Method that starts the timed flush process.
+        """
+        if not self.flush_process.is_running():
+            self.flush_process.start()
+
+    async def close(self):
+        """
+        Async method that stops the timed flush and writes whatever is still pending.
+        """
+        self.flush_process.cancel()
+        await self.flush()
+
+    @tasks.loop(seconds=5)
+    async def flush_process(self):
+        """
+        Async task method that periodically flush the pending operations.
+        """
+        await self.flush()